@@ -0,0 +1 @@
+"""Benchmarks and load simulations for the FreeKiosk integration."""
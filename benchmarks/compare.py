@@ -0,0 +1,82 @@
+"""
+Compare two benchmark result files.
+
+Usage: python -m benchmarks.compare base.json new.json [--threshold 10]
+
+Prints every metric that exists in both files with its relative change and
+exits non-zero when a timing got slower, or a throughput lower, by more than
+the threshold percentage.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+# Metrics where a larger value is an improvement.
+HIGHER_IS_BETTER = ("frames_per_s", "mb_per_s")
+# Metrics that describe the run rather than its performance.
+INFORMATIONAL = ("count", "listeners_per_device", "callbacks_per_round")
+
+
+def flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Return every numeric leaf keyed by its dotted path."""
+    flat: dict[str, float] = {}
+    for key, value in results.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat |= flatten(value, path)
+        elif isinstance(value, int | float) and not isinstance(value, bool):
+            flat[path] = float(value)
+    return flat
+
+
+def compare(
+    base: dict[str, Any], new: dict[str, Any], threshold: float
+) -> tuple[list[str], list[str]]:
+    """Return the report lines and the paths that regressed."""
+    base_flat = flatten(base["results"])
+    new_flat = flatten(new["results"])
+    lines: list[str] = []
+    regressions: list[str] = []
+    for path in sorted(base_flat.keys() & new_flat.keys()):
+        before, after = base_flat[path], new_flat[path]
+        change = (after - before) / before * 100 if before else 0.0
+        marker = ""
+        if not path.endswith(INFORMATIONAL):
+            worse = -change if path.endswith(HIGHER_IS_BETTER) else change
+            if worse > threshold:
+                regressions.append(path)
+                marker = "  <-- regression"
+        lines.append(
+            f"{path:<60} {before:>12.3f} {after:>12.3f} {change:>+8.1f}%{marker}"
+        )
+    return lines, regressions
+
+
+def main() -> None:
+    """Compare the files named on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+
+    base = json.loads(args.base.read_text())
+    new = json.loads(args.new.read_text())
+    lines, regressions = compare(base, new, args.threshold)
+    print(f"base {base['meta'].get('commit')}  new {new['meta'].get('commit')}")
+    print(f"{'metric':<60} {'base':>12} {'new':>12} {'change':>9}")
+    print("\n".join(lines))
+    if regressions:
+        print(
+            f"\n{len(regressions)} metric(s) regressed by more than {args.threshold}%"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Local fake of the FreeKiosk REST API described in REST_API.md."""
+
+from __future__ import annotations
+
+import copy
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+# Each fake device is served under its own prefix, so one server can stand in
+# for a whole fleet: http://127.0.0.1:<port>/d/<index>/api/status
+DEVICE_PATH = "/d/{device}"
+
+# Narrow GET endpoints and the status section each returns.
+SECTION_ENDPOINTS = {
+    "battery": "battery",
+    "screen": "screen",
+    "sensors": "sensors",
+    "storage": "storage",
+    "memory": "memory",
+    "wifi": "wifi",
+    "info": "device",
+    "autoBrightness": "autoBrightness",
+}
+
+
+def status_template(index: int) -> dict[str, Any]:
+    """Return the /api/status data section from REST_API.md for one device."""
+    return {
+        "battery": {"level": 85, "charging": True, "plugged": "ac"},
+        "screen": {"on": True, "brightness": 75, "screensaverActive": False},
+        "audio": {"volume": 50},
+        "webview": {
+            "currentUrl": "http://dashboard.local/",
+            "canGoBack": False,
+            "loading": False,
+        },
+        "device": {
+            "ip": f"10.0.{index // 250}.{index % 250 + 1}",
+            "hostname": f"freekiosk-{index}",
+            "version": "1.2.3",
+            "isDeviceOwner": False,
+            "kioskMode": True,
+        },
+        "wifi": {
+            "connected": True,
+            "ssid": "Home",
+            "signalStrength": -45,
+            "signalLevel": 70,
+            "linkSpeed": 90,
+            "frequency": 5240,
+        },
+        "rotation": {"enabled": False, "urls": [], "interval": 30, "currentIndex": 0},
+        "sensors": {
+            "light": 150.5,
+            "proximity": 5,
+            "accelerometer": {"x": 0.0, "y": 9.81, "z": 0.0},
+        },
+        "autoBrightness": {
+            "enabled": True,
+            "min": 10,
+            "max": 100,
+            "currentLightLevel": 150.5,
+        },
+        "storage": {
+            "totalMB": 32000,
+            "availableMB": 15000,
+            "usedMB": 17000,
+            "usedPercent": 53,
+        },
+        "memory": {
+            "totalMB": 4096,
+            "availableMB": 2048,
+            "usedMB": 2048,
+            "usedPercent": 50,
+            "lowMemory": False,
+        },
+    }
+
+
+def make_png(width: int, height: int) -> bytes:
+    """Return a grey gradient PNG of the given size without needing Pillow."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = bytes(x * 255 // max(width - 1, 1) for x in range(width))
+    pixels = b"".join(b"\x00" + row for _ in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(pixels, 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+@dataclass
+class FakeDevice:
+    """State of one simulated tablet."""
+
+    index: int
+    volatile: bool = False
+    status: dict[str, Any] = field(default_factory=dict)
+    requests: int = 0
+
+    def __post_init__(self) -> None:
+        """Fill in the default status."""
+        if not self.status:
+            self.status = status_template(self.index)
+
+    def read(self) -> dict[str, Any]:
+        """Return the status data, moving the light reading when volatile."""
+        if self.volatile:
+            sensors = self.status["sensors"]
+            sensors["light"] = round(sensors["light"] + 0.5, 1) % 1000
+        return self.status
+
+    def apply_command(self, command: str, body: dict[str, Any]) -> None:
+        """Apply the effect of a POST command to the status."""
+        status = self.status
+        match command:
+            case "screen/on" | "wake":
+                status["screen"]["on"] = True
+                status["screen"]["screensaverActive"] = False
+            case "screen/off":
+                status["screen"]["on"] = False
+            case "screensaver/on":
+                status["screen"]["screensaverActive"] = True
+            case "screensaver/off":
+                status["screen"]["screensaverActive"] = False
+            case "brightness":
+                status["screen"]["brightness"] = body.get("value")
+                status["autoBrightness"]["enabled"] = False
+            case "volume":
+                status["audio"]["volume"] = body.get("value")
+            case "url":
+                status["webview"]["currentUrl"] = body.get("url")
+            case "autoBrightness/enable":
+                status["autoBrightness"].update(
+                    enabled=True, min=body.get("min", 10), max=body.get("max", 100)
+                )
+            case "autoBrightness/disable":
+                status["autoBrightness"]["enabled"] = False
+
+
+class FakeFreeKioskServer:
+    """An aiohttp server that serves many fake FreeKiosk devices."""
+
+    def __init__(
+        self,
+        count: int,
+        *,
+        volatile: bool = False,
+        screenshot_size: tuple[int, int] = (800, 1280),
+    ) -> None:
+        """Create ``count`` devices; ``volatile`` ones change on every read."""
+        self.devices = [FakeDevice(index, volatile=volatile) for index in range(count)]
+        self.screenshot = make_png(*screenshot_size)
+        self.port = 0
+        self._runner: web.AppRunner | None = None
+
+    def base_url(self, index: int) -> str:
+        """Return the URL the integration should use for one device."""
+        return f"http://127.0.0.1:{self.port}/d/{index}"
+
+    @property
+    def base_urls(self) -> list[str]:
+        """Return the URLs of every device."""
+        return [self.base_url(device.index) for device in self.devices]
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start serving on an ephemeral port unless one is given."""
+        # Cancel handlers whose client gave up, e.g. on simulated hangs.
+        self._runner = web.AppRunner(
+            self.create_app(), access_log=None, handler_cancellation=True
+        )
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port, backlog=4096).start()
+        self.port = self._runner.addresses[0][1]
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def create_app(self) -> web.Application:
+        """Return the application with every REST route."""
+        app = web.Application()
+        app.router.add_get(f"{DEVICE_PATH}/api/status", self._async_status)
+        app.router.add_get(f"{DEVICE_PATH}/api/health", self._async_health)
+        app.router.add_get(f"{DEVICE_PATH}/api/screenshot", self._async_screenshot)
+        app.router.add_get(f"{DEVICE_PATH}/api/{{endpoint}}", self._async_section)
+        app.router.add_post(f"{DEVICE_PATH}/api/{{command:.+}}", self._async_command)
+        return app
+
+    async def async_respond(
+        self, device: FakeDevice, request: web.Request
+    ) -> web.StreamResponse | None:
+        """Return a response that replaces the normal one, or ``None``."""
+        del device, request
+        return None
+
+    def _device(self, request: web.Request) -> FakeDevice:
+        """Return the device addressed by the request."""
+        try:
+            device = self.devices[int(request.match_info["device"])]
+        except (ValueError, IndexError) as err:
+            raise web.HTTPNotFound from err
+        device.requests += 1
+        return device
+
+    @staticmethod
+    def _json(data: Any) -> web.Response:
+        """Return a FreeKiosk response envelope."""
+        return web.json_response(
+            {"success": True, "data": data, "timestamp": int(time.time())}
+        )
+
+    async def _async_status(self, request: web.Request) -> web.StreamResponse:
+        device = self._device(request)
+        if (response := await self.async_respond(device, request)) is not None:
+            return response
+        return self._json(device.read())
+
+    async def _async_health(self, request: web.Request) -> web.StreamResponse:
+        device = self._device(request)
+        if (response := await self.async_respond(device, request)) is not None:
+            return response
+        return self._json({"status": "ok", "timestamp": int(time.time())})
+
+    async def _async_screenshot(self, request: web.Request) -> web.StreamResponse:
+        device = self._device(request)
+        if (response := await self.async_respond(device, request)) is not None:
+            return response
+        return web.Response(body=self.screenshot, content_type="image/png")
+
+    async def _async_section(self, request: web.Request) -> web.StreamResponse:
+        device = self._device(request)
+        if (section := SECTION_ENDPOINTS.get(request.match_info["endpoint"])) is None:
+            raise web.HTTPNotFound
+        if (response := await self.async_respond(device, request)) is not None:
+            return response
+        return self._json(copy.deepcopy(device.read()[section]))
+
+    async def _async_command(self, request: web.Request) -> web.StreamResponse:
+        device = self._device(request)
+        if (response := await self.async_respond(device, request)) is not None:
+            return response
+        body = await request.json() if request.can_read_body else {}
+        device.apply_command(request.match_info["command"], body or {})
+        return self._json({"executed": request.match_info["command"]})
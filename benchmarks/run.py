@@ -0,0 +1,347 @@
+"""
+Benchmark the FreeKiosk integration against a local fake fleet.
+
+Usage: python -m benchmarks.run [--devices 1 50 500] [--output results.json]
+
+Run it from the repository root with the development requirements installed.
+Results are written as JSON so two runs can be compared with
+``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from homeassistant import loader
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
+from homeassistant.const import CONF_API_KEY
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import frame
+
+import custom_components
+from custom_components.freekiosk.api import FreeKioskApiClient
+from custom_components.freekiosk.binary_sensor import BINARY_SENSOR_DESCRIPTIONS
+from custom_components.freekiosk.commands import FreeKioskCommandCoalescer
+from custom_components.freekiosk.const import (
+    CONF_DEVICE_URL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    POLLING_MODE_STATUS,
+)
+from custom_components.freekiosk.coordinator import FreeKioskDataUpdateCoordinator
+from custom_components.freekiosk.data import FreeKioskData
+from custom_components.freekiosk.number import NUMBER_DESCRIPTIONS
+from custom_components.freekiosk.screenshot import FreeKioskScreenshotCache
+from custom_components.freekiosk.sensor import SENSOR_DESCRIPTIONS
+from custom_components.freekiosk.services import _find_entries
+from custom_components.freekiosk.switch import SWITCH_DESCRIPTIONS
+
+from .fake_server import FakeFreeKioskServer
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+DEFAULT_DEVICE_COUNTS = (1, 50, 500)
+ENTITY_DESCRIPTIONS = (
+    *SENSOR_DESCRIPTIONS,
+    *BINARY_SENSOR_DESCRIPTIONS,
+    *SWITCH_DESCRIPTIONS,
+    *NUMBER_DESCRIPTIONS,
+)
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return latency statistics in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+async def timed(awaitable: Awaitable[Any], samples: list[float]) -> Any:
+    """Await ``awaitable`` and record how long it took."""
+    started = time.perf_counter()
+    result = await awaitable
+    samples.append(time.perf_counter() - started)
+    return result
+
+
+def create_hass(config_dir: str) -> HomeAssistant:
+    """Return a bare Home Assistant instance with the loader and frame helper."""
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    frame.async_setup(hass)
+    return hass
+
+
+class Fleet:
+    """Config entries and coordinators for every fake device, set up like HA."""
+
+    def __init__(self, hass: HomeAssistant, server: FakeFreeKioskServer) -> None:
+        """Initialize the fleet."""
+        self.hass = hass
+        self.server = server
+        self.entries: list[ConfigEntry] = []
+        self.session: aiohttp.ClientSession | None = None
+
+    async def async_setup(self, polling_mode: str = POLLING_MODE_STATUS) -> None:
+        """Create an entry, client and coordinator per device and refresh once."""
+        self.async_add_entries(polling_mode)
+        await asyncio.gather(
+            *(entry.runtime_data.coordinator.async_refresh() for entry in self.entries)
+        )
+
+    @callback
+    def async_add_entries(self, polling_mode: str = POLLING_MODE_STATUS) -> None:
+        """Create an entry, client and coordinator per device."""
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, limit_per_host=0)
+        )
+        integration = loader.Integration.resolve_from_root(
+            self.hass, custom_components, DOMAIN
+        )
+        for index, url in enumerate(self.server.base_urls):
+            entry = ConfigEntry(
+                data={CONF_DEVICE_URL: url, CONF_API_KEY: None},
+                discovery_keys=MappingProxyType({}),
+                domain=DOMAIN,
+                minor_version=1,
+                options={},
+                source=SOURCE_USER,
+                subentries_data=None,
+                title=f"bench-{index}",
+                unique_id=url,
+                version=1,
+            )
+            coordinator = FreeKioskDataUpdateCoordinator(
+                hass=self.hass,
+                logger=LOGGER,
+                name=DOMAIN,
+                config_entry=entry,
+                poll_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+                polling_mode=polling_mode,
+            )
+            client = FreeKioskApiClient(base_url=url, session=self.session)
+            entry.runtime_data = FreeKioskData(
+                client=client,
+                coordinator=coordinator,
+                commands=FreeKioskCommandCoalescer(self.hass, entry, client),
+                integration=integration,
+            )
+            self.entries.append(entry)
+
+    @property
+    def coordinators(self) -> list[FreeKioskDataUpdateCoordinator]:
+        """Return every coordinator."""
+        return [entry.runtime_data.coordinator for entry in self.entries]
+
+    async def async_close(self) -> None:
+        """Shut the coordinators down and close the session."""
+        for coordinator in self.coordinators:
+            await coordinator.async_shutdown()
+        if self.session is not None:
+            await self.session.close()
+
+
+async def bench_update_data(fleet: Fleet, rounds: int) -> dict[str, Any]:
+    """Time coordinator refreshes, i.e. ``_async_update_data`` plus storing it."""
+    samples: list[float] = []
+    round_samples: list[float] = []
+    for _ in range(rounds):
+        await timed(
+            asyncio.gather(
+                *(timed(c.async_refresh(), samples) for c in fleet.coordinators)
+            ),
+            round_samples,
+        )
+    return {"refresh": summarize(samples), "round": summarize(round_samples)}
+
+
+async def bench_fan_out(fleet: Fleet, rounds: int) -> dict[str, Any]:
+    """Time listener dispatch for a one-value change and for a full update."""
+    calls = 0
+    remove: list[Callable[[], None]] = []
+    for coordinator in fleet.coordinators:
+        for description in ENTITY_DESCRIPTIONS:
+
+            @callback
+            def _update(
+                coordinator: FreeKioskDataUpdateCoordinator = coordinator,
+                description: Any = description,
+            ) -> None:
+                nonlocal calls
+                calls += 1
+                description.value_fn(coordinator.data)
+
+            remove.append(coordinator.async_add_listener(_update, description.path))
+
+    delta_samples: list[float] = []
+    full_samples: list[float] = []
+    for light in range(rounds):
+        started = time.perf_counter()
+        for coordinator in fleet.coordinators:
+            coordinator.async_apply_push({"sensors": {"light": light}})
+        delta_samples.append(time.perf_counter() - started)
+    delta_calls, calls = calls, 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for coordinator in fleet.coordinators:
+            coordinator.async_update_listeners()
+        full_samples.append(time.perf_counter() - started)
+
+    for unsubscribe in remove:
+        unsubscribe()
+    return {
+        "listeners_per_device": len(ENTITY_DESCRIPTIONS),
+        "delta": summarize(delta_samples),
+        "delta_callbacks_per_round": delta_calls / rounds,
+        "full": summarize(full_samples),
+        "full_callbacks_per_round": calls / rounds,
+    }
+
+
+def bench_find_entries(fleet: Fleet, iterations: int) -> dict[str, Any]:
+    """Time resolving service targets to config entries."""
+    # _find_entries only needs the entry lookup, not a loaded entry manager.
+    lookup = SimpleNamespace(
+        config_entries=SimpleNamespace(async_entries=lambda _domain: fleet.entries),
+    )
+    last = fleet.entries[-1]
+    targets = {
+        "entry_id": {"entry_id": [last.entry_id]},
+        "device_url": {"device_url": [last.data[CONF_DEVICE_URL]]},
+        "all": {"entry_id": ["all"]},
+    }
+    results: dict[str, Any] = {}
+    for name, data in targets.items():
+        call = SimpleNamespace(data=data)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            _find_entries(lookup, call)
+        elapsed = time.perf_counter() - started
+        results[name] = {"per_call_us": elapsed / iterations * 1e6}
+    return results
+
+
+async def bench_screenshots(
+    hass: HomeAssistant, fleet: Fleet, rounds: int
+) -> dict[str, Any]:
+    """Measure screenshot fetch throughput across the fleet."""
+    caches = [FreeKioskScreenshotCache(hass, entry) for entry in fleet.entries]
+    samples: list[float] = []
+    received = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        frames = await asyncio.gather(
+            *(timed(cache.async_get_frame(max_age=0), samples) for cache in caches)
+        )
+        received += sum(len(frame.content) for frame in frames)
+    elapsed = time.perf_counter() - started
+    return {
+        "fetch": summarize(samples),
+        "frames_per_s": len(samples) / elapsed,
+        "mb_per_s": received / elapsed / 1e6,
+    }
+
+
+async def run_size(
+    hass: HomeAssistant, count: int, rounds: int, iterations: int
+) -> dict[str, Any]:
+    """Run every benchmark against ``count`` devices."""
+    results: dict[str, Any] = {}
+    for label, volatile in (("unchanged", False), ("changed", True)):
+        server = FakeFreeKioskServer(count, volatile=volatile)
+        await server.async_start()
+        fleet = Fleet(hass, server)
+        try:
+            await fleet.async_setup()
+            results[f"update_data_{label}"] = await bench_update_data(fleet, rounds)
+            if volatile:
+                continue
+            results["fan_out"] = await bench_fan_out(fleet, rounds)
+            results["find_entries"] = bench_find_entries(fleet, iterations)
+            results["screenshot"] = await bench_screenshots(hass, fleet, rounds)
+        finally:
+            await fleet.async_close()
+            await server.async_stop()
+    return results
+
+
+def _git_revision() -> str | None:
+    """Return the current commit, if this is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Start a bare Home Assistant instance and run the benchmarks."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = create_hass(config_dir)
+        results: dict[str, Any] = {}
+        try:
+            for count in args.devices:
+                print(f"Benchmarking {count} device(s)...", file=sys.stderr)
+                results[str(count)] = await run_size(
+                    hass, count, args.rounds, args.iterations
+                )
+        finally:
+            await hass.async_stop(force=True)
+    return {
+        "meta": {
+            "commit": _git_revision(),
+            "created": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": args.rounds,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and write the JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--devices", type=int, nargs="+", default=list(DEFAULT_DEVICE_COUNTS)
+    )
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    report = asyncio.run(async_main(args))
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
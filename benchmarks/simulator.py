@@ -0,0 +1,346 @@
+"""
+Simulate a large FreeKiosk fleet with injected latency and failures.
+
+Usage: python -m benchmarks.simulator --devices 500 --offline 0.2 --duration 120
+
+Every device is served by one in-process fake server and gets a fault
+profile: a latency distribution, per-request timeout, 401 and malformed-JSON
+rates, and optionally permanent or flapping loss of connectivity. The
+integration's coordinators get their first refresh from the same startup
+coordinator and budget the config entry setup uses and are then polled by
+the real fleet scheduler for ``--duration`` seconds while the event loop lag
+is sampled.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+from homeassistant import config_entries
+from homeassistant.config_entries import ConfigFlowContext, ConfigFlowResult
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.freekiosk.const import LOGGER
+from custom_components.freekiosk.scheduler import async_get_scheduler
+from custom_components.freekiosk.startup import async_get_startup
+
+from .fake_server import FakeDevice, FakeFreeKioskServer
+from .run import Fleet, create_hass, summarize
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from custom_components.freekiosk.coordinator import (
+        FreeKioskDataUpdateCoordinator,
+    )
+
+# How long a request that "never answers" is held open. The client's own
+# timeout always fires first.
+HANG_SECONDS = 120
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+
+
+@dataclass(frozen=True, slots=True)
+class FaultProfile:
+    """How one simulated device misbehaves."""
+
+    category: str = "healthy"
+    latency_ms: float = 20.0
+    jitter_ms: float = 10.0
+    distribution: str = "lognormal"
+    timeout_rate: float = 0.0
+    unauthorized_rate: float = 0.0
+    malformed_rate: float = 0.0
+    offline: bool = False
+    flap_period: float = 0.0
+
+
+@dataclass(slots=True)
+class DeviceStats:
+    """What the fake server did for one device."""
+
+    served: int = 0
+    delayed_ms: float = 0.0
+    hung: int = 0
+    unauthorized: int = 0
+    malformed: int = 0
+
+
+class SimulatedFleetServer(FakeFreeKioskServer):
+    """A fake fleet whose devices follow their fault profiles."""
+
+    def __init__(self, profiles: list[FaultProfile], *, seed: int) -> None:
+        """Create one device per profile."""
+        super().__init__(len(profiles))
+        self.profiles = profiles
+        self.stats = [DeviceStats() for _ in profiles]
+        self._random = random.Random(seed)  # noqa: S311
+        self._flap_phase = [self._random.random() for _ in profiles]
+        self._started = time.monotonic()
+
+    def reachable(self, index: int) -> bool:
+        """Return whether a device currently answers at all."""
+        profile = self.profiles[index]
+        if profile.offline:
+            return False
+        if profile.flap_period <= 0:
+            return True
+        elapsed = time.monotonic() - self._started
+        return int(elapsed / profile.flap_period + self._flap_phase[index]) % 2 == 0
+
+    def _latency(self, profile: FaultProfile) -> float:
+        """Draw a response delay in seconds."""
+        rng = self._random
+        match profile.distribution:
+            case "fixed":
+                delay = profile.latency_ms
+            case "uniform":
+                delay = rng.uniform(
+                    profile.latency_ms - profile.jitter_ms,
+                    profile.latency_ms + profile.jitter_ms,
+                )
+            case _:
+                sigma = profile.jitter_ms / max(profile.latency_ms, 1.0)
+                delay = profile.latency_ms * rng.lognormvariate(0, sigma)
+        return max(delay, 0.0) / 1000
+
+    async def async_respond(
+        self, device: FakeDevice, request: web.Request
+    ) -> web.StreamResponse | None:
+        """Apply the device's fault profile before the normal response."""
+        del request
+        profile = self.profiles[device.index]
+        stats = self.stats[device.index]
+        if not self.reachable(device.index):
+            stats.hung += 1
+            await asyncio.sleep(HANG_SECONDS)
+        delay = self._latency(profile)
+        stats.delayed_ms += delay * 1000
+        await asyncio.sleep(delay)
+
+        roll = self._random.random()
+        if roll < profile.timeout_rate:
+            stats.hung += 1
+            await asyncio.sleep(HANG_SECONDS)
+        roll -= profile.timeout_rate
+        if roll < profile.unauthorized_rate:
+            stats.unauthorized += 1
+            return web.Response(status=401)
+        roll -= profile.unauthorized_rate
+        if roll < profile.malformed_rate:
+            stats.malformed += 1
+            return web.Response(
+                text='{"success": true, "data": {"screen": ',
+                content_type="application/json",
+            )
+        stats.served += 1
+        return None
+
+
+def build_profiles(args: argparse.Namespace) -> list[FaultProfile]:
+    """Assign the offline, flapping and healthy categories across the fleet."""
+    rng = random.Random(args.seed)  # noqa: S311
+    indexes = list(range(args.devices))
+    rng.shuffle(indexes)
+    offline = set(indexes[: round(args.devices * args.offline)])
+    flapping = set(
+        indexes[len(offline) : len(offline) + round(args.devices * args.flapping)]
+    )
+    profiles = []
+    for index in range(args.devices):
+        category = (
+            "offline"
+            if index in offline
+            else "flapping"
+            if index in flapping
+            else "healthy"
+        )
+        profiles.append(
+            FaultProfile(
+                category=category,
+                latency_ms=args.latency,
+                jitter_ms=args.jitter,
+                distribution=args.distribution,
+                timeout_rate=args.timeout_rate,
+                unauthorized_rate=args.unauthorized_rate,
+                malformed_rate=args.malformed_rate,
+                offline=index in offline,
+                flap_period=args.flap_period if index in flapping else 0.0,
+            )
+        )
+    return profiles
+
+
+class _WarningCounter(logging.Handler):
+    """Count warnings the integration logs during the run."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.WARNING)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+class _ReauthCounter(config_entries.ConfigEntriesFlowManager):
+    """Count the reauth flows entries start instead of loading the config flow."""
+
+    reauth_flows = 0
+
+    async def async_init(
+        self,
+        handler: str,
+        *,
+        context: ConfigFlowContext | None = None,
+        data: Any = None,
+    ) -> ConfigFlowResult:
+        del context, data
+        self.reauth_flows += 1
+        return ConfigFlowResult(
+            type=FlowResultType.ABORT, flow_id="", handler=handler, reason="simulated"
+        )
+
+
+async def _async_sample_lag(samples: list[float], interval: float = 0.05) -> None:
+    """Record how late the event loop wakes up from short sleeps."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def _async_start(
+    hass: HomeAssistant, coordinator: FreeKioskDataUpdateCoordinator
+) -> CALLBACK_TYPE:
+    """Refresh and schedule one coordinator the way ``async_setup_entry`` does."""
+    refresh = await async_get_startup(hass).async_first_refresh(coordinator)
+    return async_get_scheduler(hass).async_add(coordinator, refresh)
+
+
+def _category_report(
+    server: SimulatedFleetServer, fleet: Fleet, category: str
+) -> dict[str, Any]:
+    """Summarize the devices of one category."""
+    indexes = [
+        index
+        for index, profile in enumerate(server.profiles)
+        if profile.category == category
+    ]
+    coordinators = [fleet.coordinators[index] for index in indexes]
+    stats = [server.stats[index] for index in indexes]
+    return {
+        "devices": len(indexes),
+        "available": sum(c.last_update_success for c in coordinators),
+        "circuit_open": sum(c.circuit_open for c in coordinators),
+        "requests": sum(server.devices[index].requests for index in indexes),
+        "served": sum(s.served for s in stats),
+        "hung": sum(s.hung for s in stats),
+        "unauthorized": sum(s.unauthorized for s in stats),
+        "malformed": sum(s.malformed for s in stats),
+    }
+
+
+async def async_simulate(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the scenario and return the report."""
+    profiles = build_profiles(args)
+    server = SimulatedFleetServer(profiles, seed=args.seed)
+    await server.async_start()
+    warnings = _WarningCounter()
+    LOGGER.addHandler(warnings)
+    lag: list[float] = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = create_hass(config_dir)
+        # Auth failures start a reauth flow, which needs the entry manager.
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        flows = hass.config_entries.flow = _ReauthCounter(hass, hass.config_entries, {})
+        monitor = asyncio.create_task(_async_sample_lag(lag))
+        fleet = Fleet(hass, server)
+        try:
+            fleet.async_add_entries()
+            started = time.perf_counter()
+            removers = await asyncio.gather(
+                *(_async_start(hass, c) for c in fleet.coordinators)
+            )
+            setup_seconds = time.perf_counter() - started
+            setup_lag = list(lag)
+
+            print(
+                f"Simulating {args.devices} devices for {args.duration} s...",
+                file=sys.stderr,
+            )
+            await asyncio.sleep(args.duration)
+            for remove in removers:
+                remove()
+            report = {
+                "setup_seconds": setup_seconds,
+                "setup_loop_lag": summarize(setup_lag or [0.0]),
+                "loop_lag": summarize(lag[len(setup_lag) :] or [0.0]),
+                "warnings": warnings.messages,
+                "reauth_flows": flows.reauth_flows,
+                "categories": {
+                    category: _category_report(server, fleet, category)
+                    for category in ("healthy", "flapping", "offline")
+                },
+            }
+        finally:
+            monitor.cancel()
+            LOGGER.removeHandler(warnings)
+            await fleet.async_close()
+            await server.async_stop()
+            await hass.async_stop(force=True)
+    return {
+        "scenario": {
+            key: value for key, value in vars(args).items() if key != "output"
+        },
+        "report": report,
+    }
+
+
+def main() -> None:
+    """Parse the scenario, run it and print or write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=120)
+    parser.add_argument(
+        "--offline", type=float, default=0.2, help="share of devices never answering"
+    )
+    parser.add_argument(
+        "--flapping", type=float, default=0.0, help="share of devices going up/down"
+    )
+    parser.add_argument("--flap-period", type=float, default=60)
+    parser.add_argument("--latency", type=float, default=20, help="median in ms")
+    parser.add_argument("--jitter", type=float, default=10, help="spread in ms")
+    parser.add_argument(
+        "--distribution", choices=LATENCY_DISTRIBUTIONS, default="lognormal"
+    )
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    report = asyncio.run(async_simulate(args))
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,19 +6,34 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import CONF_API_KEY, Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import FreeKioskApiClient
+from .commands import FreeKioskCommandCoalescer
 from .const import (
     CONF_DEVICE_URL,
+    CONF_POLLING_MODE,
+    CONF_PUSH,
+    CONF_SLOW_CYCLE_WARNING,
+    CONF_TRANSPORT,
+    DEFAULT_POLLING_MODE,
+    DEFAULT_PUSH,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SLOW_CYCLE_WARNING,
+    DEFAULT_TRANSPORT,
     DOMAIN,
     LOGGER,
+    TRANSPORT_POLLING,
 )
 from .coordinator import FreeKioskDataUpdateCoordinator
 from .data import FreeKioskConfigEntry, FreeKioskData
+from .push import async_setup_push
+from .scheduler import async_get_scheduler
 from .services import async_setup_services
+from .session import async_get_session
+from .startup import async_get_startup
+from .store import FreeKioskStatusStore
+from .stream import FreeKioskEventStream
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -43,21 +58,46 @@ async def async_setup_entry(
         hass=hass,
         logger=LOGGER,
         name=DOMAIN,
-        update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        config_entry=entry,
+        poll_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        polling_mode=entry.options.get(CONF_POLLING_MODE, DEFAULT_POLLING_MODE),
+    )
+    if slow_cycle_warning := entry.options.get(
+        CONF_SLOW_CYCLE_WARNING, DEFAULT_SLOW_CYCLE_WARNING
+    ):
+        coordinator.slow_cycle_threshold = slow_cycle_warning / 1000
+
+    client = FreeKioskApiClient(
+        base_url=entry.data[CONF_DEVICE_URL],
+        api_key=entry.data.get(CONF_API_KEY),
+        session=async_get_session(hass, entry),
     )
-    coordinator.config_entry = entry
-
     entry.runtime_data = FreeKioskData(
-        client=FreeKioskApiClient(
-            base_url=entry.data[CONF_DEVICE_URL],
-            api_key=entry.data.get(CONF_API_KEY),
-            session=async_get_clientsession(hass),
-        ),
+        client=client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        commands=FreeKioskCommandCoalescer(hass, entry, client),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    entry.async_on_unload(entry.runtime_data.commands.async_stop)
+
+    startup = async_get_startup(hass)
+    store = coordinator.status_store = FreeKioskStatusStore(hass, entry.entry_id)
+    if (cached := await store.async_load()) is not None:
+        # Come up from the last known status and refresh in the background;
+        # an offline tablet then turns unavailable instead of delaying setup.
+        coordinator.async_set_cached_data(cached)
+        refresh = startup.async_start_refresh(coordinator)
+    else:
+        refresh = await startup.async_first_refresh(coordinator)
+    entry.async_on_unload(async_get_scheduler(hass).async_add(coordinator, refresh))
+    if entry.options.get(CONF_PUSH, DEFAULT_PUSH):
+        async_setup_push(hass, entry)
+    transport = entry.options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+    if transport != TRANSPORT_POLLING:
+        stream = FreeKioskEventStream(hass, entry, transport)
+        stream.async_start()
+        entry.async_on_unload(stream.async_stop)
 
     await async_setup_services(hass)
 
@@ -75,6 +115,14 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: FreeKioskConfigEntry,
+) -> None:
+    """Delete the persisted status of a removed entry."""
+    await FreeKioskStatusStore(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: FreeKioskConfigEntry,
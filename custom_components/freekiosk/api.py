@@ -2,18 +2,51 @@
 
 from __future__ import annotations
 
+import hashlib
+import re
 import socket
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Final
 
 import aiohttp
 import async_timeout
+from homeassistant.util.json import json_loads
 
 from .const import (
     CONF_HEADER_API_KEY,
     LOGGER,
+    REQUEST_TIMEOUT,
+    REST_ENDPOINT_EVENTS,
     REST_ENDPOINT_HEALTH,
     REST_ENDPOINT_SCREENSHOT,
     REST_ENDPOINT_STATUS,
+    REST_ENDPOINT_WEBSOCKET,
+    STREAM_HEARTBEAT,
+    STREAM_READ_TIMEOUT,
+    TRANSPORT_SSE,
 )
+from .stats import FreeKioskStats
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+# Fields that change on every response without the device state changing.
+_VOLATILE_FIELDS = re.compile(rb'"timestamp"\s*:\s*-?[\d.eE+-]+')
+
+
+def payload_digest(body: bytes) -> bytes:
+    """Return a digest of a response body that ignores volatile fields."""
+    return hashlib.blake2b(_VOLATILE_FIELDS.sub(b"", body), digest_size=16).digest()
+
+
+class UnchangedType(Enum):
+    """Type of the marker for a body that matches the previous digest."""
+
+    UNCHANGED = "unchanged"
+
+
+UNCHANGED: Final = UnchangedType.UNCHANGED
 
 
 class FreeKioskApiClientError(Exception):
@@ -28,6 +61,10 @@ class FreeKioskApiClientCommunicationError(FreeKioskApiClientError):
     """General communication failure."""
 
 
+class FreeKioskApiClientUnsupportedError(FreeKioskApiClientCommunicationError):
+    """The device does not offer the requested endpoint."""
+
+
 class FreeKioskApiClient:
     """Client for talking to the FreeKiosk REST API."""
 
@@ -41,71 +78,184 @@ class FreeKioskApiClient:
         self._base_url = base_url.rstrip("/")
         self._session = session
         self._api_key = api_key
+        self.stats = FreeKioskStats()
 
     async def async_get_status(self) -> dict[str, object]:
         """Return the full /api/status payload."""
         return await self._async_request("GET", REST_ENDPOINT_STATUS)
 
-    async def async_get_health(self) -> dict[str, object]:
+    async def async_get_status_if_changed(
+        self, digest: bytes | None
+    ) -> tuple[bytes, dict[str, object] | UnchangedType]:
+        """
+        Return the /api/status digest and payload.
+
+        When the body hashes to ``digest`` it is not decoded at all and
+        ``UNCHANGED`` is returned in place of the payload. Empty bodies and
+        anything but a JSON object are communication errors.
+        """
+        body = await self._async_request_bytes("GET", REST_ENDPOINT_STATUS)
+        new_digest = payload_digest(body)
+        if new_digest == digest:
+            return new_digest, UNCHANGED
+        endpoint = f"GET {REST_ENDPOINT_STATUS}"
+        status = self._decode(endpoint, body)
+        if not isinstance(status, dict):
+            self.stats.record_error(endpoint, "malformed")
+            raise FreeKioskApiClientCommunicationError
+        return new_digest, status
+
+    async def async_get_health(
+        self, request_timeout: float = REQUEST_TIMEOUT
+    ) -> dict[str, object]:
         """Return the /api/health payload."""
-        return await self._async_request("GET", REST_ENDPOINT_HEALTH)
+        return await self._async_request(
+            "GET", REST_ENDPOINT_HEALTH, request_timeout=request_timeout
+        )
+
+    async def async_get(self, endpoint: str) -> dict[str, object]:
+        """Return the payload of a narrow GET endpoint such as /api/screen."""
+        return await self._async_request("GET", endpoint)
 
     async def async_get_screenshot(self) -> bytes:
         """Return the /api/screenshot payload."""
         return await self._async_request_bytes("GET", REST_ENDPOINT_SCREENSHOT)
 
+    async def async_stream_events(
+        self,
+        transport: str,
+        last_event_id: str | None = None,
+        on_connect: Callable[[], None] | None = None,
+    ) -> AsyncIterator[tuple[str | None, dict[str, Any]]]:
+        """
+        Yield ``(event id, status delta)`` pairs from a persistent event stream.
+
+        ``transport`` selects Server-Sent Events or a WebSocket. The stream
+        resumes after ``last_event_id`` when the device supports it, and
+        ``on_connect`` is called once the connection is established. Devices
+        that do not offer the stream raise
+        ``FreeKioskApiClientUnsupportedError``.
+        """
+        stream = (
+            self._async_stream_sse
+            if transport == TRANSPORT_SSE
+            else self._async_stream_websocket
+        )
+        try:
+            async for event_id, event in stream(last_event_id, on_connect):
+                yield event_id, event
+        except aiohttp.WSServerHandshakeError as err:
+            if err.status in (401, 403):
+                raise FreeKioskApiClientAuthenticationError from err
+            if err.status == 404:  # noqa: PLR2004
+                raise FreeKioskApiClientUnsupportedError from err
+            raise FreeKioskApiClientCommunicationError from err
+        except (aiohttp.ClientError, socket.gaierror, TimeoutError) as err:
+            LOGGER.debug("FreeKiosk event stream closed (%s): %s", transport, err)
+            raise FreeKioskApiClientCommunicationError from err
+
+    async def _async_stream_sse(
+        self,
+        last_event_id: str | None,
+        on_connect: Callable[[], None] | None,
+    ) -> AsyncIterator[tuple[str | None, dict[str, Any]]]:
+        """Yield events from the Server-Sent Events endpoint."""
+        headers = {"Accept": "text/event-stream"}
+        if self._api_key:
+            headers[CONF_HEADER_API_KEY] = self._api_key
+        if last_event_id is not None:
+            headers["Last-Event-ID"] = last_event_id
+        async with self._session.get(
+            f"{self._base_url}{REST_ENDPOINT_EVENTS}",
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=REQUEST_TIMEOUT, sock_read=STREAM_READ_TIMEOUT
+            ),
+        ) as response:
+            if response.status in (401, 403):
+                raise FreeKioskApiClientAuthenticationError
+            if response.status == 404:  # noqa: PLR2004
+                raise FreeKioskApiClientUnsupportedError
+            response.raise_for_status()
+            if on_connect is not None:
+                on_connect()
+            event_id = last_event_id
+            data: list[str] = []
+            async for raw_line in response.content:
+                line = raw_line.decode("utf-8").rstrip("\r\n")
+                if not line:
+                    if data and isinstance(
+                        event := _decode_event("\n".join(data)), dict
+                    ):
+                        yield event_id, event
+                    data = []
+                    continue
+                field, _, value = line.partition(":")
+                value = value.removeprefix(" ")
+                if field == "data":
+                    data.append(value)
+                elif field == "id":
+                    event_id = value
+
+    async def _async_stream_websocket(
+        self,
+        last_event_id: str | None,
+        on_connect: Callable[[], None] | None,
+    ) -> AsyncIterator[tuple[str | None, dict[str, Any]]]:
+        """Yield events from the WebSocket endpoint."""
+        headers: dict[str, str] = {}
+        if self._api_key:
+            headers[CONF_HEADER_API_KEY] = self._api_key
+        params = {} if last_event_id is None else {"lastEventId": last_event_id}
+        async with self._session.ws_connect(
+            f"{self._base_url}{REST_ENDPOINT_WEBSOCKET}",
+            headers=headers or None,
+            params=params,
+            heartbeat=STREAM_HEARTBEAT,
+            timeout=aiohttp.ClientWSTimeout(ws_receive=STREAM_READ_TIMEOUT),
+        ) as websocket:
+            if on_connect is not None:
+                on_connect()
+            async for message in websocket:
+                if message.type is not aiohttp.WSMsgType.TEXT:
+                    continue
+                if isinstance(event := _decode_event(message.data), dict):
+                    event_id = event.pop("id", None)
+                    yield None if event_id is None else str(event_id), event
+
     async def _async_request(
         self,
         method: str,
         endpoint: str,
         data: dict | None = None,
+        request_timeout: float = REQUEST_TIMEOUT,
     ) -> dict[str, object]:
-        """Make an HTTP request."""
-        headers: dict[str, str] = {}
-        if self._api_key:
-            headers[CONF_HEADER_API_KEY] = self._api_key
-
-        url = f"{self._base_url}{endpoint}"
-        try:
-            async with async_timeout.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    headers=headers or None,
-                )
-                if response.status in (401, 403):
-                    LOGGER.debug(
-                        "Received %s from FreeKiosk (%s)",
-                        response.status,
-                        url,
-                    )
-                    raise FreeKioskApiClientAuthenticationError
-                response.raise_for_status()
-                return await response.json()
-        except (aiohttp.ClientError, socket.gaierror) as err:
-            LOGGER.exception("Error talking to FreeKiosk API: %s", err)
-            raise FreeKioskApiClientCommunicationError from err
-        except TimeoutError as err:
-            LOGGER.exception("Timeout fetching FreeKiosk status: %s", err)
-            raise FreeKioskApiClientCommunicationError from err
+        """Make an HTTP request and decode the JSON response."""
+        body = await self._async_request_bytes(method, endpoint, data, request_timeout)
+        return self._decode(f"{method} {endpoint}", body)
 
     async def _async_request_bytes(
         self,
         method: str,
         endpoint: str,
+        data: dict | None = None,
+        request_timeout: float = REQUEST_TIMEOUT,
     ) -> bytes:
-        """Make an HTTP request and return raw bytes."""
+        """Make an HTTP request, record its statistics and return raw bytes."""
         headers: dict[str, str] = {}
         if self._api_key:
             headers[CONF_HEADER_API_KEY] = self._api_key
 
         url = f"{self._base_url}{endpoint}"
+        started = time.perf_counter()
+        body = b""
+        error: str | None = None
         try:
-            async with async_timeout.timeout(10):
+            async with async_timeout.timeout(request_timeout):
                 response = await self._session.request(
                     method=method,
                     url=url,
+                    json=data,
                     headers=headers or None,
                 )
                 if response.status in (401, 403):
@@ -114,15 +264,37 @@ class FreeKioskApiClient:
                         response.status,
                         url,
                     )
+                    error = "unauthorized"
                     raise FreeKioskApiClientAuthenticationError
+                if response.status == 404:  # noqa: PLR2004
+                    error = "not_found"
+                    raise FreeKioskApiClientUnsupportedError
                 response.raise_for_status()
-                return await response.read()
+                body = await response.read()
         except (aiohttp.ClientError, socket.gaierror) as err:
-            LOGGER.exception("Error talking to FreeKiosk API: %s", err)
+            LOGGER.debug("Error talking to FreeKiosk API (%s): %s", url, err)
+            error = type(err).__name__
             raise FreeKioskApiClientCommunicationError from err
         except TimeoutError as err:
-            LOGGER.exception("Timeout fetching FreeKiosk screenshot: %s", err)
+            LOGGER.debug("Timeout talking to FreeKiosk API (%s)", url)
+            error = "timeout"
             raise FreeKioskApiClientCommunicationError from err
+        finally:
+            self.stats.record_request(
+                f"{method} {endpoint}",
+                time.perf_counter() - started,
+                len(body),
+                error,
+            )
+        return body
+
+    def _decode(self, endpoint: str, body: bytes) -> Any:
+        """Decode a response body, counting malformed ones as errors."""
+        try:
+            return _decode_payload(body)
+        except FreeKioskApiClientCommunicationError:
+            self.stats.record_error(endpoint, "malformed")
+            raise
 
     async def async_post_command(
         self,
@@ -131,3 +303,23 @@ class FreeKioskApiClient:
     ) -> dict[str, object]:
         """Send a POST command to FreeKiosk."""
         return await self._async_request("POST", endpoint, data)
+
+
+def _decode_payload(body: bytes) -> Any:
+    """Decode a JSON response body; an empty body decodes to ``None``."""
+    if not body.strip():
+        return None
+    try:
+        return json_loads(body)
+    except ValueError as err:
+        LOGGER.debug("Malformed response from FreeKiosk API: %s", err)
+        raise FreeKioskApiClientCommunicationError from err
+
+
+def _decode_event(data: str) -> Any:
+    """Decode a JSON event, ignoring anything that is not valid JSON."""
+    try:
+        return json_loads(data)
+    except ValueError:
+        LOGGER.debug("Ignoring malformed FreeKiosk event: %s", data)
+        return None
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -11,7 +11,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 
-from .entity import FreeKioskEntity
+from .entity import FreeKioskEntity, async_add_reported_entities
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -20,14 +20,15 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import FreeKioskDataUpdateCoordinator
-    from .data import FreeKioskConfigEntry
+    from .data import FreeKioskConfigEntry, FreeKioskStatus
 
 
 @dataclass
 class FreeKioskBinarySensorDescription(BinarySensorEntityDescription):
     """Describes a FreeKiosk binary sensor."""
 
-    value_fn: Callable[[dict[str, Any]], bool] = lambda _: False  # type: ignore[assignment]
+    path: tuple[str, ...] = ()
+    value_fn: Callable[[FreeKioskStatus], bool] = lambda _: False  # type: ignore[assignment]
 
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[FreeKioskBinarySensorDescription, ...] = (
@@ -35,67 +36,78 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[FreeKioskBinarySensorDescription, ...] = (
         key="screen_on",
         name="Screen On",
         device_class=BinarySensorDeviceClass.POWER,
-        value_fn=lambda data: data.get("screen", {}).get("on") is True,
+        path=("screen", "on"),
+        value_fn=lambda data: data.screen.on is True,
     ),
     FreeKioskBinarySensorDescription(
         key="screensaver_active",
         name="Screensaver Active",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda data: data.get("screen", {}).get("screensaverActive") is True,
+        path=("screen", "screensaverActive"),
+        value_fn=lambda data: data.screen.screensaver_active,
     ),
     FreeKioskBinarySensorDescription(
         key="battery_charging",
         name="Battery Charging",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
-        value_fn=lambda data: data.get("battery", {}).get("charging") is True,
+        path=("battery", "charging"),
+        value_fn=lambda data: data.battery.charging,
     ),
     FreeKioskBinarySensorDescription(
         key="wifi_connected",
         name="WiFi Connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda data: data.get("wifi", {}).get("connected") is True,
+        path=("wifi", "connected"),
+        value_fn=lambda data: data.wifi.connected,
     ),
     FreeKioskBinarySensorDescription(
         key="autobrightness_enabled",
         name="Auto Brightness Enabled",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda data: data.get("autoBrightness", {}).get("enabled") is True,
+        path=("autoBrightness", "enabled"),
+        value_fn=lambda data: data.auto_brightness.enabled,
     ),
     FreeKioskBinarySensorDescription(
         key="kiosk_enabled",
         name="Kiosk Mode Enabled",
         device_class=BinarySensorDeviceClass.SAFETY,
-        value_fn=lambda data: data.get("device", {}).get("kioskMode") is True,
+        path=("device", "kioskMode"),
+        value_fn=lambda data: data.device.kiosk_mode,
     ),
     FreeKioskBinarySensorDescription(
         key="device_owner",
         name="Device Owner Mode",
         device_class=BinarySensorDeviceClass.SAFETY,
-        value_fn=lambda data: data.get("device", {}).get("isDeviceOwner") is True,
+        path=("device", "isDeviceOwner"),
+        value_fn=lambda data: data.device.is_device_owner,
     ),
     FreeKioskBinarySensorDescription(
         key="webview_loading",
         name="WebView Loading",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda data: data.get("webview", {}).get("loading") is True,
+        path=("webview", "loading"),
+        value_fn=lambda data: data.webview.loading,
     ),
     FreeKioskBinarySensorDescription(
         key="webview_can_go_back",
         name="WebView Can Go Back",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda data: data.get("webview", {}).get("canGoBack") is True,
+        path=("webview", "canGoBack"),
+        value_fn=lambda data: data.webview.can_go_back,
     ),
     FreeKioskBinarySensorDescription(
         key="rotation_enabled",
         name="Rotation Enabled",
         device_class=BinarySensorDeviceClass.RUNNING,
-        value_fn=lambda data: data.get("rotation", {}).get("enabled") is True,
+        path=("rotation", "enabled"),
+        value_fn=lambda data: data.rotation.enabled,
     ),
     FreeKioskBinarySensorDescription(
         key="memory_low",
         name="Low Memory",
         device_class=BinarySensorDeviceClass.PROBLEM,
-        value_fn=lambda data: data.get("memory", {}).get("lowMemory") is True,
+        path=("memory", "lowMemory"),
+        value_fn=lambda data: data.memory.low_memory,
     ),
 )
 
@@ -106,12 +118,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up FreeKiosk binary sensors."""
-    async_add_entities(
-        FreeKioskStatusBinarySensor(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=description,
-        )
-        for description in BINARY_SENSOR_DESCRIPTIONS
+    coordinator = entry.runtime_data.coordinator
+    async_add_reported_entities(
+        entry,
+        async_add_entities,
+        BINARY_SENSOR_DESCRIPTIONS,
+        lambda description: FreeKioskStatusBinarySensor(coordinator, description),
     )
 
 
@@ -124,7 +136,11 @@ class FreeKioskStatusBinarySensor(FreeKioskEntity, BinarySensorEntity):
         entity_description: FreeKioskBinarySensorDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator, unique_id=f"binary_{entity_description.key}")
+        super().__init__(
+            coordinator,
+            unique_id=f"binary_{entity_description.key}",
+            path=entity_description.path,
+        )
         self.entity_description = entity_description
 
     @property
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 
 from .entity import FreeKioskEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -22,6 +24,7 @@ class FreeKioskButtonDescription(ButtonEntityDescription):
     """Describes a FreeKiosk button."""
 
     endpoint: str = ""
+    optimistic: Mapping[tuple[str, ...], Any] | None = None
 
 
 BUTTON_DESCRIPTIONS: tuple[FreeKioskButtonDescription, ...] = (
@@ -36,6 +39,7 @@ BUTTON_DESCRIPTIONS: tuple[FreeKioskButtonDescription, ...] = (
         name="Wake",
         icon="mdi:power",
         endpoint="/api/wake",
+        optimistic={("screen", "screensaverActive"): False},
     ),
     FreeKioskButtonDescription(
         key="clear_cache",
@@ -93,7 +97,7 @@ class FreeKioskButton(FreeKioskEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self.coordinator.config_entry.runtime_data.client.async_post_command(
+        await self._async_send_command(
             self.entity_description.endpoint,
+            optimistic=self.entity_description.optimistic,
         )
-        await self.coordinator.async_request_refresh()
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
 from typing import TYPE_CHECKING
 
+from aiohttp import web
 from homeassistant.components.camera import Camera
 
 from .api import FreeKioskApiClientError
-from .const import LOGGER
+from .const import CONF_MJPEG_MAX_FPS, DEFAULT_MJPEG_MAX_FPS, LOGGER
 from .entity import FreeKioskEntity
+from .screenshot import FreeKioskScreenshotCache, FreeKioskScreenshotStream
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -17,6 +20,8 @@ if TYPE_CHECKING:
     from .coordinator import FreeKioskDataUpdateCoordinator
     from .data import FreeKioskConfigEntry
 
+_PNG_SIGNATURE = b"\x89PNG"
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -36,15 +41,51 @@ class FreeKioskScreenshotCamera(FreeKioskEntity, Camera):
     def __init__(self, coordinator: FreeKioskDataUpdateCoordinator) -> None:
         """Initialize the camera entity."""
         super().__init__(coordinator, unique_id="screenshot")
+        Camera.__init__(self)
+        self._screenshots = FreeKioskScreenshotCache(
+            coordinator.hass, coordinator.config_entry
+        )
+        self._stream = FreeKioskScreenshotStream(
+            coordinator.hass,
+            coordinator.config_entry,
+            self._screenshots,
+            coordinator.config_entry.options.get(
+                CONF_MJPEG_MAX_FPS, DEFAULT_MJPEG_MAX_FPS
+            ),
+        )
+        self._attr_frame_interval = self._stream.interval
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop the MJPEG producer."""
+        await super().async_will_remove_from_hass()
+        await self._stream.async_stop()
 
     async def async_camera_image(
-        self, _width: int | None = None, _height: int | None = None
+        self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return a still image response."""
         try:
-            return await (
-                self.coordinator.config_entry.runtime_data.client.async_get_screenshot()
-            )
+            return await self._screenshots.async_get_image(width, height)
         except FreeKioskApiClientError as err:
             LOGGER.debug("Unable to fetch screenshot: %s", err)
             return None
+
+    async def handle_async_mjpeg_stream(
+        self, request: web.Request
+    ) -> web.StreamResponse:
+        """Serve an MJPEG stream built from the shared screenshot producer."""
+        response = web.StreamResponse()
+        response.content_type = "multipart/x-mixed-replace;boundary=--frameboundary"
+        await response.prepare(request)
+        async with contextlib.aclosing(self._stream.async_frames()) as frames:
+            async for content in frames:
+                content_type = (
+                    "image/png" if content.startswith(_PNG_SIGNATURE) else "image/jpeg"
+                )
+                await response.write(
+                    f"--frameboundary\r\nContent-Type: {content_type}\r\n"
+                    f"Content-Length: {len(content)}\r\n\r\n".encode()
+                    + content
+                    + b"\r\n"
+                )
+        return response
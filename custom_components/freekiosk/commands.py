@@ -0,0 +1,104 @@
+"""Command coalescing for FreeKiosk controls."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+from .api import FreeKioskApiClientError
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import FreeKioskApiClient
+    from .data import FreeKioskConfigEntry
+
+
+def _resolve(
+    waiters: list[asyncio.Future[None]], error: BaseException | None = None
+) -> None:
+    """Complete the callers of one sent value, unless they already gave up."""
+    for waiter in waiters:
+        if waiter.done():
+            continue
+        if error is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(error)
+
+
+class FreeKioskCommandCoalescer:
+    """
+    Send commands to one device, keeping only the newest value per endpoint.
+
+    While a POST to an endpoint is in flight, further values for that endpoint
+    replace each other and only the last one is sent once the device answers.
+    Callers whose value was replaced wait for, and share the outcome of, the
+    value sent in its place. A failure does not stop the newer values queued
+    behind it from being sent.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: FreeKioskConfigEntry,
+        client: FreeKioskApiClient,
+    ) -> None:
+        """Set up the coalescer."""
+        self._hass = hass
+        self._entry = entry
+        self._client = client
+        self._pending: dict[
+            str, tuple[dict[str, Any] | None, list[asyncio.Future[None]]]
+        ] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+
+    async def async_send(
+        self,
+        endpoint: str,
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue a value and wait until it, or a newer one, has been sent."""
+        waiter: asyncio.Future[None] = self._hass.loop.create_future()
+        _replaced, waiters = self._pending.get(endpoint, (None, []))
+        self._pending[endpoint] = (payload, [*waiters, waiter])
+        if endpoint not in self._workers:
+            worker = self._entry.async_create_background_task(
+                self._hass,
+                self._async_drain(endpoint),
+                f"{DOMAIN} command {endpoint}",
+            )
+            # Tasks start eagerly and may already be done when returned.
+            if not worker.done():
+                self._workers[endpoint] = worker
+        await waiter
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel every worker; their callers are cancelled as well."""
+        for worker in self._workers.values():
+            worker.cancel()
+
+    async def _async_drain(self, endpoint: str) -> None:
+        """Send the newest queued value until no newer one arrives."""
+        waiters: list[asyncio.Future[None]] = []
+        try:
+            while (queued := self._pending.pop(endpoint, None)) is not None:
+                payload, waiters = queued
+                try:
+                    await self._client.async_post_command(endpoint, payload)
+                except FreeKioskApiClientError as err:
+                    _resolve(waiters, err)
+                else:
+                    _resolve(waiters)
+                waiters = []
+        finally:
+            self._workers.pop(endpoint, None)
+            # Only left over when the worker was cancelled, e.g. on unload.
+            _replaced, queued_waiters = self._pending.pop(endpoint, (None, []))
+            for waiter in (*waiters, *queued_waiters):
+                waiter.cancel()
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.const import CONF_API_KEY
+from homeassistant.components import webhook
+from homeassistant.const import CONF_API_KEY, CONF_WEBHOOK_ID
+from homeassistant.core import callback
+from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import (
@@ -16,7 +19,32 @@ from .api import (
     FreeKioskApiClientCommunicationError,
     FreeKioskApiClientError,
 )
-from .const import CONF_DEVICE_URL, DOMAIN, LOGGER
+from .const import (
+    CONF_DEDICATED_POOL,
+    CONF_DEVICE_URL,
+    CONF_MJPEG_MAX_FPS,
+    CONF_POLLING_MODE,
+    CONF_PUSH,
+    CONF_SLOW_CYCLE_WARNING,
+    CONF_TRANSPORT,
+    DEFAULT_DEDICATED_POOL,
+    DEFAULT_MJPEG_MAX_FPS,
+    DEFAULT_POLLING_MODE,
+    DEFAULT_PUSH,
+    DEFAULT_SLOW_CYCLE_WARNING,
+    DEFAULT_TRANSPORT,
+    DOMAIN,
+    LOGGER,
+    POLLING_MODE_STATUS,
+    POLLING_MODE_TIERED,
+    TRANSPORT_AUTO,
+    TRANSPORT_POLLING,
+    TRANSPORT_SSE,
+    TRANSPORT_WEBSOCKET,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
 class FreeKioskConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -24,6 +52,14 @@ class FreeKioskConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        _config_entry: config_entries.ConfigEntry,
+    ) -> FreeKioskOptionsFlow:
+        """Return the options flow for this handler."""
+        return FreeKioskOptionsFlow()
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
@@ -78,6 +114,34 @@ class FreeKioskConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             raise FreeKioskApiClientCommunicationError
 
 
+class FreeKioskOptionsFlow(config_entries.OptionsFlow):
+    """Handle FreeKiosk options."""
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            # Keep the webhook URL stable across option changes, including
+            # turning push off and on again.
+            if webhook_id := self.config_entry.options.get(CONF_WEBHOOK_ID):
+                user_input[CONF_WEBHOOK_ID] = webhook_id
+            elif user_input[CONF_PUSH]:
+                user_input[CONF_WEBHOOK_ID] = webhook.async_generate_id()
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        placeholders = {"webhook_path": "-"}
+        if webhook_id := options.get(CONF_WEBHOOK_ID):
+            placeholders["webhook_path"] = webhook.async_generate_path(webhook_id)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=_build_options_schema(options),
+            description_placeholders=placeholders,
+        )
+
+
 def _build_user_schema(user_input: dict[str, Any] | None) -> vol.Schema:
     defaults = user_input or {}
     return vol.Schema(
@@ -92,3 +156,66 @@ def _build_user_schema(user_input: dict[str, Any] | None) -> vol.Schema:
             ): cv.string,
         }
     )
+
+
+def _build_options_schema(options: Mapping[str, Any]) -> vol.Schema:
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_POLLING_MODE,
+                default=options.get(CONF_POLLING_MODE, DEFAULT_POLLING_MODE),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[POLLING_MODE_STATUS, POLLING_MODE_TIERED],
+                    translation_key=CONF_POLLING_MODE,
+                )
+            ),
+            vol.Required(
+                CONF_MJPEG_MAX_FPS,
+                default=options.get(CONF_MJPEG_MAX_FPS, DEFAULT_MJPEG_MAX_FPS),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0.1,
+                    max=10,
+                    step=0.1,
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Required(
+                CONF_DEDICATED_POOL,
+                default=options.get(CONF_DEDICATED_POOL, DEFAULT_DEDICATED_POOL),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_PUSH,
+                default=options.get(CONF_PUSH, DEFAULT_PUSH),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_TRANSPORT,
+                default=options.get(CONF_TRANSPORT, DEFAULT_TRANSPORT),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=[
+                        TRANSPORT_POLLING,
+                        TRANSPORT_AUTO,
+                        TRANSPORT_WEBSOCKET,
+                        TRANSPORT_SSE,
+                    ],
+                    translation_key=CONF_TRANSPORT,
+                )
+            ),
+            vol.Required(
+                CONF_SLOW_CYCLE_WARNING,
+                default=options.get(
+                    CONF_SLOW_CYCLE_WARNING, DEFAULT_SLOW_CYCLE_WARNING
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=5000,
+                    step=1,
+                    unit_of_measurement="ms",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+        }
+    )
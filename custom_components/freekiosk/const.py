@@ -9,8 +9,71 @@ LOGGER: Logger = getLogger(__package__)
 DOMAIN = "freekiosk"
 ATTRIBUTION = "Data provided by FreeKiosk."
 DEFAULT_SCAN_INTERVAL = 30
+FAST_SCAN_INTERVAL = 5
+IDLE_SCAN_INTERVAL = 120
+COMMAND_FAST_POLL_DURATION = 60
+CONFIRM_REFRESH_DELAY = 2
+HEALTH_SCAN_INTERVAL = 300
+SLOW_GROUP_SCAN_INTERVAL = 300
+STATUS_RESYNC_INTERVAL = 600
+SCREENSHOT_CACHE_TTL = 2
+SCREENSHOT_RESIZE_CACHE_SIZE = 32
+SCREENSHOT_JPEG_QUALITY = 75
 REST_ENDPOINT_STATUS = "/api/status"
 REST_ENDPOINT_HEALTH = "/api/health"
 REST_ENDPOINT_SCREENSHOT = "/api/screenshot"
+REST_ENDPOINT_SCREEN = "/api/screen"
+REST_ENDPOINT_SENSORS = "/api/sensors"
+REST_ENDPOINT_BATTERY = "/api/battery"
+REST_ENDPOINT_WIFI = "/api/wifi"
+REST_ENDPOINT_STORAGE = "/api/storage"
+REST_ENDPOINT_MEMORY = "/api/memory"
+REST_ENDPOINT_INFO = "/api/info"
 CONF_DEVICE_URL = CONF_URL
 CONF_HEADER_API_KEY = "X-Api-Key"
+CONF_POLLING_MODE = "polling_mode"
+POLLING_MODE_STATUS = "status"
+POLLING_MODE_TIERED = "tiered"
+DEFAULT_POLLING_MODE = POLLING_MODE_STATUS
+CONF_MJPEG_MAX_FPS = "mjpeg_max_fps"
+DEFAULT_MJPEG_MAX_FPS = 1.0
+CONF_DEDICATED_POOL = "dedicated_connection_pool"
+DEFAULT_DEDICATED_POOL = False
+POOL_LIMIT = 200
+POOL_LIMIT_PER_HOST = 4
+POOL_KEEPALIVE_TIMEOUT = 150
+POOL_DNS_CACHE_TTL = 300
+DEFAULT_SERVICE_CONCURRENCY = 10
+FLEET_MAX_CONCURRENT_POLLS = 8
+FLEET_DURATION_SMOOTHING = 0.2
+REQUEST_TIMEOUT = 10
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_MAX_BACKOFF = 900
+CIRCUIT_BACKOFF_JITTER = 0.2
+CIRCUIT_PROBE_TIMEOUT = 3
+CONF_PUSH = "push"
+DEFAULT_PUSH = False
+PUSH_FALLBACK_SCAN_INTERVAL = 300
+PUSH_HEARTBEAT_TIMEOUT = 600
+REST_ENDPOINT_EVENTS = "/api/events"
+REST_ENDPOINT_WEBSOCKET = "/api/ws"
+CONF_TRANSPORT = "transport"
+TRANSPORT_POLLING = "polling"
+TRANSPORT_AUTO = "auto"
+TRANSPORT_WEBSOCKET = "websocket"
+TRANSPORT_SSE = "sse"
+DEFAULT_TRANSPORT = TRANSPORT_POLLING
+STREAM_HEARTBEAT = 30
+STREAM_READ_TIMEOUT = 90
+STREAM_RECONNECT_MIN = 5
+STREAM_RECONNECT_MAX = 300
+STATS_WINDOW = 100
+CONF_SLOW_CYCLE_WARNING = "slow_cycle_warning"
+DEFAULT_SLOW_CYCLE_WARNING = 0
+PROFILE_DEFAULT_CYCLES = 3
+PROFILE_DEFAULT_TIMEOUT = 120
+PROFILE_TOP_FUNCTIONS = 40
+STATUS_STORAGE_VERSION = 1
+STATUS_SAVE_DELAY = 300
+STARTUP_BUDGET = 20
+STARTUP_MAX_CONCURRENT_REFRESHES = 32
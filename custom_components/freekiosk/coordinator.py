@@ -2,46 +2,705 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
+    UNCHANGED,
     FreeKioskApiClientAuthenticationError,
     FreeKioskApiClientError,
+    FreeKioskApiClientUnsupportedError,
 )
+from .const import (
+    CIRCUIT_BACKOFF_JITTER,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_BACKOFF,
+    CIRCUIT_PROBE_TIMEOUT,
+    COMMAND_FAST_POLL_DURATION,
+    CONFIRM_REFRESH_DELAY,
+    DEFAULT_SCAN_INTERVAL,
+    FAST_SCAN_INTERVAL,
+    HEALTH_SCAN_INTERVAL,
+    IDLE_SCAN_INTERVAL,
+    LOGGER,
+    POLLING_MODE_TIERED,
+    PUSH_FALLBACK_SCAN_INTERVAL,
+    PUSH_HEARTBEAT_TIMEOUT,
+    REST_ENDPOINT_BATTERY,
+    REST_ENDPOINT_INFO,
+    REST_ENDPOINT_MEMORY,
+    REST_ENDPOINT_SCREEN,
+    REST_ENDPOINT_SENSORS,
+    REST_ENDPOINT_STORAGE,
+    REST_ENDPOINT_WIFI,
+    SLOW_GROUP_SCAN_INTERVAL,
+    STATUS_RESYNC_INTERVAL,
+)
+from .data import DERIVED_PATHS, FreeKioskStatus
+from .stats import CycleTiming
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from logging import Logger
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .api import UnchangedType
     from .data import FreeKioskConfigEntry
+    from .store import FreeKioskStatusStore
+
+
+def _all_paths(value: Any, prefix: tuple[str, ...]) -> set[tuple[str, ...]]:
+    """Return ``prefix`` and every path below it."""
+    paths = {prefix}
+    if isinstance(value, dict):
+        for key, child in value.items():
+            paths |= _all_paths(child, (*prefix, key))
+    return paths
+
+
+def _diff_paths(
+    old: Any, new: Any, prefix: tuple[str, ...] = ()
+) -> set[tuple[str, ...]]:
+    """Return every path whose value differs between two payloads."""
+    if old == new:
+        return set()
+    changed = {prefix}
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            changed |= _diff_paths(old.get(key), new.get(key), (*prefix, key))
+    else:
+        changed |= _all_paths(old, prefix) | _all_paths(new, prefix)
+    return changed
+
+
+def _with_derived_paths(changed: set[tuple[str, ...]]) -> set[tuple[str, ...]]:
+    """Add the derived values whose inputs are among the ``changed`` paths."""
+    derived = {
+        path
+        for path, inputs in DERIVED_PATHS.items()
+        if path not in changed and any(source in changed for source in inputs)
+    }
+    return changed | derived if derived else changed
+
+
+def _apply_updates(
+    raw: dict[str, Any], updates: Mapping[tuple[str, ...], Any]
+) -> dict[str, Any]:
+    """Return a copy of ``raw`` with the values at ``updates`` replaced."""
+    sections = dict(raw)
+    for path, value in updates.items():
+        target = sections
+        for key in path[:-1]:
+            child = target.get(key)
+            target[key] = child = dict(child) if isinstance(child, dict) else {}
+            target = child
+        target[path[-1]] = value
+    return sections
+
+
+def _merge(raw: dict[str, Any], delta: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a copy of ``raw`` with ``delta`` merged in, object by object."""
+    merged = dict(raw)
+    for key, value in delta.items():
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merged[key] = _merge(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+@dataclass(frozen=True, slots=True)
+class _PollGroup:
+    """A status section that has its own narrow REST endpoint."""
+
+    section: str
+    endpoint: str
+    interval: float = 0
+
+
+# Listener context of entities that show request statistics rather than a
+# status value; they are updated after every refresh.
+STATS_CONTEXT = ("statistics",)
 
+# Sections the coordinator reads itself to pick the adaptive poll interval. The
+# WebView loading flag is only used by the status mode, which always has it.
+_INTERNAL_SECTIONS = frozenset({"screen", "battery"})
 
-class FreeKioskDataUpdateCoordinator(DataUpdateCoordinator):
-    """Coordinator that polls FreeKiosk."""
+# Sections without a narrow endpoint (audio, webview, rotation, autoBrightness)
+# are only refreshed by the periodic full /api/status resync. So are sections
+# whose endpoint the firmware does not offer; while an enabled entity reads one
+# of those, every poll falls back to the full status.
+POLL_GROUPS: tuple[_PollGroup, ...] = (
+    _PollGroup("screen", REST_ENDPOINT_SCREEN),
+    _PollGroup("sensors", REST_ENDPOINT_SENSORS),
+    _PollGroup("battery", REST_ENDPOINT_BATTERY),
+    _PollGroup("wifi", REST_ENDPOINT_WIFI),
+    _PollGroup("storage", REST_ENDPOINT_STORAGE, SLOW_GROUP_SCAN_INTERVAL),
+    _PollGroup("memory", REST_ENDPOINT_MEMORY, SLOW_GROUP_SCAN_INTERVAL),
+    _PollGroup("device", REST_ENDPOINT_INFO, SLOW_GROUP_SCAN_INTERVAL),
+)
+_NARROW_SECTIONS = frozenset(group.section for group in POLL_GROUPS)
+
+
+class FreeKioskDataUpdateCoordinator(DataUpdateCoordinator[FreeKioskStatus]):
+    """
+    Coordinator that polls FreeKiosk.
+
+    The coordinator does not schedule its own refreshes. It only picks the
+    ``poll_interval`` it wants and the fleet scheduler polls it on that cadence.
+
+    Every update is timed and reported to the cycle listeners; with a
+    ``slow_cycle_threshold`` (seconds) updates that hold the event loop longer
+    are logged.
+    """
 
     config_entry: FreeKioskConfigEntry
 
-    async def _async_update_data(self) -> Any:
-        """Fetch latest data."""
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        logger: Logger,
+        name: str,
+        config_entry: FreeKioskConfigEntry,
+        poll_interval: timedelta,
+        polling_mode: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass=hass,
+            logger=logger,
+            name=name,
+            config_entry=config_entry,
+            update_interval=None,
+        )
+        self._poll_interval = poll_interval
+        self.poll_interval_listener: CALLBACK_TYPE | None = None
+        self._failures = 0
+        self._fast_poll_until = 0.0
+        self._last_push = -PUSH_HEARTBEAT_TIMEOUT
+        self._stream_connected = False
+        self._health: Any = None
+        self._health_due = 0.0
+        self._polling_mode = polling_mode
+        self._status_resync_due = 0.0
+        # Digest of the /api/status body and the snapshot parsed from it.
+        self._status_digest: tuple[bytes, FreeKioskStatus] | None = None
+        self._fetched_digest: bytes | None = None
+        self._group_due: dict[str, float] = {}
+        self._unsupported_sections: set[str] = set()
+        self._context_listeners: dict[
+            CALLBACK_TYPE, tuple[CALLBACK_TYPE, tuple[str, ...] | None]
+        ] = {}
+        self._path_watchers: list[tuple[CALLBACK_TYPE, frozenset[tuple[str, ...]]]] = []
+        self._changed_paths: set[tuple[str, ...]] | None = None
+        self._listeners_saw_success = True
+        self.slow_cycle_threshold: float | None = None
+        self.status_store: FreeKioskStatusStore | None = None
+        self._stale = False
+        self._optimistic = False
+        self._cycle: CycleTiming | None = None
+        self._cycle_listeners: list[Callable[[CycleTiming], None]] = []
+        self._confirm_refresh = Debouncer(
+            hass,
+            logger,
+            cooldown=CONFIRM_REFRESH_DELAY,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+    @callback
+    def async_add_listener(
+        self,
+        update_callback: CALLBACK_TYPE,
+        context: Any = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates, remembering the status path each reads."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._context_listeners[remove_listener] = (update_callback, context)
+
+        @callback
+        def remove() -> None:
+            self._context_listeners.pop(remove_listener, None)
+            remove_listener()
+
+        return remove
+
+    @callback
+    def async_watch_paths(
+        self,
+        update_callback: CALLBACK_TYPE,
+        paths: Iterable[tuple[str, ...]],
+    ) -> CALLBACK_TYPE:
+        """
+        Call ``update_callback`` when one of ``paths`` changes.
+
+        Unlike listeners, watchers do not count as readers of their sections,
+        so watching for a value a device may start reporting does not keep
+        tiered polling fetching that section.
+        """
+        watcher = (update_callback, frozenset(paths))
+        self._path_watchers.append(watcher)
+
+        @callback
+        def remove() -> None:
+            self._path_watchers.remove(watcher)
+
+        return remove
+
+    @callback
+    def async_add_cycle_listener(
+        self, cycle_callback: Callable[[CycleTiming], None]
+    ) -> CALLBACK_TYPE:
+        """Call ``cycle_callback`` with the timing of every finished update."""
+        self._cycle_listeners.append(cycle_callback)
+
+        @callback
+        def remove() -> None:
+            self._cycle_listeners.remove(cycle_callback)
+
+        return remove
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the changed listeners and finish timing the update."""
+        started = time.perf_counter()
+        notified = self._async_notify_listeners()
+        cycle = self._cycle or CycleTiming(
+            self.config_entry.entry_id,
+            fetch=None,
+            success=self.last_update_success,
+        )
+        self._cycle = None
+        cycle.fan_out = time.perf_counter() - started
+        cycle.listeners = notified
+        self._async_finish_cycle(cycle)
+        store = self.status_store
+        if (
+            store is not None
+            and self.last_update_success
+            and not self._stale
+            and not self._optimistic
+        ):
+            store.async_save(self.data.raw)
+
+    @callback
+    def _async_notify_listeners(self) -> int:
+        """Notify only the listeners whose status path changed."""
+        changed = self._changed_paths
+        self._changed_paths = None
+        if changed is None or self.last_update_success != self._listeners_saw_success:
+            # Availability changed or the diff is unknown: everyone updates.
+            self._listeners_saw_success = self.last_update_success
+            super().async_update_listeners()
+            for update_callback, _paths in list(self._path_watchers):
+                update_callback()
+            return len(self._listeners)
+        changed = _with_derived_paths(changed)
+        notified = 0
+        for update_callback, context in list(self._context_listeners.values()):
+            if context == STATS_CONTEXT or context in changed:
+                update_callback()
+                notified += 1
+        for update_callback, paths in list(self._path_watchers):
+            if not paths.isdisjoint(changed):
+                update_callback()
+        return notified
+
+    @callback
+    def _async_finish_cycle(self, cycle: CycleTiming) -> None:
+        """Record an update's timing, warn when it was slow and report it."""
+        self.config_entry.runtime_data.client.stats.record_fan_out(cycle.fan_out)
+        threshold = self.slow_cycle_threshold
+        if threshold and cycle.blocking > threshold:
+            LOGGER.warning(
+                "Updating %s blocked the event loop for %.1f ms "
+                "(parsing %.1f ms, notifying %s entities %.1f ms)",
+                self.config_entry.title,
+                cycle.blocking * 1000,
+                cycle.parse * 1000,
+                cycle.listeners,
+                cycle.fan_out * 1000,
+            )
+        for cycle_callback in list(self._cycle_listeners):
+            cycle_callback(cycle)
+
+    @property
+    def poll_interval(self) -> timedelta:
+        """Return how often the scheduler should poll this device."""
+        return self._poll_interval
+
+    @poll_interval.setter
+    def poll_interval(self, value: timedelta) -> None:
+        """Change the poll interval and let the scheduler move the next poll."""
+        if value == self._poll_interval:
+            return
+        self._poll_interval = value
+        if self.poll_interval_listener is not None:
+            self.poll_interval_listener()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending confirmation refresh."""
+        await super().async_shutdown()
+        self._confirm_refresh.async_shutdown()
+
+    async def async_send_command(
+        self,
+        endpoint: str,
+        payload: dict[str, Any] | None = None,
+        *,
+        optimistic: Mapping[tuple[str, ...], Any] | None = None,
+        coalesce: bool = False,
+    ) -> None:
+        """
+        Send a command and show its expected result straight away.
+
+        ``optimistic`` maps status paths to the values the command should
+        produce. They are applied before the POST and a single confirming
+        refresh is scheduled shortly afterwards, shared by every command sent
+        in the meantime, which also reverts the state if the command failed.
+        With ``coalesce`` only the newest value per endpoint is sent while an
+        earlier one is still in flight.
+        """
+        runtime_data = self.config_entry.runtime_data
+        if optimistic:
+            self.async_apply_optimistic(optimistic)
+        try:
+            if coalesce:
+                await runtime_data.commands.async_send(endpoint, payload)
+            else:
+                await runtime_data.client.async_post_command(endpoint, payload)
+        finally:
+            self.async_note_command()
+            await self._confirm_refresh.async_call()
+
+    @callback
+    def async_apply_optimistic(self, updates: Mapping[tuple[str, ...], Any]) -> None:
+        """
+        Merge expected values into the current data and notify listeners.
+
+        Availability is left alone: an unavailable device stays unavailable
+        rather than showing values it may never take. The snapshot is not
+        persisted until a refresh has confirmed it.
+        """
+        if self.data is None or not self.last_update_success:
+            return
+        sections = _apply_updates(self.data.raw, updates)
+        changed = _diff_paths(self.data.raw, sections)
+        if not changed:
+            return
+        self._changed_paths = changed
+        self._optimistic = True
+        self.data = FreeKioskStatus.from_dict(sections, self.data, changed)
+        self.async_update_listeners()
+
+    @property
+    def push_active(self) -> bool:
+        """Return whether the device pushes its status by itself."""
+        return (
+            self._stream_connected
+            or time.monotonic() - self._last_push < PUSH_HEARTBEAT_TIMEOUT
+        )
+
+    @callback
+    def async_set_stream_connected(self, *, connected: bool) -> None:
+        """Track the event stream and pick the poll interval to match."""
+        self._stream_connected = connected
+        if self.data is not None:
+            self.poll_interval = self._next_poll_interval(self.data)
+
+    @callback
+    def async_apply_push(self, delta: Mapping[str, Any]) -> None:
+        """
+        Merge a status delta pushed by the device and notify listeners.
+
+        ``delta`` is a full ``/api/status`` envelope or any subset of its
+        ``data`` sections.
+        """
+        if isinstance(data := delta.get("data"), dict):
+            delta = data
+        self._last_push = time.monotonic()
+        self._async_record_success()
+        if self.data is None:
+            return
+        sections = _merge(self.data.raw, delta)
+        changed = _diff_paths(self.data.raw, sections)
+        status = self.data
+        if changed or not self.last_update_success:
+            self._changed_paths = changed
+            status = FreeKioskStatus.from_dict(sections, self.data, changed)
+            self.async_set_updated_data(status)
+        self.poll_interval = self._next_poll_interval(status)
+
+    @callback
+    def async_note_command(self) -> None:
+        """Poll quickly for a while after a command was sent to the device."""
+        self._fast_poll_until = time.monotonic() + COMMAND_FAST_POLL_DURATION
+        # Commands can touch sections that only the full status payload carries.
+        self._status_resync_due = 0.0
+        if not self.circuit_open and not self.push_active:
+            self.poll_interval = timedelta(seconds=FAST_SCAN_INTERVAL)
+
+    @callback
+    def async_set_cached_data(self, raw: dict[str, Any]) -> None:
+        """
+        Start from a persisted status until the first refresh replaces it.
+
+        Listeners are not notified; entities created afterwards read the
+        snapshot and report it as stale.
+        """
+        self.data = FreeKioskStatus.from_dict(raw)
+        self._stale = True
+
+    @callback
+    def async_set_unavailable(self) -> None:
+        """Mark a device that has not answered yet unavailable."""
+        if self.data is None:
+            # Entities read the status; an empty one stands in until it arrives.
+            self.data = FreeKioskStatus()
+        self.last_update_success = False
+
+    @property
+    def stale(self) -> bool:
+        """Return whether the data was restored and not yet refreshed."""
+        return self._stale
+
+    @property
+    def circuit_open(self) -> bool:
+        """Return whether the device failed often enough to back off."""
+        return self._failures >= CIRCUIT_FAILURE_THRESHOLD
+
+    @callback
+    def _async_record_failure(self) -> None:
+        """Count a failed poll and back off exponentially once the circuit opens."""
+        self._failures += 1
+        if not self.circuit_open:
+            return
+        if self._failures == CIRCUIT_FAILURE_THRESHOLD:
+            LOGGER.warning(
+                "%s is unreachable, backing off and probing /api/health until "
+                "it responds again",
+                self.config_entry.title,
+            )
+        exponent = self._failures - CIRCUIT_FAILURE_THRESHOLD
+        delay = min(CIRCUIT_MAX_BACKOFF, DEFAULT_SCAN_INTERVAL * 2**exponent)
+        spread = CIRCUIT_BACKOFF_JITTER
+        jitter = random.uniform(1 - spread, 1 + spread)  # noqa: S311
+        self.poll_interval = timedelta(seconds=delay * jitter)
+
+    @callback
+    def _async_record_success(self) -> None:
+        """Close the circuit after a successful poll."""
+        if self.circuit_open:
+            LOGGER.info("%s is reachable again", self.config_entry.title)
+        self._failures = 0
+
+    async def _async_probe(self) -> None:
+        """Check a backed-off device with a cheap health request."""
+        client = self.config_entry.runtime_data.client
         try:
-            status = await self.config_entry.runtime_data.client.async_get_status()
-            if isinstance(status, dict):
-                data = status.get("data")
-                if not isinstance(data, dict):
-                    data = {}
-                try:
-                    health = (
-                        await self.config_entry.runtime_data.client.async_get_health()
-                    )
-                except FreeKioskApiClientError:
-                    health = None
-                if isinstance(health, dict):
-                    data["health"] = health.get("data", health)
-                status["data"] = data
-            result = status
+            await client.async_get_health(request_timeout=CIRCUIT_PROBE_TIMEOUT)
         except FreeKioskApiClientAuthenticationError as err:
             raise ConfigEntryAuthFailed(err) from err
         except FreeKioskApiClientError as err:
+            self._async_record_failure()
             raise UpdateFailed(err) from err
-        else:
-            return result
+
+    def _next_poll_interval(self, status: FreeKioskStatus) -> timedelta:
+        """Pick the next poll interval from the state that was just read."""
+        if self.push_active:
+            # The device reports changes itself; polling is only a safety net.
+            return timedelta(seconds=PUSH_FALLBACK_SCAN_INTERVAL)
+        if time.monotonic() < self._fast_poll_until or (
+            # Tiered polls only re-read the WebView on the occasional full
+            # resync, so a stale loading flag would pin the fast interval.
+            status.webview.loading and self._polling_mode != POLLING_MODE_TIERED
+        ):
+            return timedelta(seconds=FAST_SCAN_INTERVAL)
+        if (
+            status.screen.on is False
+            or status.screen.screensaver_active
+            or status.battery.on_battery
+        ):
+            return timedelta(seconds=IDLE_SCAN_INTERVAL)
+        return timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+    async def _async_fetch_health(self) -> Any:
+        """Return the cached health payload, refreshing it when it is due."""
+        now = time.monotonic()
+        if now < self._health_due:
+            return self._health
+        self._health_due = now + HEALTH_SCAN_INTERVAL
+        try:
+            health = await self.config_entry.runtime_data.client.async_get_health()
+        except FreeKioskApiClientError:
+            health = None
+        self._health = health.get("data", health) if isinstance(health, dict) else None
+        return self._health
+
+    @property
+    def required_sections(self) -> set[str]:
+        """Return the status sections read by enabled entities."""
+        return {
+            context[0]
+            for context in self.async_contexts()
+            if context and context != STATS_CONTEXT
+        } | _INTERNAL_SECTIONS
+
+    async def _async_fetch_status(self) -> dict[str, Any] | UnchangedType:
+        """
+        Fetch the data section of the full /api/status payload.
+
+        Returns ``UNCHANGED`` without decoding when the body matches the one
+        the current data was parsed from. Optimistic updates, pushes and tiered
+        merges replace the data, so they invalidate the match by themselves.
+        """
+        client = self.config_entry.runtime_data.client
+        previous = self._status_digest
+        if previous is not None and previous[1] is not self.data:
+            previous = None
+        digest, status = await client.async_get_status_if_changed(
+            None if previous is None else previous[0]
+        )
+        if status is UNCHANGED:
+            return UNCHANGED
+        self._fetched_digest = digest
+        data = status.get("data")
+        return data if isinstance(data, dict) else {}
+
+    async def _async_fetch_tiered(self) -> dict[str, Any]:
+        """Fetch due section groups and merge them into the previous payload."""
+        client = self.config_entry.runtime_data.client
+        now = time.monotonic()
+        required = self.required_sections
+        # Sections without a narrow endpoint can only come from a full resync,
+        # so skip the periodic one entirely when no enabled entity reads them.
+        needs_resync = not required.issubset(_NARROW_SECTIONS)
+        if (
+            self.data is None
+            or (needs_resync and now >= self._status_resync_due)
+            or not required.isdisjoint(self._unsupported_sections)
+        ):
+            sections = await self._async_fetch_status()
+            if sections is UNCHANGED:
+                sections = dict(self.data.raw)
+            self._status_resync_due = now + STATUS_RESYNC_INTERVAL
+            self._group_due = {
+                group.section: now + group.interval for group in POLL_GROUPS
+            }
+            return sections
+
+        due = [
+            group
+            for group in POLL_GROUPS
+            if group.section in required
+            and now >= self._group_due.get(group.section, 0)
+        ]
+        responses = await asyncio.gather(
+            *(client.async_get(group.endpoint) for group in due),
+            return_exceptions=True,
+        )
+        sections = dict(self.data.raw)
+        errors: list[FreeKioskApiClientError] = []
+        for group, response in zip(due, responses, strict=True):
+            if isinstance(response, FreeKioskApiClientUnsupportedError):
+                LOGGER.debug(
+                    "%s does not offer %s, polling the full status instead",
+                    self.config_entry.title,
+                    group.endpoint,
+                )
+                self._unsupported_sections.add(group.section)
+                continue
+            if isinstance(response, FreeKioskApiClientAuthenticationError):
+                raise response
+            if isinstance(response, FreeKioskApiClientError):
+                # Keep the previous section; the group is retried next poll.
+                errors.append(response)
+                continue
+            if isinstance(response, BaseException):
+                raise response
+            if isinstance(response, dict):
+                sections[group.section] = response.get("data", response)
+            self._group_due[group.section] = now + group.interval
+        if errors and len(errors) == len(due):
+            raise errors[0]
+        if not required.isdisjoint(self._unsupported_sections):
+            return await self._async_fetch_tiered()
+        return sections
+
+    async def _async_update_data(self) -> FreeKioskStatus:
+        """Fetch latest data and record how long the cycle took."""
+        started = time.perf_counter()
+        cycle = self._cycle = CycleTiming(self.config_entry.entry_id, fetch=0.0)
+        try:
+            return await self._async_fetch_data(cycle)
+        except asyncio.CancelledError:
+            self._cycle = None
+            raise
+        except Exception:
+            cycle.success = False
+            raise
+        finally:
+            cycle.fetch = time.perf_counter() - started
+            self.config_entry.runtime_data.client.stats.record_cycle(cycle.fetch)
+            if not cycle.success and not self.last_update_success:
+                # Listeners only hear about the first failure in a row. Any
+                # later one gets no fan-out to finish it, so it ends here.
+                self._cycle = None
+                self._async_finish_cycle(cycle)
+
+    async def _async_fetch_data(self, cycle: CycleTiming) -> FreeKioskStatus:
+        """Fetch, merge and parse the latest status."""
+        if self.circuit_open:
+            await self._async_probe()
+        try:
+            sections, health = await asyncio.gather(
+                self._async_fetch_tiered()
+                if self._polling_mode == POLLING_MODE_TIERED
+                else self._async_fetch_status(),
+                self._async_fetch_health(),
+            )
+        except FreeKioskApiClientAuthenticationError as err:
+            raise ConfigEntryAuthFailed(err) from err
+        except FreeKioskApiClientError as err:
+            self._async_record_failure()
+            raise UpdateFailed(err) from err
+
+        self._async_record_success()
+        # A restored snapshot is replaced wholesale so every entity drops its
+        # stale marker, even where the value did not change.
+        previous = None if self._stale else self.data
+        self._stale = False
+        self._optimistic = False
+        if sections is UNCHANGED:
+            # Unchanged status body: skip decoding, diffing and notifying. It
+            # only matches the digest of the current data, so that is set.
+            if previous is not None and (
+                health is None or previous.raw.get("health") == health
+            ):
+                self._changed_paths = set()
+                self.poll_interval = self._next_poll_interval(previous)
+                return previous
+            sections = dict(self.data.raw)
+        if health is not None:
+            sections["health"] = health
+        parse_started = time.perf_counter()
+        changed = None if previous is None else _diff_paths(previous.raw, sections)
+        self._changed_paths = changed
+        result = FreeKioskStatus.from_dict(sections, previous, changed)
+        cycle.parse = time.perf_counter() - parse_started
+        if self._fetched_digest is not None:
+            self._status_digest = (self._fetched_digest, result)
+            self._fetched_digest = None
+        self.poll_interval = self._next_poll_interval(result)
+        return result
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from homeassistant.loader import Integration
 
     from .api import FreeKioskApiClient
+    from .commands import FreeKioskCommandCoalescer
     from .coordinator import FreeKioskDataUpdateCoordinator
 
 
@@ -20,7 +21,352 @@ class FreeKioskData:
 
     client: FreeKioskApiClient
     coordinator: FreeKioskDataUpdateCoordinator
+    commands: FreeKioskCommandCoalescer
     integration: Integration
 
 
 FreeKioskConfigEntry = ConfigEntry[FreeKioskData]
+
+_UNPLUGGED_VALUES = (None, "", "none", "unplugged", False)
+
+
+def _used_percent(total: Any, used: Any) -> Any:
+    """Derive a used percentage when the device does not report one."""
+    if not isinstance(total, int | float) or not isinstance(used, int | float):
+        return None
+    if total <= 0:
+        return None
+    return round(used / total * 100)
+
+
+def _used(total: Any, available: Any) -> Any:
+    """Derive a used amount when the device does not report one."""
+    if not isinstance(total, int | float) or not isinstance(available, int | float):
+        return None
+    return total - available
+
+
+def _signal_level(rssi: Any) -> Any:
+    """Map an RSSI in dBm onto 0-100 % the same way Android does."""
+    if not isinstance(rssi, int | float):
+        return None
+    return max(0, min(100, round(2 * (rssi + 100))))
+
+
+# Values computed when the device omits them, and the paths they are computed
+# from. Their entities listen on the derived path, which only appears in a
+# status diff when the device reports it, so a change to an input counts as a
+# change of the derived value as well.
+DERIVED_PATHS: dict[tuple[str, ...], tuple[tuple[str, ...], ...]] = {
+    ("wifi", "signalLevel"): (("wifi", "signalStrength"),),
+    ("storage", "usedMB"): (("storage", "totalMB"), ("storage", "availableMB")),
+    ("storage", "usedPercent"): (
+        ("storage", "totalMB"),
+        ("storage", "usedMB"),
+        ("storage", "availableMB"),
+    ),
+    ("memory", "usedMB"): (("memory", "totalMB"), ("memory", "availableMB")),
+    ("memory", "usedPercent"): (
+        ("memory", "totalMB"),
+        ("memory", "usedMB"),
+        ("memory", "availableMB"),
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BatteryStatus:
+    """Battery section of the status payload."""
+
+    level: Any = None
+    charging: bool = False
+    plugged: Any = None
+    on_battery: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BatteryStatus:
+        """Parse the battery section."""
+        charging = data.get("charging") is True
+        plugged = data.get("plugged")
+        return cls(
+            level=data.get("level"),
+            charging=charging,
+            plugged=plugged,
+            on_battery=bool(data) and not charging and plugged in _UNPLUGGED_VALUES,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ScreenStatus:
+    """Screen section of the status payload."""
+
+    on: bool | None = None
+    brightness: Any = None
+    screensaver_active: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ScreenStatus:
+        """Parse the screen section."""
+        on = data.get("on")
+        return cls(
+            on=on if isinstance(on, bool) else None,
+            brightness=data.get("brightness"),
+            screensaver_active=data.get("screensaverActive") is True,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AudioStatus:
+    """Audio section of the status payload."""
+
+    volume: Any = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AudioStatus:
+        """Parse the audio section."""
+        return cls(volume=data.get("volume"))
+
+
+@dataclass(frozen=True, slots=True)
+class WebViewStatus:
+    """WebView section of the status payload."""
+
+    current_url: str | None = None
+    can_go_back: bool = False
+    loading: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WebViewStatus:
+        """Parse the WebView section."""
+        return cls(
+            current_url=data.get("currentUrl"),
+            can_go_back=data.get("canGoBack") is True,
+            loading=data.get("loading") is True,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceStatus:
+    """Device section of the status payload."""
+
+    ip: Any = None
+    hostname: Any = None
+    version: Any = None
+    is_device_owner: bool = False
+    kiosk_mode: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DeviceStatus:
+        """Parse the device section."""
+        return cls(
+            ip=data.get("ip"),
+            hostname=data.get("hostname"),
+            version=data.get("version"),
+            is_device_owner=data.get("isDeviceOwner") is True,
+            kiosk_mode=data.get("kioskMode") is True,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WifiStatus:
+    """Wi-Fi section of the status payload."""
+
+    connected: bool = False
+    ssid: Any = None
+    signal_strength: Any = None
+    signal_level: Any = None
+    link_speed: Any = None
+    frequency: Any = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WifiStatus:
+        """Parse the Wi-Fi section."""
+        signal_strength = data.get("signalStrength")
+        signal_level = data.get("signalLevel")
+        return cls(
+            connected=data.get("connected") is True,
+            ssid=data.get("ssid"),
+            signal_strength=signal_strength,
+            signal_level=(
+                _signal_level(signal_strength) if signal_level is None else signal_level
+            ),
+            link_speed=data.get("linkSpeed"),
+            frequency=data.get("frequency"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RotationStatus:
+    """URL rotation section of the status payload."""
+
+    enabled: bool = False
+    interval: Any = None
+    current_index: Any = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RotationStatus:
+        """Parse the rotation section."""
+        return cls(
+            enabled=data.get("enabled") is True,
+            interval=data.get("interval"),
+            current_index=data.get("currentIndex"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class SensorsStatus:
+    """Hardware sensors section of the status payload."""
+
+    light: Any = None
+    proximity: Any = None
+    accelerometer_x: Any = None
+    accelerometer_y: Any = None
+    accelerometer_z: Any = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SensorsStatus:
+        """Parse the sensors section."""
+        accelerometer = data.get("accelerometer")
+        if not isinstance(accelerometer, dict):
+            accelerometer = {}
+        return cls(
+            light=data.get("light"),
+            proximity=data.get("proximity"),
+            accelerometer_x=accelerometer.get("x"),
+            accelerometer_y=accelerometer.get("y"),
+            accelerometer_z=accelerometer.get("z"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AutoBrightnessStatus:
+    """Auto brightness section of the status payload."""
+
+    enabled: bool = False
+    min: Any = None
+    max: Any = None
+    current_light_level: Any = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AutoBrightnessStatus:
+        """Parse the auto brightness section."""
+        return cls(
+            enabled=data.get("enabled") is True,
+            min=data.get("min"),
+            max=data.get("max"),
+            current_light_level=data.get("currentLightLevel"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StorageStatus:
+    """Storage section of the status payload."""
+
+    total_mb: Any = None
+    available_mb: Any = None
+    used_mb: Any = None
+    used_percent: Any = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StorageStatus:
+        """Parse the storage section."""
+        total = data.get("totalMB")
+        used = data.get("usedMB")
+        if used is None:
+            used = _used(total, data.get("availableMB"))
+        used_percent = data.get("usedPercent")
+        return cls(
+            total_mb=total,
+            available_mb=data.get("availableMB"),
+            used_mb=used,
+            used_percent=(
+                _used_percent(total, used) if used_percent is None else used_percent
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryStatus:
+    """Memory section of the status payload."""
+
+    total_mb: Any = None
+    available_mb: Any = None
+    used_mb: Any = None
+    used_percent: Any = None
+    low_memory: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MemoryStatus:
+        """Parse the memory section."""
+        total = data.get("totalMB")
+        used = data.get("usedMB")
+        if used is None:
+            used = _used(total, data.get("availableMB"))
+        used_percent = data.get("usedPercent")
+        return cls(
+            total_mb=total,
+            available_mb=data.get("availableMB"),
+            used_mb=used,
+            used_percent=(
+                _used_percent(total, used) if used_percent is None else used_percent
+            ),
+            low_memory=data.get("lowMemory") is True,
+        )
+
+
+# (payload key, snapshot attribute, section type)
+_SECTIONS: tuple[tuple[str, str, Any], ...] = (
+    ("battery", "battery", BatteryStatus),
+    ("screen", "screen", ScreenStatus),
+    ("audio", "audio", AudioStatus),
+    ("webview", "webview", WebViewStatus),
+    ("device", "device", DeviceStatus),
+    ("wifi", "wifi", WifiStatus),
+    ("rotation", "rotation", RotationStatus),
+    ("sensors", "sensors", SensorsStatus),
+    ("autoBrightness", "auto_brightness", AutoBrightnessStatus),
+    ("storage", "storage", StorageStatus),
+    ("memory", "memory", MemoryStatus),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FreeKioskStatus:
+    """Parsed snapshot of the /api/status data payload."""
+
+    battery: BatteryStatus = field(default_factory=BatteryStatus)
+    screen: ScreenStatus = field(default_factory=ScreenStatus)
+    audio: AudioStatus = field(default_factory=AudioStatus)
+    webview: WebViewStatus = field(default_factory=WebViewStatus)
+    device: DeviceStatus = field(default_factory=DeviceStatus)
+    wifi: WifiStatus = field(default_factory=WifiStatus)
+    rotation: RotationStatus = field(default_factory=RotationStatus)
+    sensors: SensorsStatus = field(default_factory=SensorsStatus)
+    auto_brightness: AutoBrightnessStatus = field(default_factory=AutoBrightnessStatus)
+    storage: StorageStatus = field(default_factory=StorageStatus)
+    memory: MemoryStatus = field(default_factory=MemoryStatus)
+    raw: dict[str, Any] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def from_dict(
+        cls,
+        raw: dict[str, Any],
+        previous: FreeKioskStatus | None = None,
+        changed: set[tuple[str, ...]] | None = None,
+    ) -> FreeKioskStatus:
+        """
+        Parse the data payload into a snapshot.
+
+        When ``previous`` and the ``changed`` paths are known, sections that
+        did not change are reused instead of being parsed again.
+        """
+        sections: dict[str, Any] = {}
+        for key, attr, section_type in _SECTIONS:
+            if previous is not None and changed is not None and (key,) not in changed:
+                sections[attr] = getattr(previous, attr)
+                continue
+            value = raw.get(key)
+            sections[attr] = section_type.from_dict(
+                value if isinstance(value, dict) else {}
+            )
+        return cls(**sections, raw=raw)
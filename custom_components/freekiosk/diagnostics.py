@@ -0,0 +1,44 @@
+"""Diagnostics support for FreeKiosk."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_API_KEY, CONF_WEBHOOK_ID
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import FreeKioskConfigEntry
+
+TO_REDACT = {CONF_API_KEY, CONF_WEBHOOK_ID, "ip", "ssid", "hostname", "currentUrl"}
+
+
+async def async_get_config_entry_diagnostics(
+    _hass: HomeAssistant,
+    entry: FreeKioskConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime = entry.runtime_data
+    coordinator = runtime.coordinator
+    status = coordinator.data
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "poll_interval": coordinator.poll_interval.total_seconds(),
+            "circuit_open": coordinator.circuit_open,
+            "push_active": coordinator.push_active,
+            "stale": coordinator.stale,
+            "status_saved_at": (
+                coordinator.status_store.saved_at if coordinator.status_store else None
+            ),
+            "required_sections": sorted(coordinator.required_sections),
+        },
+        "statistics": runtime.client.stats.as_dict(),
+        "status": async_redact_data(status.raw, TO_REDACT) if status else None,
+    }
@@ -2,14 +2,99 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION, CONF_DEVICE_URL, DOMAIN
 from .coordinator import FreeKioskDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .data import FreeKioskConfigEntry, FreeKioskStatus
+
+_T = TypeVar("_T")
+
+
+def status_reports(raw: Mapping[str, Any], path: tuple[str, ...]) -> bool:
+    """Return whether the status payload holds a value at ``path``."""
+    value: Any = raw
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return False
+        value = value[key]
+    return value is not None
+
+
+def _description_paths(description: Any) -> tuple[tuple[str, ...], ...]:
+    """Return the paths whose presence means a description is supported."""
+    derived_from = getattr(description, "derived_from", None)
+    return (description.path, derived_from) if derived_from else (description.path,)
+
+
+@callback
+def async_add_reported_entities(
+    entry: FreeKioskConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    candidates: Iterable[_T],
+    create: Callable[[_T], Entity],
+    paths: Callable[[_T], Iterable[tuple[str, ...]]] = _description_paths,
+) -> None:
+    """
+    Add an entity for every candidate whose data the device reports.
+
+    Tablets, TV boxes and phones report different sections, so entities whose
+    paths are missing from the status are not created. A single path watcher
+    waits for the missing ones and adds each entity once the device starts
+    reporting one of its paths. Watchers are not listeners, so waiting does
+    not make tiered polling fetch the sections involved.
+    """
+    coordinator = entry.runtime_data.coordinator
+    pending: list[_T] = []
+
+    def _reported(candidate: _T) -> bool:
+        raw = coordinator.data.raw
+        return any(status_reports(raw, path) for path in paths(candidate))
+
+    entities = []
+    for candidate in candidates:
+        if _reported(candidate):
+            entities.append(create(candidate))
+        else:
+            pending.append(candidate)
+    async_add_entities(entities)
+    if not pending:
+        return
+
+    @callback
+    def _async_add_reported() -> None:
+        added = [candidate for candidate in pending if _reported(candidate)]
+        if not added:
+            return
+        for candidate in added:
+            pending.remove(candidate)
+        if not pending:
+            remove_watcher()
+        async_add_entities(create(candidate) for candidate in added)
+
+    remove_watcher = coordinator.async_watch_paths(
+        _async_add_reported,
+        {path for candidate in pending for path in paths(candidate)},
+    )
+
+    @callback
+    def _async_stop_watching() -> None:
+        if pending:
+            remove_watcher()
+
+    entry.async_on_unload(_async_stop_watching)
+
 
 class FreeKioskEntity(CoordinatorEntity[FreeKioskDataUpdateCoordinator]):
     """Entity representing the FreeKiosk device data."""
@@ -20,9 +105,16 @@ class FreeKioskEntity(CoordinatorEntity[FreeKioskDataUpdateCoordinator]):
         self,
         coordinator: FreeKioskDataUpdateCoordinator,
         unique_id: str | None = None,
+        path: tuple[str, ...] | None = None,
     ) -> None:
-        """Initialize base entity."""
-        super().__init__(coordinator)
+        """
+        Initialize base entity.
+
+        ``path`` is the location of the entity's value in the status payload.
+        It is registered as the listener context so the coordinator knows
+        which status sections enabled entities read.
+        """
+        super().__init__(coordinator, context=path or None)
         if unique_id:
             self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{unique_id}"
         self._attr_device_info = DeviceInfo(
@@ -31,17 +123,29 @@ class FreeKioskEntity(CoordinatorEntity[FreeKioskDataUpdateCoordinator]):
             manufacturer="FreeKiosk",
         )
 
-    def _get_status(self) -> dict[str, Any]:
-        """Return the nested data payload."""
-        return self.coordinator.data.get("data", {}) or {}
-
-    def _get_path(self, *path: str, default: Any = None) -> Any:
-        """Safely traverse nested status data."""
-        result: Any = self._get_status()
-        for segment in path:
-            if not isinstance(result, dict):
-                return default
-            result = result.get(segment, default)
-            if result is default:
-                return default
-        return result
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Mark values restored from the last run until the device answers."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
+
+    def _get_status(self) -> FreeKioskStatus:
+        """Return the parsed status snapshot."""
+        return self.coordinator.data
+
+    async def _async_send_command(
+        self,
+        endpoint: str,
+        payload: dict[str, Any] | None = None,
+        *,
+        optimistic: Mapping[tuple[str, ...], Any] | None = None,
+        coalesce: bool = False,
+    ) -> None:
+        """Send a command to the device, see FreeKioskDataUpdateCoordinator."""
+        await self.coordinator.async_send_command(
+            endpoint,
+            payload,
+            optimistic=optimistic,
+            coalesce=coalesce,
+        )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from homeassistant.components.number import (
     NumberEntity,
@@ -11,7 +11,7 @@ from homeassistant.components.number import (
     NumberMode,
 )
 
-from .entity import FreeKioskEntity
+from .entity import FreeKioskEntity, async_add_reported_entities
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -20,14 +20,15 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import FreeKioskDataUpdateCoordinator
-    from .data import FreeKioskConfigEntry
+    from .data import FreeKioskConfigEntry, FreeKioskStatus
 
 
 @dataclass
 class FreeKioskNumberDescription(NumberEntityDescription):
     """Describes a FreeKiosk number entity."""
 
-    value_fn: Callable[[dict[str, Any]], float | None] = lambda _: None  # type: ignore[assignment]
+    path: tuple[str, ...] = ()
+    value_fn: Callable[[FreeKioskStatus], float | None] = lambda _: None  # type: ignore[assignment]
     set_endpoint: str = ""
 
 
@@ -41,7 +42,8 @@ NUMBER_DESCRIPTIONS: tuple[FreeKioskNumberDescription, ...] = (
         native_step=1,
         native_unit_of_measurement="%",
         mode=NumberMode.SLIDER,
-        value_fn=lambda data: data.get("screen", {}).get("brightness"),
+        path=("screen", "brightness"),
+        value_fn=lambda data: data.screen.brightness,
         set_endpoint="/api/brightness",
     ),
     FreeKioskNumberDescription(
@@ -53,7 +55,8 @@ NUMBER_DESCRIPTIONS: tuple[FreeKioskNumberDescription, ...] = (
         native_step=1,
         native_unit_of_measurement="%",
         mode=NumberMode.SLIDER,
-        value_fn=lambda data: data.get("audio", {}).get("volume"),
+        path=("audio", "volume"),
+        value_fn=lambda data: data.audio.volume,
         set_endpoint="/api/volume",
     ),
 )
@@ -65,12 +68,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up FreeKiosk number entities."""
-    async_add_entities(
-        FreeKioskNumber(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=description,
-        )
-        for description in NUMBER_DESCRIPTIONS
+    coordinator = entry.runtime_data.coordinator
+    async_add_reported_entities(
+        entry,
+        async_add_entities,
+        NUMBER_DESCRIPTIONS,
+        lambda description: FreeKioskNumber(coordinator, description),
     )
 
 
@@ -83,7 +86,11 @@ class FreeKioskNumber(FreeKioskEntity, NumberEntity):
         entity_description: FreeKioskNumberDescription,
     ) -> None:
         """Initialize the number entity."""
-        super().__init__(coordinator, unique_id=f"number_{entity_description.key}")
+        super().__init__(
+            coordinator,
+            unique_id=f"number_{entity_description.key}",
+            path=entity_description.path,
+        )
         self.entity_description = entity_description
 
     @property
@@ -100,8 +107,9 @@ class FreeKioskNumber(FreeKioskEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Update the value on the FreeKiosk device."""
         payload = {"value": round(value)}
-        await self.coordinator.config_entry.runtime_data.client.async_post_command(
+        await self._async_send_command(
             self.entity_description.set_endpoint,
             payload,
+            optimistic={self.entity_description.path: payload["value"]},
+            coalesce=True,
         )
-        await self.coordinator.async_request_refresh()
@@ -0,0 +1,153 @@
+"""On-demand profiling of FreeKiosk update cycles."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import json
+import pstats
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN, PROFILE_TOP_FUNCTIONS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import FreeKioskDataUpdateCoordinator
+    from .stats import CycleTiming
+
+_PROFILE_LOCK_KEY = "profile_lock"
+
+
+@dataclass
+class _CycleCollector:
+    """Collect cycle timings until every coordinator polled often enough."""
+
+    cycles: int
+    pending: set[str]
+    timings: list[CycleTiming] = field(default_factory=list)
+    polls: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def __call__(self, cycle: CycleTiming) -> None:
+        self.timings.append(cycle)
+        if cycle.fetch is None:
+            return
+        self.polls[cycle.entry_id] += 1
+        if self.polls[cycle.entry_id] >= self.cycles:
+            self.pending.discard(cycle.entry_id)
+            if not self.pending:
+                self.done.set()
+
+
+async def async_profile_cycles(
+    hass: HomeAssistant,
+    coordinators: list[FreeKioskDataUpdateCoordinator],
+    cycles: int,
+    max_duration: float,
+) -> dict[str, Any]:
+    """
+    Profile the event loop until every coordinator finished ``cycles`` polls.
+
+    The profiler sees everything the event loop runs meanwhile, FreeKiosk's
+    updates, listener fan-out and state writes as well as other integrations.
+    It stops after ``max_duration`` seconds at the latest, so devices that are
+    offline or backing off cannot keep it running. The ``.prof`` file and a
+    JSON summary are written to the configuration directory.
+    """
+    lock: asyncio.Lock = hass.data.setdefault(DOMAIN, {}).setdefault(
+        _PROFILE_LOCK_KEY, asyncio.Lock()
+    )
+    if lock.locked():
+        msg = "A FreeKiosk profile is already being recorded"
+        raise HomeAssistantError(msg)
+    async with lock:
+        collector = _CycleCollector(
+            cycles, {coordinator.config_entry.entry_id for coordinator in coordinators}
+        )
+        removers = [
+            coordinator.async_add_cycle_listener(collector)
+            for coordinator in coordinators
+        ]
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as err:
+            for remove in removers:
+                remove()
+            msg = f"Another profiler is already running: {err}"
+            raise HomeAssistantError(msg) from err
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(max_duration):
+                await collector.done.wait()
+        except TimeoutError:
+            pass
+        finally:
+            profile.disable()
+            for remove in removers:
+                remove()
+        duration = time.monotonic() - started
+
+    stamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+    base = Path(hass.config.path(f"freekiosk_profile_{stamp}"))
+    summary = {
+        "duration_s": round(duration, 3),
+        "cycles_requested": cycles,
+        "complete": not collector.pending,
+        "incomplete_entries": sorted(collector.pending),
+        "polls": dict(collector.polls),
+        "cycles": [timing.as_dict() for timing in collector.timings],
+    }
+    return await hass.async_add_executor_job(_write_profile, profile, base, summary)
+
+
+def _function_rows(stats: pstats.Stats) -> list[dict[str, Any]]:
+    """Return one row per profiled function, slowest cumulative time first."""
+    rows = [
+        {
+            "function": f"{Path(filename).name}:{line}({name})",
+            "file": filename,
+            "calls": calls,
+            "total_ms": round(total * 1000, 3),
+            "cumulative_ms": round(cumulative * 1000, 3),
+        }
+        for (filename, line, name), (
+            _primitive,
+            calls,
+            total,
+            cumulative,
+            _callers,
+        ) in stats.stats.items()  # type: ignore[attr-defined]
+    ]
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows
+
+
+def _write_profile(
+    profile: cProfile.Profile, base: Path, summary: dict[str, Any]
+) -> dict[str, Any]:
+    """Write the raw profile and its JSON summary, return the summary."""
+    prof_path = base.with_suffix(".prof")
+    json_path = base.with_suffix(".json")
+    profile.dump_stats(prof_path)
+    stats = pstats.Stats(profile)
+    rows = _function_rows(stats)
+    package = str(Path(__file__).parent)
+    own = [row for row in rows if row["file"].startswith(package)]
+    report = {
+        "profile": str(prof_path),
+        "summary": str(json_path),
+        **summary,
+        "top_functions": rows[:PROFILE_TOP_FUNCTIONS],
+        "freekiosk_functions": own[:PROFILE_TOP_FUNCTIONS],
+    }
+    json_path.write_text(json.dumps(report, indent=2) + "\n")
+    return report
@@ -0,0 +1,68 @@
+"""Webhook receiver for status pushed by FreeKiosk devices."""
+
+from __future__ import annotations
+
+import hmac
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.components import webhook
+from homeassistant.const import CONF_API_KEY, CONF_WEBHOOK_ID
+from homeassistant.core import callback
+
+from .const import CONF_HEADER_API_KEY, DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import FreeKioskConfigEntry
+
+
+@callback
+def async_setup_push(hass: HomeAssistant, entry: FreeKioskConfigEntry) -> None:
+    """Register the webhook a device or sidecar posts status deltas to."""
+    webhook_id = entry.options[CONF_WEBHOOK_ID]
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        f"FreeKiosk {entry.title}",
+        webhook_id,
+        partial(_async_handle_webhook, entry),
+        allowed_methods=["POST"],
+    )
+    entry.async_on_unload(partial(webhook.async_unregister, hass, webhook_id))
+    LOGGER.debug(
+        "Accepting pushed status for %s at %s",
+        entry.title,
+        webhook.async_generate_path(webhook_id),
+    )
+
+
+async def _async_handle_webhook(
+    entry: FreeKioskConfigEntry,
+    _hass: HomeAssistant,
+    _webhook_id: str,
+    request: web.Request,
+) -> web.Response:
+    """
+    Merge a pushed status delta into the coordinator data.
+
+    The body is either a full ``/api/status`` envelope or any subset of its
+    ``data`` sections; nested objects are merged key by key. An empty object
+    is a valid heartbeat that keeps the slow fallback polling in place.
+    """
+    if (api_key := entry.data.get(CONF_API_KEY)) and not hmac.compare_digest(
+        request.headers.get(CONF_HEADER_API_KEY, ""), api_key
+    ):
+        return web.Response(status=HTTPStatus.UNAUTHORIZED)
+    try:
+        body = await request.json()
+    except ValueError:
+        return web.Response(status=HTTPStatus.BAD_REQUEST)
+    if not isinstance(body, dict):
+        return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+    entry.runtime_data.coordinator.async_apply_push(body)
+    return web.Response(status=HTTPStatus.OK)
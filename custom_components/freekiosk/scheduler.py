@@ -0,0 +1,174 @@
+"""Fleet-wide poll scheduling for FreeKiosk devices."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    FLEET_DURATION_SMOOTHING,
+    FLEET_MAX_CONCURRENT_POLLS,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .coordinator import FreeKioskDataUpdateCoordinator
+
+_SCHEDULER_KEY = "scheduler"
+
+
+class FreeKioskPollScheduler:
+    """
+    Poll every FreeKiosk coordinator from one staggered schedule.
+
+    Each entry gets a fixed phase, a fraction of its own poll interval derived
+    from its position among the sorted entry ids, so tablets sharing an
+    interval are spread evenly across it instead of being polled in lockstep.
+    At most ``FLEET_MAX_CONCURRENT_POLLS`` polls run at once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._coordinators: dict[str, FreeKioskDataUpdateCoordinator] = {}
+        self._phases: dict[str, float] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._polls: dict[str, asyncio.Task[None]] = {}
+        self._durations: dict[str, float] = {}
+        self._semaphore = asyncio.Semaphore(FLEET_MAX_CONCURRENT_POLLS)
+        self._over_budget = False
+
+    @callback
+    def async_add(
+        self,
+        coordinator: FreeKioskDataUpdateCoordinator,
+        first_refresh: asyncio.Task[None] | None = None,
+    ) -> CALLBACK_TYPE:
+        """
+        Start polling a coordinator and return a callback that stops it.
+
+        A ``first_refresh`` still in flight counts as the entry's current
+        poll: the first scheduled poll follows it instead of overlapping it.
+        """
+        entry_id = coordinator.config_entry.entry_id
+        self._coordinators[entry_id] = coordinator
+        if first_refresh is not None and not first_refresh.done():
+            self._polls[entry_id] = first_refresh
+            first_refresh.add_done_callback(partial(self._async_poll_done, entry_id))
+        coordinator.poll_interval_listener = partial(self._async_schedule, entry_id)
+        self._async_rephase()
+        return partial(self._async_remove, entry_id)
+
+    @callback
+    def _async_remove(self, entry_id: str) -> None:
+        """Stop polling an entry."""
+        if (coordinator := self._coordinators.pop(entry_id, None)) is not None:
+            coordinator.poll_interval_listener = None
+        if (timer := self._timers.pop(entry_id, None)) is not None:
+            timer.cancel()
+        if (poll := self._polls.pop(entry_id, None)) is not None:
+            poll.cancel()
+        self._durations.pop(entry_id, None)
+        self._async_rephase()
+
+    @callback
+    def _async_rephase(self) -> None:
+        """Spread the entries evenly and move their next polls onto the new phases."""
+        entry_ids = sorted(self._coordinators)
+        self._phases = {
+            entry_id: index / len(entry_ids) for index, entry_id in enumerate(entry_ids)
+        }
+        for entry_id in entry_ids:
+            self._async_schedule(entry_id)
+
+    @callback
+    def _async_schedule(self, entry_id: str) -> None:
+        """
+        Schedule the next poll of an entry on its phase grid.
+
+        While a poll is in flight nothing is scheduled; the poll schedules
+        the next one when it finishes, so polls of an entry never overlap.
+        """
+        if (timer := self._timers.pop(entry_id, None)) is not None:
+            timer.cancel()
+        coordinator = self._coordinators.get(entry_id)
+        if coordinator is None or entry_id in self._polls:
+            return
+        interval = coordinator.poll_interval.total_seconds()
+        offset = self._phases[entry_id] * interval
+        now = self._hass.loop.time()
+        next_run = math.floor((now - offset) / interval + 1) * interval + offset
+        self._timers[entry_id] = self._hass.loop.call_at(
+            next_run, self._async_fire, entry_id
+        )
+
+    @callback
+    def _async_fire(self, entry_id: str) -> None:
+        """Start a scheduled poll."""
+        self._timers.pop(entry_id, None)
+        poll = self._hass.async_create_background_task(
+            self._async_poll(entry_id),
+            name=f"{DOMAIN} poll {entry_id}",
+        )
+        self._polls[entry_id] = poll
+        poll.add_done_callback(partial(self._async_poll_done, entry_id))
+
+    async def _async_poll(self, entry_id: str) -> None:
+        """Refresh one coordinator while holding a fleet poll slot."""
+        async with self._semaphore:
+            if (coordinator := self._coordinators.get(entry_id)) is None:
+                return
+            started = time.monotonic()
+            await coordinator.async_refresh()
+            self._async_record(entry_id, time.monotonic() - started)
+
+    @callback
+    def _async_poll_done(self, entry_id: str, poll: asyncio.Task[None]) -> None:
+        """Schedule the next poll once the current one finished."""
+        if self._polls.get(entry_id) is not poll:
+            return
+        del self._polls[entry_id]
+        self._async_schedule(entry_id)
+
+    @callback
+    def _async_record(self, entry_id: str, duration: float) -> None:
+        """Track poll durations and report when the fleet outgrows its budget."""
+        previous = self._durations.get(entry_id, duration)
+        self._durations[entry_id] = previous + FLEET_DURATION_SMOOTHING * (
+            duration - previous
+        )
+        # Busy poll slots needed on average; above the cap polls start queueing.
+        load = sum(
+            self._durations[other] / coordinator.poll_interval.total_seconds()
+            for other, coordinator in self._coordinators.items()
+            if other in self._durations
+        )
+        over_budget = load > FLEET_MAX_CONCURRENT_POLLS
+        if over_budget and not self._over_budget:
+            LOGGER.warning(
+                "Polling %d FreeKiosk devices needs %.1f concurrent polls on "
+                "average but only %d are allowed; polls will be delayed",
+                len(self._coordinators),
+                load,
+                FLEET_MAX_CONCURRENT_POLLS,
+            )
+        elif self._over_budget and not over_budget:
+            LOGGER.info("FreeKiosk polling fits its budget again (%.1f)", load)
+        self._over_budget = over_budget
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> FreeKioskPollScheduler:
+    """Return the scheduler shared by every FreeKiosk entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(_SCHEDULER_KEY)) is None:
+        scheduler = domain_data[_SCHEDULER_KEY] = FreeKioskPollScheduler(hass)
+    return scheduler
@@ -0,0 +1,255 @@
+"""Screenshot caching for the FreeKiosk camera."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import io
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING
+
+from .api import FreeKioskApiClientError
+from .const import (
+    DOMAIN,
+    LOGGER,
+    SCREENSHOT_CACHE_TTL,
+    SCREENSHOT_JPEG_QUALITY,
+    SCREENSHOT_RESIZE_CACHE_SIZE,
+)
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - Pillow ships with Home Assistant
+    Image = None
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+    from .data import FreeKioskConfigEntry
+
+
+@dataclass(frozen=True, slots=True)
+class ScreenshotFrame:
+    """A captured screenshot and the hash of its content."""
+
+    content: bytes
+    digest: str
+    fetched_at: float
+
+
+def resize_screenshot(
+    content: bytes,
+    width: int | None,
+    height: int | None,
+    *,
+    always_jpeg: bool = False,
+) -> bytes:
+    """
+    Scale a screenshot down to fit the requested size and encode it as JPEG.
+
+    A screenshot that already fits is returned unchanged, unless
+    ``always_jpeg`` asks for a JPEG whatever the size.
+    """
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            target = (width or image.width, height or image.height)
+            if (
+                image.width <= target[0]
+                and image.height <= target[1]
+                and (not always_jpeg or image.format == "JPEG")
+            ):
+                return content
+            image.thumbnail(target)
+            converted = image if image.mode in ("RGB", "L") else image.convert("RGB")
+            output = io.BytesIO()
+            converted.save(output, format="JPEG", quality=SCREENSHOT_JPEG_QUALITY)
+            return output.getvalue()
+    except OSError as err:
+        LOGGER.debug("Unable to resize screenshot: %s", err)
+        return content
+
+
+class FreeKioskScreenshotCache:
+    """Short-lived screenshot cache that shares one in-flight capture."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: FreeKioskConfigEntry,
+        ttl: float = SCREENSHOT_CACHE_TTL,
+    ) -> None:
+        """Set up the cache."""
+        self._hass = hass
+        self._entry = entry
+        self._client = entry.runtime_data.client
+        self._ttl = ttl
+        self._frame: ScreenshotFrame | None = None
+        self._pending: asyncio.Task[ScreenshotFrame] | None = None
+        self._resized: OrderedDict[tuple[str, int | None, int | None], bytes] = (
+            OrderedDict()
+        )
+
+    @property
+    def frame(self) -> ScreenshotFrame | None:
+        """Return the last captured frame, however old it is."""
+        return self._frame
+
+    async def async_get_frame(self, max_age: float | None = None) -> ScreenshotFrame:
+        """Return a frame no older than ``max_age`` (default: the TTL)."""
+        frame = self._frame
+        if max_age is None:
+            max_age = self._ttl
+        if frame is not None and time.monotonic() - frame.fetched_at < max_age:
+            return frame
+        if (pending := self._pending) is None:
+            pending = self._entry.async_create_background_task(
+                self._hass, self._async_capture(), f"{DOMAIN} screenshot"
+            )
+            if not pending.done():
+                self._pending = pending
+                pending.add_done_callback(self._clear_pending)
+        # Shield the shared capture so one caller going away does not cancel
+        # it for everyone else waiting on the same frame.
+        return await asyncio.shield(pending)
+
+    async def async_get_image(
+        self,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> bytes:
+        """Return the current screenshot scaled down to the requested size."""
+        frame = await self.async_get_frame()
+        if Image is None or (width is None and height is None):
+            return frame.content
+
+        key = (frame.digest, width, height)
+        if (content := self._resized.get(key)) is not None:
+            self._resized.move_to_end(key)
+            return content
+
+        content = await self._hass.async_add_executor_job(
+            resize_screenshot, frame.content, width, height
+        )
+        self._resized[key] = content
+        if len(self._resized) > SCREENSHOT_RESIZE_CACHE_SIZE:
+            self._resized.popitem(last=False)
+        return content
+
+    def _clear_pending(self, _task: asyncio.Task[ScreenshotFrame]) -> None:
+        self._pending = None
+
+    async def _async_capture(self) -> ScreenshotFrame:
+        content = await self._client.async_get_screenshot()
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        previous = self._frame
+        if previous is not None and previous.digest == digest:
+            # Keep the original bytes so consumers can tell by identity that
+            # nothing changed and skip re-sending the frame.
+            content = previous.content
+        self._frame = ScreenshotFrame(
+            content=content,
+            digest=digest,
+            fetched_at=time.monotonic(),
+        )
+        return self._frame
+
+
+class FreeKioskScreenshotStream:
+    """Paced screenshot producer shared by every MJPEG viewer of a device."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: FreeKioskConfigEntry,
+        cache: FreeKioskScreenshotCache,
+        max_fps: float,
+    ) -> None:
+        """Set up the stream."""
+        self._hass = hass
+        self._entry = entry
+        self._cache = cache
+        self._interval = 1 / max_fps
+        self._viewers = 0
+        self._task: asyncio.Task[None] | None = None
+        self._new_frame = asyncio.Event()
+        self._content: bytes | None = None
+
+    @property
+    def interval(self) -> float:
+        """Return the minimum time between two frames."""
+        return self._interval
+
+    async def async_frames(self) -> AsyncIterator[bytes]:
+        """Yield each new JPEG frame until the viewer or the producer goes away."""
+        self._viewers += 1
+        if self._task is None or self._task.done():
+            self._new_frame = asyncio.Event()
+            self._task = self._entry.async_create_background_task(
+                self._hass, self._async_produce(), f"{DOMAIN} screenshot stream"
+            )
+        task = self._task
+        try:
+            sent: bytes | None = None
+            while True:
+                if (content := self._content) is not None and content is not sent:
+                    sent = content
+                    yield sent
+                if task.done():
+                    return
+                await self._new_frame.wait()
+        finally:
+            self._viewers -= 1
+
+    async def async_stop(self) -> None:
+        """Stop producing frames."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _async_produce(self) -> None:
+        try:
+            await self._async_produce_frames()
+        finally:
+            # Wake every viewer so it can tell the producer has stopped.
+            self._new_frame.set()
+
+    async def _async_produce_frames(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_content: bytes | None = None
+        while self._viewers:
+            started = loop.time()
+            # Captures run one after another, so a slow capture simply drops
+            # the ticks that would have overlapped with it.
+            try:
+                frame = await self._cache.async_get_frame(max_age=self._interval)
+            except FreeKioskApiClientError as err:
+                LOGGER.debug("Unable to fetch stream frame: %s", err)
+            else:
+                if frame.content is not last_content:
+                    last_content = frame.content
+                    # Encode once for every viewer; screenshots are full
+                    # resolution PNGs, several times larger than a JPEG.
+                    self._content = (
+                        frame.content
+                        if Image is None
+                        else await self._hass.async_add_executor_job(
+                            partial(
+                                resize_screenshot,
+                                frame.content,
+                                None,
+                                None,
+                                always_jpeg=True,
+                            )
+                        )
+                    )
+                    new_frame, self._new_frame = self._new_frame, asyncio.Event()
+                    new_frame.set()
+            await asyncio.sleep(max(0, self._interval - (loop.time() - started)))
@@ -9,10 +9,13 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
+from homeassistant.const import UnitOfInformation, UnitOfTime
 from homeassistant.helpers.entity import EntityCategory
 
-from .entity import FreeKioskEntity
+from .coordinator import STATS_CONTEXT
+from .entity import FreeKioskEntity, async_add_reported_entities
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -21,22 +24,26 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import FreeKioskDataUpdateCoordinator
-    from .data import FreeKioskConfigEntry
+    from .data import FreeKioskConfigEntry, FreeKioskStatus
+    from .stats import FreeKioskStats
 
 
 @dataclass
 class FreeKioskSensorDescription(SensorEntityDescription):
     """Describes FreeKiosk sensor."""
 
-    value_fn: Callable[[dict[str, Any]], Any] = lambda _: None  # type: ignore[assignment]
+    path: tuple[str, ...] = ()
+    # Path the value is computed from when the device does not report ``path``.
+    derived_from: tuple[str, ...] | None = None
+    value_fn: Callable[[FreeKioskStatus], Any] = lambda _: None  # type: ignore[assignment]
 
 
-def _wifi_rssi(data: dict[str, Any]) -> Any:
-    return data.get("wifi", {}).get("signalStrength")
-
+@dataclass
+class FreeKioskStatsSensorDescription(SensorEntityDescription):
+    """Describes a FreeKiosk request statistics sensor."""
 
-def _wifi_ip(data: dict[str, Any]) -> Any:
-    return data.get("device", {}).get("ip")
+    value_fn: Callable[[FreeKioskStats], Any] = lambda _: None  # type: ignore[assignment]
+    attributes_fn: Callable[[FreeKioskStats], dict[str, Any]] | None = None
 
 
 SENSOR_DESCRIPTIONS: tuple[FreeKioskSensorDescription, ...] = (
@@ -46,174 +53,204 @@ SENSOR_DESCRIPTIONS: tuple[FreeKioskSensorDescription, ...] = (
         icon="mdi:battery",
         device_class=SensorDeviceClass.BATTERY,
         native_unit_of_measurement="%",
-        value_fn=lambda data: data.get("battery", {}).get("level"),
+        path=("battery", "level"),
+        value_fn=lambda data: data.battery.level,
     ),
     FreeKioskSensorDescription(
         key="battery_plugged",
         name="Battery Plugged",
         icon="mdi:power-plug",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("battery", {}).get("plugged"),
+        path=("battery", "plugged"),
+        value_fn=lambda data: data.battery.plugged,
     ),
     FreeKioskSensorDescription(
         key="screen_brightness",
         name="Screen Brightness",
         icon="mdi:brightness-5",
         native_unit_of_measurement="%",
-        value_fn=lambda data: data.get("screen", {}).get("brightness"),
+        path=("screen", "brightness"),
+        value_fn=lambda data: data.screen.brightness,
     ),
     FreeKioskSensorDescription(
         key="audio_volume",
         name="Audio Volume",
         icon="mdi:volume-high",
         native_unit_of_measurement="%",
-        value_fn=lambda data: data.get("audio", {}).get("volume"),
+        path=("audio", "volume"),
+        value_fn=lambda data: data.audio.volume,
     ),
     FreeKioskSensorDescription(
         key="device_hostname",
         name="Device Hostname",
         icon="mdi:lan-connect",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("device", {}).get("hostname"),
+        path=("device", "hostname"),
+        value_fn=lambda data: data.device.hostname,
     ),
     FreeKioskSensorDescription(
         key="device_version",
         name="Device Version",
         icon="mdi:tag",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("device", {}).get("version"),
+        path=("device", "version"),
+        value_fn=lambda data: data.device.version,
     ),
     FreeKioskSensorDescription(
         key="wifi_rssi",
         name="WiFi Signal Strength",
         icon="mdi:wifi",
         native_unit_of_measurement="dBm",
-        value_fn=_wifi_rssi,
+        path=("wifi", "signalStrength"),
+        value_fn=lambda data: data.wifi.signal_strength,
     ),
     FreeKioskSensorDescription(
         key="wifi_signal_level",
         name="WiFi Signal Level",
         icon="mdi:wifi-strength-2",
         native_unit_of_measurement="%",
-        value_fn=lambda data: data.get("wifi", {}).get("signalLevel"),
+        path=("wifi", "signalLevel"),
+        derived_from=("wifi", "signalStrength"),
+        value_fn=lambda data: data.wifi.signal_level,
     ),
     FreeKioskSensorDescription(
         key="wifi_ssid",
         name="WiFi SSID",
         icon="mdi:wifi",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("wifi", {}).get("ssid"),
+        path=("wifi", "ssid"),
+        value_fn=lambda data: data.wifi.ssid,
     ),
     FreeKioskSensorDescription(
         key="wifi_ip",
         name="WiFi IP",
         icon="mdi:ip-network",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=_wifi_ip,
+        path=("device", "ip"),
+        value_fn=lambda data: data.device.ip,
     ),
     FreeKioskSensorDescription(
         key="wifi_link_speed",
         name="WiFi Link Speed",
         icon="mdi:speedometer",
         native_unit_of_measurement="Mbps",
-        value_fn=lambda data: data.get("wifi", {}).get("linkSpeed"),
+        path=("wifi", "linkSpeed"),
+        value_fn=lambda data: data.wifi.link_speed,
     ),
     FreeKioskSensorDescription(
         key="wifi_frequency",
         name="WiFi Frequency",
         icon="mdi:wifi",
         native_unit_of_measurement="MHz",
-        value_fn=lambda data: data.get("wifi", {}).get("frequency"),
+        path=("wifi", "frequency"),
+        value_fn=lambda data: data.wifi.frequency,
     ),
     FreeKioskSensorDescription(
         key="rotation_interval",
         name="Rotation Interval",
         icon="mdi:timer",
         native_unit_of_measurement="s",
-        value_fn=lambda data: data.get("rotation", {}).get("interval"),
+        path=("rotation", "interval"),
+        value_fn=lambda data: data.rotation.interval,
     ),
     FreeKioskSensorDescription(
         key="rotation_current_index",
         name="Rotation Current Index",
         icon="mdi:counter",
-        value_fn=lambda data: data.get("rotation", {}).get("currentIndex"),
+        path=("rotation", "currentIndex"),
+        value_fn=lambda data: data.rotation.current_index,
     ),
     FreeKioskSensorDescription(
         key="auto_brightness_level",
         name="Automatic Brightness Level",
         icon="mdi:brightness-6",
         native_unit_of_measurement="lx",
-        value_fn=lambda data: data.get("autoBrightness", {}).get("currentLightLevel"),
+        path=("autoBrightness", "currentLightLevel"),
+        value_fn=lambda data: data.auto_brightness.current_light_level,
     ),
     FreeKioskSensorDescription(
         key="auto_brightness_min",
         name="Auto Brightness Minimum",
         icon="mdi:brightness-6",
         native_unit_of_measurement="%",
-        value_fn=lambda data: data.get("autoBrightness", {}).get("min"),
+        path=("autoBrightness", "min"),
+        value_fn=lambda data: data.auto_brightness.min,
     ),
     FreeKioskSensorDescription(
         key="auto_brightness_max",
         name="Auto Brightness Maximum",
         icon="mdi:brightness-7",
         native_unit_of_measurement="%",
-        value_fn=lambda data: data.get("autoBrightness", {}).get("max"),
+        path=("autoBrightness", "max"),
+        value_fn=lambda data: data.auto_brightness.max,
     ),
     FreeKioskSensorDescription(
         key="storage_total",
         name="Storage Total",
         icon="mdi:harddisk",
         native_unit_of_measurement="MB",
-        value_fn=lambda data: data.get("storage", {}).get("totalMB"),
+        path=("storage", "totalMB"),
+        value_fn=lambda data: data.storage.total_mb,
     ),
     FreeKioskSensorDescription(
         key="storage_available",
         name="Storage Available",
         icon="mdi:harddisk",
         native_unit_of_measurement="MB",
-        value_fn=lambda data: data.get("storage", {}).get("availableMB"),
+        path=("storage", "availableMB"),
+        value_fn=lambda data: data.storage.available_mb,
     ),
     FreeKioskSensorDescription(
         key="storage_used",
         name="Storage Used",
         icon="mdi:harddisk",
         native_unit_of_measurement="MB",
-        value_fn=lambda data: data.get("storage", {}).get("usedMB"),
+        path=("storage", "usedMB"),
+        derived_from=("storage", "totalMB"),
+        value_fn=lambda data: data.storage.used_mb,
     ),
     FreeKioskSensorDescription(
         key="storage_used_percent",
         name="Storage Used",
         icon="mdi:harddisk-multiple",
         native_unit_of_measurement="%",
-        value_fn=lambda data: data.get("storage", {}).get("usedPercent"),
+        path=("storage", "usedPercent"),
+        derived_from=("storage", "totalMB"),
+        value_fn=lambda data: data.storage.used_percent,
     ),
     FreeKioskSensorDescription(
         key="memory_total",
         name="Memory Total",
         icon="mdi:memory",
         native_unit_of_measurement="MB",
-        value_fn=lambda data: data.get("memory", {}).get("totalMB"),
+        path=("memory", "totalMB"),
+        value_fn=lambda data: data.memory.total_mb,
     ),
     FreeKioskSensorDescription(
         key="memory_available",
         name="Memory Available",
         icon="mdi:memory",
         native_unit_of_measurement="MB",
-        value_fn=lambda data: data.get("memory", {}).get("availableMB"),
+        path=("memory", "availableMB"),
+        value_fn=lambda data: data.memory.available_mb,
     ),
     FreeKioskSensorDescription(
         key="memory_used",
         name="Memory Used",
         icon="mdi:memory",
         native_unit_of_measurement="MB",
-        value_fn=lambda data: data.get("memory", {}).get("usedMB"),
+        path=("memory", "usedMB"),
+        derived_from=("memory", "totalMB"),
+        value_fn=lambda data: data.memory.used_mb,
     ),
     FreeKioskSensorDescription(
         key="memory_used_percent",
         name="Memory Used",
         icon="mdi:chip",
         native_unit_of_measurement="%",
-        value_fn=lambda data: data.get("memory", {}).get("usedPercent"),
+        path=("memory", "usedPercent"),
+        derived_from=("memory", "totalMB"),
+        value_fn=lambda data: data.memory.used_percent,
     ),
     FreeKioskSensorDescription(
         key="light_level",
@@ -221,14 +258,16 @@ SENSOR_DESCRIPTIONS: tuple[FreeKioskSensorDescription, ...] = (
         icon="mdi:weather-sunny",
         device_class=SensorDeviceClass.ILLUMINANCE,
         native_unit_of_measurement="lx",
-        value_fn=lambda data: data.get("sensors", {}).get("light"),
+        path=("sensors", "light"),
+        value_fn=lambda data: data.sensors.light,
     ),
     FreeKioskSensorDescription(
         key="proximity",
         name="Proximity",
         icon="mdi:ruler",
         native_unit_of_measurement="cm",
-        value_fn=lambda data: data.get("sensors", {}).get("proximity"),
+        path=("sensors", "proximity"),
+        value_fn=lambda data: data.sensors.proximity,
     ),
     FreeKioskSensorDescription(
         key="accelerometer_x",
@@ -236,7 +275,8 @@ SENSOR_DESCRIPTIONS: tuple[FreeKioskSensorDescription, ...] = (
         icon="mdi:axis-arrow",
         native_unit_of_measurement="m/s^2",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("sensors", {}).get("accelerometer", {}).get("x"),
+        path=("sensors", "accelerometer", "x"),
+        value_fn=lambda data: data.sensors.accelerometer_x,
     ),
     FreeKioskSensorDescription(
         key="accelerometer_y",
@@ -244,7 +284,8 @@ SENSOR_DESCRIPTIONS: tuple[FreeKioskSensorDescription, ...] = (
         icon="mdi:axis-arrow",
         native_unit_of_measurement="m/s^2",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("sensors", {}).get("accelerometer", {}).get("y"),
+        path=("sensors", "accelerometer", "y"),
+        value_fn=lambda data: data.sensors.accelerometer_y,
     ),
     FreeKioskSensorDescription(
         key="accelerometer_z",
@@ -252,7 +293,63 @@ SENSOR_DESCRIPTIONS: tuple[FreeKioskSensorDescription, ...] = (
         icon="mdi:axis-arrow",
         native_unit_of_measurement="m/s^2",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.get("sensors", {}).get("accelerometer", {}).get("z"),
+        path=("sensors", "accelerometer", "z"),
+        value_fn=lambda data: data.sensors.accelerometer_z,
+    ),
+)
+
+
+STATS_SENSOR_DESCRIPTIONS: tuple[FreeKioskStatsSensorDescription, ...] = (
+    FreeKioskStatsSensorDescription(
+        key="poll_duration",
+        name="Poll Duration",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.last_cycle_ms,
+        attributes_fn=lambda stats: stats.cycle_summary,
+    ),
+    FreeKioskStatsSensorDescription(
+        key="request_latency",
+        name="Request Latency",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.latency_summary["p95_ms"],
+        attributes_fn=lambda stats: {
+            **stats.latency_summary,
+            "endpoints_p95_ms": stats.endpoint_p95_ms,
+        },
+    ),
+    FreeKioskStatsSensorDescription(
+        key="request_errors",
+        name="Request Errors",
+        icon="mdi:alert-circle-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.errors,
+        attributes_fn=lambda stats: {
+            "requests": stats.requests,
+            "timeouts": stats.timeouts,
+        },
+    ),
+    FreeKioskStatsSensorDescription(
+        key="data_received",
+        name="Data Received",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.bytes,
     ),
 )
 
@@ -263,12 +360,16 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up FreeKiosk sensors."""
+    coordinator = entry.runtime_data.coordinator
+    async_add_reported_entities(
+        entry,
+        async_add_entities,
+        SENSOR_DESCRIPTIONS,
+        lambda description: FreeKioskStatusSensor(coordinator, description),
+    )
     async_add_entities(
-        FreeKioskStatusSensor(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=description,
-        )
-        for description in SENSOR_DESCRIPTIONS
+        FreeKioskStatsSensor(coordinator=coordinator, entity_description=description)
+        for description in STATS_SENSOR_DESCRIPTIONS
     )
 
 
@@ -281,10 +382,54 @@ class FreeKioskStatusSensor(FreeKioskEntity, SensorEntity):
         entity_description: FreeKioskSensorDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, unique_id=f"sensor_{entity_description.key}")
+        super().__init__(
+            coordinator,
+            unique_id=f"sensor_{entity_description.key}",
+            path=entity_description.path,
+        )
         self.entity_description = entity_description
 
     @property
     def native_value(self) -> Any:
         """Return the current value."""
         return self.entity_description.value_fn(self._get_status())
+
+
+class FreeKioskStatsSensor(FreeKioskEntity, SensorEntity):
+    """Sensor reporting how the integration's requests to the device perform."""
+
+    entity_description: FreeKioskStatsSensorDescription
+
+    def __init__(
+        self,
+        coordinator: FreeKioskDataUpdateCoordinator,
+        entity_description: FreeKioskStatsSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            coordinator,
+            unique_id=f"sensor_{entity_description.key}",
+            path=STATS_CONTEXT,
+        )
+        self.entity_description = entity_description
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the device fails; that is when this matters."""
+        return True
+
+    @property
+    def _stats(self) -> FreeKioskStats:
+        return self.coordinator.config_entry.runtime_data.client.stats
+
+    @property
+    def native_value(self) -> Any:
+        """Return the current value."""
+        return self.entity_description.value_fn(self._stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the breakdown behind the value."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self._stats)
@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID
+from homeassistant.core import SupportsResponse
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
-
-from .const import CONF_DEVICE_URL, DOMAIN, LOGGER
+from homeassistant.helpers import device_registry as dr
+
+from .api import FreeKioskApiClientError
+from .const import (
+    CONF_DEVICE_URL,
+    DEFAULT_SERVICE_CONCURRENCY,
+    DOMAIN,
+    LOGGER,
+    PROFILE_DEFAULT_CYCLES,
+    PROFILE_DEFAULT_TIMEOUT,
+)
+from .profiler import async_profile_cycles
 
 try:
     from homeassistant.const import CONF_ENTRY_ID
@@ -21,9 +35,8 @@ except ImportError:  # pragma: no cover - compatibility fallback
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
 
-    from homeassistant.core import HomeAssistant, ServiceCall
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
 
-    from .api import FreeKioskApiClient
     from .data import FreeKioskConfigEntry
 
 
@@ -32,6 +45,7 @@ class _ServiceDefinition:
     endpoint: str | Callable[[ServiceCall], str]
     payload: Callable[[ServiceCall], dict[str, Any] | None] | None = None
     schema_extra: Mapping[str, Any] | None = None
+    optimistic: Callable[[ServiceCall], Mapping[tuple[str, ...], Any]] | None = None
 
 
 REMOTE_COMMANDS = (
@@ -59,12 +73,27 @@ def _build_audio_payload(call: ServiceCall) -> dict[str, Any]:
 
 
 SERVICES: dict[str, _ServiceDefinition] = {
-    "screen_on": _ServiceDefinition(endpoint="/api/screen/on"),
-    "screen_off": _ServiceDefinition(endpoint="/api/screen/off"),
-    "screensaver_on": _ServiceDefinition(endpoint="/api/screensaver/on"),
-    "screensaver_off": _ServiceDefinition(endpoint="/api/screensaver/off"),
+    "screen_on": _ServiceDefinition(
+        endpoint="/api/screen/on",
+        optimistic=lambda _: {("screen", "on"): True},
+    ),
+    "screen_off": _ServiceDefinition(
+        endpoint="/api/screen/off",
+        optimistic=lambda _: {("screen", "on"): False},
+    ),
+    "screensaver_on": _ServiceDefinition(
+        endpoint="/api/screensaver/on",
+        optimistic=lambda _: {("screen", "screensaverActive"): True},
+    ),
+    "screensaver_off": _ServiceDefinition(
+        endpoint="/api/screensaver/off",
+        optimistic=lambda _: {("screen", "screensaverActive"): False},
+    ),
     "reload": _ServiceDefinition(endpoint="/api/reload"),
-    "wake": _ServiceDefinition(endpoint="/api/wake"),
+    "wake": _ServiceDefinition(
+        endpoint="/api/wake",
+        optimistic=lambda _: {("screen", "screensaverActive"): False},
+    ),
     "clear_cache": _ServiceDefinition(endpoint="/api/clearCache"),
     "reboot": _ServiceDefinition(endpoint="/api/reboot"),
     "set_brightness": _ServiceDefinition(
@@ -73,6 +102,10 @@ SERVICES: dict[str, _ServiceDefinition] = {
         schema_extra={
             vol.Required("value"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
         },
+        optimistic=lambda call: {
+            ("screen", "brightness"): call.data["value"],
+            ("autoBrightness", "enabled"): False,
+        },
     ),
     "set_volume": _ServiceDefinition(
         endpoint="/api/volume",
@@ -80,11 +113,13 @@ SERVICES: dict[str, _ServiceDefinition] = {
         schema_extra={
             vol.Required("value"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
         },
+        optimistic=lambda call: {("audio", "volume"): call.data["value"]},
     ),
     "navigate_url": _ServiceDefinition(
         endpoint="/api/url",
         payload=lambda call: {"url": call.data["url"]},
         schema_extra={vol.Required("url"): cv.string},
+        optimistic=lambda call: {("webview", "currentUrl"): call.data["url"]},
     ),
     "tts": _ServiceDefinition(
         endpoint="/api/tts",
@@ -133,9 +168,15 @@ SERVICES: dict[str, _ServiceDefinition] = {
                 vol.Range(min=0, max=100),
             ),
         },
+        optimistic=lambda call: {
+            ("autoBrightness", "enabled"): True,
+            ("autoBrightness", "min"): call.data.get("min", 10),
+            ("autoBrightness", "max"): call.data.get("max", 100),
+        },
     ),
     "disable_auto_brightness": _ServiceDefinition(
-        endpoint="/api/autoBrightness/disable"
+        endpoint="/api/autoBrightness/disable",
+        optimistic=lambda _: {("autoBrightness", "enabled"): False},
     ),
     "remote_command": _ServiceDefinition(
         endpoint=lambda call: f"/api/remote/{call.data['command']}",
@@ -146,36 +187,85 @@ SERVICES: dict[str, _ServiceDefinition] = {
 
 _SERVICES_REGISTERED_KEY = "services_registered"
 
+ATTR_DEVICE_URL = "device_url"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+ENTRY_ID_ALL = "all"
+ATTR_CYCLES = "cycles"
+ATTR_TIMEOUT = "timeout"
+SERVICE_PROFILE = "profile"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=PROFILE_DEFAULT_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=20)
+        ),
+        vol.Optional(ATTR_TIMEOUT, default=PROFILE_DEFAULT_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=600)
+        ),
+    }
+)
+
+_TARGET_KEYS = (CONF_ENTRY_ID, ATTR_DEVICE_URL, ATTR_DEVICE_ID, ATTR_AREA_ID)
+
 
 def _ensure_target_provided(value: dict[str, Any]) -> dict[str, Any]:
-    if value.get(CONF_ENTRY_ID) or value.get(CONF_DEVICE_URL):
+    if any(value.get(key) for key in _TARGET_KEYS):
         return value
-    msg = "Must specify entry_id or device_url"
+    msg = "Must specify entry_id, device_url, device_id or area_id"
     raise vol.Invalid(msg)
 
 
 def _create_schema(extra: Mapping[str, Any] | None) -> vol.Schema:
     schema_dict: dict[str, Any] = {
-        vol.Optional(CONF_ENTRY_ID): cv.string,
-        vol.Optional(CONF_DEVICE_URL): cv.string,
+        vol.Optional(CONF_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DEVICE_URL): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(
+            ATTR_MAX_CONCURRENCY, default=DEFAULT_SERVICE_CONCURRENCY
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
     }
     if extra:
         schema_dict.update(extra)
     return vol.Schema(vol.All(schema_dict, _ensure_target_provided))
 
 
-def _find_entry(hass: HomeAssistant, call: ServiceCall) -> FreeKioskConfigEntry | None:
-    entry_id = call.data.get(CONF_ENTRY_ID)
-    if entry_id:
-        return hass.config_entries.async_get_entry(entry_id)
-    device_url = call.data.get(CONF_DEVICE_URL)
-    if not device_url:
-        return None
-    normalized_url = device_url.rstrip("/")
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        if entry.data.get(CONF_DEVICE_URL) == normalized_url:
-            return entry
-    return None
+def _find_entries(hass: HomeAssistant, call: ServiceCall) -> list[FreeKioskConfigEntry]:
+    """Resolve the entries targeted by entry id, device URL, device or area."""
+    entries = {
+        entry.entry_id: entry for entry in hass.config_entries.async_entries(DOMAIN)
+    }
+    entry_ids: list[str] = call.data.get(CONF_ENTRY_ID, [])
+    if ENTRY_ID_ALL in entry_ids:
+        return list(entries.values())
+
+    selected = {
+        entry_id: entries[entry_id] for entry_id in entry_ids if entry_id in entries
+    }
+
+    device_urls = {url.rstrip("/") for url in call.data.get(ATTR_DEVICE_URL, [])}
+    if device_urls:
+        for entry in entries.values():
+            if entry.data.get(CONF_DEVICE_URL) in device_urls:
+                selected[entry.entry_id] = entry
+
+    device_ids = set(call.data.get(ATTR_DEVICE_ID, []))
+    area_ids = call.data.get(ATTR_AREA_ID, [])
+    if device_ids or area_ids:
+        device_registry = dr.async_get(hass)
+        for area_id in area_ids:
+            device_ids.update(
+                device.id
+                for device in dr.async_entries_for_area(device_registry, area_id)
+            )
+        for device_id in device_ids:
+            if (device := device_registry.async_get(device_id)) is None:
+                continue
+            for entry_id in device.config_entries:
+                if entry_id in entries:
+                    selected[entry_id] = entries[entry_id]
+
+    return list(selected.values())
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
@@ -188,32 +278,105 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         hass.services.async_register(
             DOMAIN,
             service_name,
-            functools.partial(_async_handle_service, definition),
+            functools.partial(_async_handle_service, definition, hass),
             schema=_create_schema(definition.schema_extra),
+            supports_response=SupportsResponse.OPTIONAL,
         )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        functools.partial(_async_handle_profile, hass),
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
     domain_data[_SERVICES_REGISTERED_KEY] = True
 
 
+async def _async_handle_profile(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Profile the next update cycles of every loaded FreeKiosk device."""
+    coordinators = [
+        entry.runtime_data.coordinator
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+    if not coordinators:
+        msg = "FreeKiosk entry not available"
+        raise HomeAssistantError(msg)
+    report = await async_profile_cycles(
+        hass, coordinators, call.data[ATTR_CYCLES], call.data[ATTR_TIMEOUT]
+    )
+    LOGGER.info(
+        "FreeKiosk profile of %s devices written to %s",
+        len(coordinators),
+        report["profile"],
+    )
+    if call.return_response:
+        return report
+    return None
+
+
 async def _async_handle_service(
     service_def: _ServiceDefinition, hass: HomeAssistant, call: ServiceCall
-) -> None:
-    """Handle an individual FreeKiosk service call."""
-    entry = _find_entry(hass, call)
-    if not entry or entry.state != ConfigEntryState.LOADED:
+) -> ServiceResponse:
+    """Send a FreeKiosk service call to every targeted device."""
+    entries = [
+        entry
+        for entry in _find_entries(hass, call)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+    if not entries:
         msg = "FreeKiosk entry not available"
         raise HomeAssistantError(msg)
 
-    client: FreeKioskApiClient = entry.runtime_data.client
     endpoint = (
         service_def.endpoint(call)
         if callable(service_def.endpoint)
         else service_def.endpoint
     )
     payload = service_def.payload(call) if service_def.payload else None
-    await client.async_post_command(endpoint, payload)
-    await entry.runtime_data.coordinator.async_request_refresh()
-
-
-# Logging stub for coverage
-LOGGER.debug("FreeKiosk services module loaded")
+    optimistic = service_def.optimistic(call) if service_def.optimistic else None
+    semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+
+    async def _async_send(entry: FreeKioskConfigEntry) -> dict[str, Any]:
+        async with semaphore:
+            started = time.monotonic()
+            error: str | None = None
+            try:
+                await entry.runtime_data.coordinator.async_send_command(
+                    endpoint,
+                    payload,
+                    optimistic=optimistic,
+                )
+            except FreeKioskApiClientError as err:
+                error = str(err) or type(err).__name__
+            return {
+                "success": error is None,
+                "latency_ms": round((time.monotonic() - started) * 1000, 1),
+                "error": error,
+            }
+
+    outcomes = await asyncio.gather(*(_async_send(entry) for entry in entries))
+    results = {
+        entry.entry_id: outcome
+        for entry, outcome in zip(entries, outcomes, strict=True)
+    }
+    failed = [
+        entry_id for entry_id, outcome in results.items() if not outcome["success"]
+    ]
+    if failed and len(entries) == 1:
+        msg = f"FreeKiosk command failed: {results[failed[0]]['error']}"
+        raise HomeAssistantError(msg)
+    if failed:
+        LOGGER.warning(
+            "FreeKiosk %s failed on %s of %s devices: %s",
+            call.service,
+            len(failed),
+            len(entries),
+            ", ".join(failed),
+        )
+    if call.return_response:
+        return {"results": results}
+    return None
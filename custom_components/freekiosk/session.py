@@ -0,0 +1,88 @@
+"""HTTP session handling for FreeKiosk devices."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.json import json_dumps
+
+from .const import (
+    CONF_DEDICATED_POOL,
+    DEFAULT_DEDICATED_POOL,
+    DOMAIN,
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    POOL_LIMIT,
+    POOL_LIMIT_PER_HOST,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, HomeAssistant
+
+    from .data import FreeKioskConfigEntry
+
+_SESSION_KEY = "session"
+_SESSION_USERS_KEY = "session_users"
+_SESSION_CLOSE_KEY = "session_close"
+
+
+@callback
+def async_get_session(
+    hass: HomeAssistant,
+    entry: FreeKioskConfigEntry,
+) -> aiohttp.ClientSession:
+    """
+    Return the HTTP session an entry should use.
+
+    Entries that opt into the dedicated pool share one integration-owned
+    session whose connector keeps sockets to every tablet alive between polls.
+    It is closed once the last entry using it unloads, or when Home Assistant
+    closes with entries still using it.
+    """
+    if not entry.options.get(CONF_DEDICATED_POOL, DEFAULT_DEDICATED_POOL):
+        return async_get_clientsession(hass)
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get(_SESSION_KEY)
+    if session is None or session.closed:
+        if (unsub_close := domain_data.pop(_SESSION_CLOSE_KEY, None)) is not None:
+            unsub_close()
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=POOL_DNS_CACHE_TTL,
+                use_dns_cache=True,
+            ),
+            json_serialize=json_dumps,
+        )
+        domain_data[_SESSION_KEY] = session
+
+        async def _async_close(_event: Event) -> None:
+            domain_data.pop(_SESSION_CLOSE_KEY, None)
+            if domain_data.get(_SESSION_KEY) is session:
+                del domain_data[_SESSION_KEY]
+            await session.close()
+
+        domain_data[_SESSION_CLOSE_KEY] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close
+        )
+
+    users: set[str] = domain_data.setdefault(_SESSION_USERS_KEY, set())
+    users.add(entry.entry_id)
+
+    async def _async_release() -> None:
+        users.discard(entry.entry_id)
+        if not users and domain_data.get(_SESSION_KEY) is session:
+            del domain_data[_SESSION_KEY]
+            if (unsub_close := domain_data.pop(_SESSION_CLOSE_KEY, None)) is not None:
+                unsub_close()
+            await session.close()
+
+    entry.async_on_unload(_async_release)
+    return session
@@ -0,0 +1,90 @@
+"""Fleet-wide first refreshes of FreeKiosk devices."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    STARTUP_BUDGET,
+    STARTUP_MAX_CONCURRENT_REFRESHES,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import FreeKioskDataUpdateCoordinator
+
+_STARTUP_KEY = "startup"
+
+
+class FreeKioskStartup:
+    """
+    Run the first refresh of every FreeKiosk entry under one time budget.
+
+    Home Assistant sets entries up concurrently; this caps how many of them
+    contact their device at once and gives the whole fleet ``STARTUP_BUDGET``
+    seconds from the first entry's setup. Entries set up after Home Assistant
+    started, e.g. when added or reloaded, get a budget of their own.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the startup coordinator."""
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(STARTUP_MAX_CONCURRENT_REFRESHES)
+        self._deadline = hass.loop.time() + STARTUP_BUDGET
+
+    async def _async_refresh(self, coordinator: FreeKioskDataUpdateCoordinator) -> None:
+        """Refresh a coordinator once a startup slot is free."""
+        async with self._semaphore:
+            await coordinator.async_refresh()
+
+    @callback
+    def async_start_refresh(
+        self, coordinator: FreeKioskDataUpdateCoordinator
+    ) -> asyncio.Task[None]:
+        """Start the first refresh of an entry in the background."""
+        return coordinator.config_entry.async_create_background_task(
+            self._hass, self._async_refresh(coordinator), f"{DOMAIN} first refresh"
+        )
+
+    async def async_first_refresh(
+        self, coordinator: FreeKioskDataUpdateCoordinator
+    ) -> asyncio.Task[None]:
+        """
+        Wait for the first refresh of an entry until the budget runs out.
+
+        A device that has not answered by then, or failed to, is set up as
+        unavailable. A refresh still in flight keeps running in the
+        background; the returned task lets the scheduler hold off its polls
+        until it finished.
+        """
+        entry = coordinator.config_entry
+        deadline = self._deadline
+        if self._hass.is_running:
+            deadline = self._hass.loop.time() + STARTUP_BUDGET
+        refresh = self.async_start_refresh(coordinator)
+        remaining = deadline - self._hass.loop.time()
+        if remaining > 0:
+            await asyncio.wait((refresh,), timeout=remaining)
+        if refresh.done() and coordinator.last_update_success:
+            return refresh
+        LOGGER.info(
+            "%s did not answer during startup; it is unavailable until it does",
+            entry.title,
+        )
+        coordinator.async_set_unavailable()
+        return refresh
+
+
+@callback
+def async_get_startup(hass: HomeAssistant) -> FreeKioskStartup:
+    """Return the startup coordinator shared by every FreeKiosk entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (startup := domain_data.get(_STARTUP_KEY)) is None:
+        startup = domain_data[_STARTUP_KEY] = FreeKioskStartup(hass)
+    return startup
@@ -0,0 +1,195 @@
+"""Request and poll cycle statistics for a FreeKiosk device."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import STATS_WINDOW
+
+
+def _percentile(ordered: list[float], share: float) -> float | None:
+    """Return the value below which ``share`` of the sorted samples fall."""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(len(ordered) * share))]
+
+
+def _summary(samples: deque[float]) -> dict[str, float | None]:
+    """Return p50/p95/max in milliseconds of a window of durations."""
+    ordered = sorted(samples)
+    return {
+        "p50_ms": _ms(_percentile(ordered, 0.5)),
+        "p95_ms": _ms(_percentile(ordered, 0.95)),
+        "max_ms": _ms(ordered[-1] if ordered else None),
+    }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def _window() -> deque[float]:
+    return deque(maxlen=STATS_WINDOW)
+
+
+@dataclass(slots=True)
+class CycleTiming:
+    """
+    Where the time of one coordinator update went, in seconds.
+
+    ``fetch`` is ``None`` for updates that did not poll the device, such as
+    pushes. Parsing and listener fan-out run without yielding to the event
+    loop, so together they are how long the update blocked it.
+    """
+
+    entry_id: str
+    fetch: float | None
+    parse: float = 0.0
+    fan_out: float = 0.0
+    listeners: int = 0
+    success: bool = True
+
+    @property
+    def blocking(self) -> float:
+        """Return how long the update held the event loop."""
+        return self.parse + self.fan_out
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing as plain data in milliseconds."""
+        return {
+            "entry_id": self.entry_id,
+            "fetch_ms": _ms(self.fetch),
+            "parse_ms": _ms(self.parse),
+            "fan_out_ms": _ms(self.fan_out),
+            "listeners": self.listeners,
+            "success": self.success,
+        }
+
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Counters and a latency window for one endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    bytes: int = 0
+    error_types: Counter[str] = field(default_factory=Counter)
+    latencies: deque[float] = field(default_factory=_window)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as plain data."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "bytes": self.bytes,
+            "error_types": dict(self.error_types),
+            **_summary(self.latencies),
+        }
+
+
+@dataclass(slots=True)
+class FreeKioskStats:
+    """
+    Statistics of the requests sent to one device and of its poll cycles.
+
+    Counters cover the lifetime of the config entry; latencies are kept for
+    the last ``STATS_WINDOW`` requests per endpoint and poll cycles.
+    """
+
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+    cycles: deque[float] = field(default_factory=_window)
+    fan_outs: deque[float] = field(default_factory=_window)
+
+    def record_request(
+        self,
+        endpoint: str,
+        duration: float,
+        size: int = 0,
+        error: str | None = None,
+    ) -> None:
+        """Record one request; ``error`` names the failure, if any."""
+        if (stats := self.endpoints.get(endpoint)) is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        stats.requests += 1
+        stats.bytes += size
+        stats.latencies.append(duration)
+        if error is not None:
+            self.record_error(endpoint, error)
+            if error == "timeout":
+                stats.timeouts += 1
+
+    def record_error(self, endpoint: str, error: str) -> None:
+        """Record a failure found after the request itself completed."""
+        if (stats := self.endpoints.get(endpoint)) is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        stats.errors += 1
+        stats.error_types[error] += 1
+
+    def record_cycle(self, duration: float) -> None:
+        """Record the duration of one coordinator refresh."""
+        self.cycles.append(duration)
+
+    def record_fan_out(self, duration: float) -> None:
+        """Record how long notifying the entities of an update took."""
+        self.fan_outs.append(duration)
+
+    @property
+    def last_cycle_ms(self) -> float | None:
+        """Return the duration of the latest poll cycle."""
+        return _ms(self.cycles[-1]) if self.cycles else None
+
+    @property
+    def cycle_summary(self) -> dict[str, float | None]:
+        """Return p50/p95/max of the recent poll cycles."""
+        return _summary(self.cycles)
+
+    @property
+    def latency_summary(self) -> dict[str, float | None]:
+        """Return p50/p95/max of recent requests across every endpoint."""
+        samples: deque[float] = deque()
+        for stats in self.endpoints.values():
+            samples.extend(stats.latencies)
+        return _summary(samples)
+
+    @property
+    def endpoint_p95_ms(self) -> dict[str, float | None]:
+        """Return the p95 latency of each endpoint."""
+        return {
+            endpoint: _ms(_percentile(sorted(stats.latencies), 0.95))
+            for endpoint, stats in sorted(self.endpoints.items())
+        }
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests sent."""
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        """Return the number of failed requests."""
+        return sum(stats.errors for stats in self.endpoints.values())
+
+    @property
+    def timeouts(self) -> int:
+        """Return the number of requests that timed out."""
+        return sum(stats.timeouts for stats in self.endpoints.values())
+
+    @property
+    def bytes(self) -> int:
+        """Return the number of response bytes received."""
+        return sum(stats.bytes for stats in self.endpoints.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every statistic as plain data."""
+        return {
+            "cycles": {"count": len(self.cycles), **self.cycle_summary},
+            "fan_out": _summary(self.fan_outs),
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+        }
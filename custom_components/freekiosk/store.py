@@ -0,0 +1,63 @@
+"""Persistence of the last known FreeKiosk status."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STATUS_SAVE_DELAY, STATUS_STORAGE_VERSION
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class FreeKioskStatusStore:
+    """
+    Keep the last good status payload of one device on disk.
+
+    Saves are delayed by ``STATUS_SAVE_DELAY`` and coalesced, so a device
+    that changes on every poll is still written at most once per delay. The
+    payload written is the latest one at the time of the write.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STATUS_STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._raw: dict[str, Any] | None = None
+        self._save_pending = False
+        self.saved_at: str | None = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the persisted status payload, if any."""
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict) or not isinstance(stored.get("status"), dict):
+            return None
+        self._raw = stored["status"]
+        self.saved_at = stored.get("saved_at")
+        return self._raw
+
+    @callback
+    def async_save(self, raw: dict[str, Any]) -> None:
+        """Schedule writing ``raw`` unless it is what was last stored."""
+        if raw is self._raw:
+            return
+        self._raw = raw
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, STATUS_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the payload to write."""
+        self._save_pending = False
+        self.saved_at = datetime.now(UTC).isoformat()
+        return {"saved_at": self.saved_at, "status": self._raw}
+
+    async def async_remove(self) -> None:
+        """Delete the persisted status."""
+        await self._store.async_remove()
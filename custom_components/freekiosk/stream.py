@@ -0,0 +1,124 @@
+"""Persistent event stream feeding FreeKiosk status into the coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .api import (
+    FreeKioskApiClientAuthenticationError,
+    FreeKioskApiClientError,
+    FreeKioskApiClientUnsupportedError,
+)
+from .const import (
+    DOMAIN,
+    LOGGER,
+    STREAM_RECONNECT_MAX,
+    STREAM_RECONNECT_MIN,
+    TRANSPORT_AUTO,
+    TRANSPORT_SSE,
+    TRANSPORT_WEBSOCKET,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import FreeKioskConfigEntry
+
+
+class FreeKioskEventStream:
+    """
+    Keep a WebSocket or SSE stream to a device open.
+
+    Every event is merged into the coordinator like a webhook push. While the
+    stream is connected the coordinator only polls as a safety net; when it
+    drops, polling takes over again until the stream reconnects. In ``auto``
+    mode the WebSocket is tried first, then SSE, and a device that offers
+    neither simply stays on polling.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: FreeKioskConfigEntry,
+        transport: str,
+    ) -> None:
+        """Initialize the stream."""
+        self._hass = hass
+        self._entry = entry
+        self._transports = (
+            [TRANSPORT_WEBSOCKET, TRANSPORT_SSE]
+            if transport == TRANSPORT_AUTO
+            else [transport]
+        )
+        self._last_event_id: str | None = None
+        self._connected = False
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the stream in the background."""
+        self._task = self._entry.async_create_background_task(
+            self._hass,
+            self._async_run(),
+            name=f"{DOMAIN} event stream {self._entry.title}",
+        )
+
+    async def async_stop(self) -> None:
+        """Close the stream."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    @callback
+    def _async_connected(self) -> None:
+        """Switch the coordinator to safety-net polling and resync once."""
+        self._connected = True
+        coordinator = self._entry.runtime_data.coordinator
+        coordinator.async_set_stream_connected(connected=True)
+        # Events sent while the stream was down are not replayed by every
+        # device, so a single refresh closes the gap.
+        self._hass.async_create_task(coordinator.async_request_refresh())
+
+    async def _async_run(self) -> None:
+        """Connect, consume events and reconnect with backoff until stopped."""
+        coordinator = self._entry.runtime_data.coordinator
+        client = self._entry.runtime_data.client
+        transports = list(self._transports)
+        delay = STREAM_RECONNECT_MIN
+        while transports:
+            transport = transports[0]
+            self._connected = False
+            try:
+                async for event_id, event in client.async_stream_events(
+                    transport, self._last_event_id, self._async_connected
+                ):
+                    if event_id is not None:
+                        self._last_event_id = event_id
+                    coordinator.async_apply_push(event)
+            except FreeKioskApiClientUnsupportedError:
+                LOGGER.debug(
+                    "%s does not offer a %s stream", self._entry.title, transport
+                )
+                transports.pop(0)
+                continue
+            except FreeKioskApiClientAuthenticationError:
+                # Polling raises the reauth flow; there is nothing to retry.
+                return
+            except FreeKioskApiClientError:
+                pass
+            finally:
+                if self._connected:
+                    coordinator.async_set_stream_connected(connected=False)
+
+            if self._connected:
+                delay = STREAM_RECONNECT_MIN
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))  # noqa: S311
+            delay = min(delay * 2, STREAM_RECONNECT_MAX)
+        LOGGER.debug("%s stays on polling", self._entry.title)
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 
-from .entity import FreeKioskEntity
+from .entity import FreeKioskEntity, async_add_reported_entities
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -16,13 +16,12 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .coordinator import FreeKioskDataUpdateCoordinator
-    from .data import FreeKioskConfigEntry
+    from .data import FreeKioskConfigEntry, FreeKioskStatus
 
 
-def _auto_brightness_payload(data: dict[str, Any]) -> dict[str, Any]:
-    settings = data.get("autoBrightness", {}) or {}
-    min_value = settings.get("min")
-    max_value = settings.get("max")
+def _auto_brightness_payload(data: FreeKioskStatus) -> dict[str, Any]:
+    min_value = data.auto_brightness.min
+    max_value = data.auto_brightness.max
     if min_value is None:
         min_value = 10
     if max_value is None:
@@ -34,10 +33,11 @@ def _auto_brightness_payload(data: dict[str, Any]) -> dict[str, Any]:
 class FreeKioskSwitchDescription(SwitchEntityDescription):
     """Describes a FreeKiosk switch."""
 
-    value_fn: Callable[[dict[str, Any]], bool] = lambda _: False  # type: ignore[assignment]
+    path: tuple[str, ...] = ()
+    value_fn: Callable[[FreeKioskStatus], bool] = lambda _: False  # type: ignore[assignment]
     turn_on_endpoint: str = ""
     turn_off_endpoint: str = ""
-    turn_on_payload: Callable[[dict[str, Any]], dict[str, Any] | None] | None = None
+    turn_on_payload: Callable[[FreeKioskStatus], dict[str, Any] | None] | None = None
 
 
 SWITCH_DESCRIPTIONS: tuple[FreeKioskSwitchDescription, ...] = (
@@ -45,7 +45,8 @@ SWITCH_DESCRIPTIONS: tuple[FreeKioskSwitchDescription, ...] = (
         key="screen",
         name="Screen",
         icon="mdi:monitor",
-        value_fn=lambda data: data.get("screen", {}).get("on") is True,
+        path=("screen", "on"),
+        value_fn=lambda data: data.screen.on is True,
         turn_on_endpoint="/api/screen/on",
         turn_off_endpoint="/api/screen/off",
     ),
@@ -53,7 +54,8 @@ SWITCH_DESCRIPTIONS: tuple[FreeKioskSwitchDescription, ...] = (
         key="screensaver",
         name="Screensaver",
         icon="mdi:power-sleep",
-        value_fn=lambda data: data.get("screen", {}).get("screensaverActive") is True,
+        path=("screen", "screensaverActive"),
+        value_fn=lambda data: data.screen.screensaver_active,
         turn_on_endpoint="/api/screensaver/on",
         turn_off_endpoint="/api/screensaver/off",
     ),
@@ -61,7 +63,8 @@ SWITCH_DESCRIPTIONS: tuple[FreeKioskSwitchDescription, ...] = (
         key="auto_brightness",
         name="Auto Brightness",
         icon="mdi:brightness-auto",
-        value_fn=lambda data: data.get("autoBrightness", {}).get("enabled") is True,
+        path=("autoBrightness", "enabled"),
+        value_fn=lambda data: data.auto_brightness.enabled,
         turn_on_endpoint="/api/autoBrightness/enable",
         turn_off_endpoint="/api/autoBrightness/disable",
         turn_on_payload=_auto_brightness_payload,
@@ -75,12 +78,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up FreeKiosk switches."""
-    async_add_entities(
-        FreeKioskSwitch(
-            coordinator=entry.runtime_data.coordinator,
-            entity_description=description,
-        )
-        for description in SWITCH_DESCRIPTIONS
+    coordinator = entry.runtime_data.coordinator
+    async_add_reported_entities(
+        entry,
+        async_add_entities,
+        SWITCH_DESCRIPTIONS,
+        lambda description: FreeKioskSwitch(coordinator, description),
     )
 
 
@@ -93,7 +96,11 @@ class FreeKioskSwitch(FreeKioskEntity, SwitchEntity):
         entity_description: FreeKioskSwitchDescription,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, unique_id=f"switch_{entity_description.key}")
+        super().__init__(
+            coordinator,
+            unique_id=f"switch_{entity_description.key}",
+            path=entity_description.path,
+        )
         self.entity_description = entity_description
 
     @property
@@ -108,15 +115,15 @@ class FreeKioskSwitch(FreeKioskEntity, SwitchEntity):
             if self.entity_description.turn_on_payload
             else None
         )
-        await self.coordinator.config_entry.runtime_data.client.async_post_command(
+        await self._async_send_command(
             self.entity_description.turn_on_endpoint,
             payload,
+            optimistic={self.entity_description.path: True},
         )
-        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn the switch off."""
-        await self.coordinator.config_entry.runtime_data.client.async_post_command(
+        await self._async_send_command(
             self.entity_description.turn_off_endpoint,
+            optimistic={self.entity_description.path: False},
         )
-        await self.coordinator.async_request_refresh()
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from homeassistant.components.text import TextEntity
 
-from .entity import FreeKioskEntity
+from .entity import FreeKioskEntity, async_add_reported_entities
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
     from .coordinator import FreeKioskDataUpdateCoordinator
     from .data import FreeKioskConfigEntry
 
+URL_PATH = ("webview", "currentUrl")
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -22,7 +24,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the FreeKiosk text entity."""
-    async_add_entities([FreeKioskUrlText(entry.runtime_data.coordinator)])
+    coordinator = entry.runtime_data.coordinator
+    async_add_reported_entities(
+        entry,
+        async_add_entities,
+        [URL_PATH],
+        lambda _path: FreeKioskUrlText(coordinator),
+        paths=lambda path: (path,),
+    )
 
 
 class FreeKioskUrlText(FreeKioskEntity, TextEntity):
@@ -32,18 +41,23 @@ class FreeKioskUrlText(FreeKioskEntity, TextEntity):
 
     def __init__(self, coordinator: FreeKioskDataUpdateCoordinator) -> None:
         """Initialize the text entity."""
-        super().__init__(coordinator, unique_id="webview_url")
+        super().__init__(
+            coordinator,
+            unique_id="webview_url",
+            path=URL_PATH,
+        )
         self._attr_name = "FreeKiosk WebView URL"
 
     @property
     def native_value(self) -> str | None:
         """Return the current WebView URL."""
-        return self._get_path("webview", "currentUrl")
+        return self._get_status().webview.current_url
 
     async def async_set_value(self, value: str) -> None:
         """Set a new target URL on the kiosk."""
-        await self.coordinator.config_entry.runtime_data.client.async_post_command(
+        await self._async_send_command(
             "/api/url",
             {"url": value},
+            optimistic={("webview", "currentUrl"): value},
+            coalesce=True,
         )
-        await self.coordinator.async_request_refresh()
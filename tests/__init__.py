@@ -0,0 +1,49 @@
+"""Tests for the FreeKiosk integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from custom_components.freekiosk.const import (
+    REST_ENDPOINT_HEALTH,
+    REST_ENDPOINT_STATUS,
+)
+
+if TYPE_CHECKING:
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+DEVICE_URL = "http://kiosk.local:8080"
+
+STATUS = {
+    "screen": {"on": True, "brightness": 80, "screensaverActive": False},
+    "battery": {"level": 50, "charging": True, "plugged": "ac"},
+    "audio": {"volume": 40},
+    "webview": {"currentUrl": "http://dashboard.local/", "loading": False},
+    "sensors": {"light": 120.5},
+}
+HEALTH = {"status": "ok"}
+
+
+def envelope(data: Any) -> dict[str, Any]:
+    """Wrap data the way every FreeKiosk response does."""
+    return {"success": True, "data": data, "timestamp": 1}
+
+
+def mock_device(
+    aioclient_mock: AiohttpClientMocker,
+    status: Any = STATUS,
+    **responses: Any,
+) -> None:
+    """
+    Answer the device endpoints, replacing every earlier answer.
+
+    ``responses`` map endpoints such as ``"/api/screen"`` to keyword arguments
+    of ``aioclient_mock.get``; health answers with ``HEALTH`` by default.
+    """
+    aioclient_mock.clear_requests()
+    responses.setdefault(REST_ENDPOINT_HEALTH, {"json": envelope(HEALTH)})
+    responses.setdefault(REST_ENDPOINT_STATUS, {"json": envelope(status)})
+    for endpoint, response in responses.items():
+        aioclient_mock.get(f"{DEVICE_URL}{endpoint}", **response)
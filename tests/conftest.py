@@ -0,0 +1,94 @@
+"""Fixtures for FreeKiosk tests."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.const import CONF_API_KEY
+from homeassistant.loader import async_get_integration
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.freekiosk.api import FreeKioskApiClient
+from custom_components.freekiosk.commands import FreeKioskCommandCoalescer
+from custom_components.freekiosk.const import (
+    CONF_DEVICE_URL,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    POLLING_MODE_STATUS,
+)
+from custom_components.freekiosk.coordinator import FreeKioskDataUpdateCoordinator
+from custom_components.freekiosk.data import FreeKioskData
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from aiohttp import ClientSession
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+from . import DEVICE_URL, mock_device
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a FreeKiosk config entry added to Home Assistant."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Kiosk",
+        unique_id=DEVICE_URL,
+        data={CONF_DEVICE_URL: DEVICE_URL, CONF_API_KEY: None},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def session(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> AsyncGenerator[ClientSession]:
+    """Return a client session talking to a mocked device."""
+    mock_device(aioclient_mock)
+    session = aioclient_mock.create_session(hass.loop)
+    yield session
+    await session.close()
+
+
+@pytest.fixture
+def polling_mode() -> str:
+    """Return the polling mode of the coordinator fixture."""
+    return POLLING_MODE_STATUS
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    config_entry: MockConfigEntry,
+    session: ClientSession,
+    polling_mode: str,
+) -> FreeKioskDataUpdateCoordinator:
+    """Return a coordinator talking to the mocked device, wired like on setup."""
+    del enable_custom_integrations
+    coordinator = FreeKioskDataUpdateCoordinator(
+        hass=hass,
+        logger=LOGGER,
+        name=DOMAIN,
+        config_entry=config_entry,
+        poll_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+        polling_mode=polling_mode,
+    )
+    client = FreeKioskApiClient(base_url=DEVICE_URL, session=session)
+    config_entry.runtime_data = FreeKioskData(
+        client=client,
+        coordinator=coordinator,
+        commands=FreeKioskCommandCoalescer(hass, config_entry, client),
+        integration=await async_get_integration(hass, DOMAIN),
+    )
+    return coordinator
@@ -0,0 +1,58 @@
+"""Tests for the FreeKiosk API client."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.freekiosk.api import (
+    UNCHANGED,
+    FreeKioskApiClient,
+    FreeKioskApiClientCommunicationError,
+    payload_digest,
+)
+from custom_components.freekiosk.const import REST_ENDPOINT_STATUS
+
+from . import DEVICE_URL, STATUS, envelope, mock_device
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+
+def test_payload_digest_ignores_timestamps() -> None:
+    """Bodies that only differ in their timestamp share a digest."""
+    first = b'{"success": true, "data": {"screen": {"on": true}}, "timestamp": 1}'
+    second = b'{"success": true, "data": {"screen": {"on": true}}, "timestamp": 2.5}'
+    assert payload_digest(first) == payload_digest(second)
+
+
+def test_payload_digest_detects_changes() -> None:
+    """Any other difference changes the digest."""
+    first = b'{"data": {"screen": {"on": true}}, "timestamp": 1}'
+    second = b'{"data": {"screen": {"on": false}}, "timestamp": 1}'
+    assert payload_digest(first) != payload_digest(second)
+
+
+async def test_unchanged_status_is_not_decoded(session: ClientSession) -> None:
+    """A body matching the previous digest is reported as unchanged."""
+    client = FreeKioskApiClient(base_url=DEVICE_URL, session=session)
+    digest, status = await client.async_get_status_if_changed(None)
+    assert status == envelope(STATUS)
+    assert await client.async_get_status_if_changed(digest) == (digest, UNCHANGED)
+
+
+@pytest.mark.parametrize("body", ["", "  ", "null", "[]"])
+async def test_status_must_be_an_object(
+    aioclient_mock: AiohttpClientMocker, session: ClientSession, body: str
+) -> None:
+    """Empty status bodies are errors, not unchanged or empty payloads."""
+    mock_device(aioclient_mock, **{REST_ENDPOINT_STATUS: {"text": body}})
+    client = FreeKioskApiClient(base_url=DEVICE_URL, session=session)
+    with pytest.raises(FreeKioskApiClientCommunicationError):
+        await client.async_get_status_if_changed(None)
+    stats = client.stats.endpoints[f"GET {REST_ENDPOINT_STATUS}"]
+    assert stats.error_types == {"malformed": 1}
@@ -0,0 +1,108 @@
+"""Tests for coalescing FreeKiosk commands."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from custom_components.freekiosk.api import FreeKioskApiClientError
+from custom_components.freekiosk.commands import FreeKioskCommandCoalescer
+
+ENDPOINT = "/api/brightness"
+
+
+class _FakeClient:
+    """Record commands and hold each one until released."""
+
+    def __init__(self, errors: list[Exception] | None = None) -> None:
+        self.sent: list[tuple[str, dict[str, Any] | None]] = []
+        self.errors = errors or []
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def async_post_command(
+        self, endpoint: str, data: dict[str, Any] | None = None
+    ) -> dict[str, object]:
+        self.sent.append((endpoint, data))
+        self.started.set()
+        await self.release.wait()
+        if self.errors:
+            raise self.errors.pop(0)
+        return {}
+
+
+def _coalescer(client: _FakeClient) -> FreeKioskCommandCoalescer:
+    """Return a coalescer whose workers run as plain tasks."""
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(loop=loop)
+    entry = SimpleNamespace(
+        async_create_background_task=lambda _hass, coro, name: loop.create_task(
+            coro, name=name
+        )
+    )
+    return FreeKioskCommandCoalescer(hass, entry, client)  # type: ignore[arg-type]
+
+
+async def _send_while_busy(
+    client: _FakeClient, *values: int
+) -> tuple[FreeKioskCommandCoalescer, list[asyncio.Task[None]]]:
+    """Send the first value, then queue the others while it is in flight."""
+    coalescer = _coalescer(client)
+    first, *rest = values
+    sends = [asyncio.create_task(coalescer.async_send(ENDPOINT, {"value": first}))]
+    await client.started.wait()
+    sends += [
+        asyncio.create_task(coalescer.async_send(ENDPOINT, {"value": value}))
+        for value in rest
+    ]
+    await asyncio.sleep(0)
+    return coalescer, sends
+
+
+async def test_only_newest_queued_value_is_sent() -> None:
+    """Values queued behind an in-flight command collapse into the newest."""
+    client = _FakeClient()
+    _coalescer, sends = await _send_while_busy(client, 1, 2, 3)
+    client.release.set()
+    await asyncio.gather(*sends)
+    assert client.sent == [(ENDPOINT, {"value": 1}), (ENDPOINT, {"value": 3})]
+
+
+async def test_failure_does_not_drop_newer_values() -> None:
+    """A failed command fails its callers only; the newest value still goes out."""
+    client = _FakeClient([FreeKioskApiClientError("boom")])
+    _coalescer, sends = await _send_while_busy(client, 1, 2, 3)
+    client.release.set()
+    results = await asyncio.gather(*sends, return_exceptions=True)
+    assert isinstance(results[0], FreeKioskApiClientError)
+    assert results[1:] == [None, None]
+    assert client.sent == [(ENDPOINT, {"value": 1}), (ENDPOINT, {"value": 3})]
+
+
+async def test_endpoints_are_independent() -> None:
+    """Values for different endpoints never replace each other."""
+    client = _FakeClient()
+    client.release.set()
+    coalescer = _coalescer(client)
+    await asyncio.gather(
+        coalescer.async_send(ENDPOINT, {"value": 1}),
+        coalescer.async_send("/api/volume", {"value": 2}),
+    )
+    assert sorted(client.sent) == [
+        (ENDPOINT, {"value": 1}),
+        ("/api/volume", {"value": 2}),
+    ]
+
+
+async def test_stop_cancels_waiting_callers() -> None:
+    """Stopping the coalescer cancels the commands still in flight or queued."""
+    client = _FakeClient()
+    coalescer, sends = await _send_while_busy(client, 1, 2)
+    coalescer.async_stop()
+    for send in sends:
+        with pytest.raises(asyncio.CancelledError):
+            await send
+    assert client.sent == [(ENDPOINT, {"value": 1})]
@@ -0,0 +1,66 @@
+"""Tests for the FreeKiosk config and options flows."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.freekiosk.const import (
+    CONF_DEDICATED_POOL,
+    CONF_MJPEG_MAX_FPS,
+    CONF_POLLING_MODE,
+    CONF_PUSH,
+    CONF_SLOW_CYCLE_WARNING,
+    CONF_TRANSPORT,
+    DEFAULT_DEDICATED_POOL,
+    DEFAULT_MJPEG_MAX_FPS,
+    DEFAULT_POLLING_MODE,
+    DEFAULT_SLOW_CYCLE_WARNING,
+    DEFAULT_TRANSPORT,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+
+async def _async_set_options(
+    hass: HomeAssistant, entry: MockConfigEntry, **options: Any
+) -> dict[str, Any]:
+    """Submit the options form and return the stored options."""
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_POLLING_MODE: DEFAULT_POLLING_MODE,
+            CONF_MJPEG_MAX_FPS: DEFAULT_MJPEG_MAX_FPS,
+            CONF_DEDICATED_POOL: DEFAULT_DEDICATED_POOL,
+            CONF_TRANSPORT: DEFAULT_TRANSPORT,
+            CONF_SLOW_CYCLE_WARNING: DEFAULT_SLOW_CYCLE_WARNING,
+            **options,
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    return dict(entry.options)
+
+
+async def test_webhook_id_survives_turning_push_off(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Turning push off and on again keeps the webhook URL."""
+    del enable_custom_integrations
+    assert CONF_WEBHOOK_ID not in await _async_set_options(
+        hass, config_entry, **{CONF_PUSH: False}
+    )
+    webhook_id = (await _async_set_options(hass, config_entry, **{CONF_PUSH: True}))[
+        CONF_WEBHOOK_ID
+    ]
+    options = await _async_set_options(hass, config_entry, **{CONF_PUSH: False})
+    assert options[CONF_WEBHOOK_ID] == webhook_id
+    options = await _async_set_options(hass, config_entry, **{CONF_PUSH: True})
+    assert options[CONF_WEBHOOK_ID] == webhook_id
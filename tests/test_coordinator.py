@@ -0,0 +1,330 @@
+"""Tests for the FreeKiosk coordinator."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.freekiosk.api import FreeKioskApiClientCommunicationError
+from custom_components.freekiosk.const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_BACKOFF,
+    CONFIRM_REFRESH_DELAY,
+    DEFAULT_SCAN_INTERVAL,
+    FAST_SCAN_INTERVAL,
+    POLLING_MODE_STATUS,
+    POLLING_MODE_TIERED,
+    REST_ENDPOINT_BATTERY,
+    REST_ENDPOINT_HEALTH,
+    REST_ENDPOINT_SCREEN,
+    REST_ENDPOINT_STATUS,
+)
+from custom_components.freekiosk.coordinator import (
+    FreeKioskDataUpdateCoordinator,
+    _apply_updates,
+    _diff_paths,
+    _merge,
+    _with_derived_paths,
+)
+
+from . import DEVICE_URL, STATUS, envelope, mock_device
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+COMMAND = "/api/brightness"
+
+
+def test_diff_paths_equal_payloads() -> None:
+    """Identical payloads have no changed paths."""
+    raw = {"screen": {"on": True, "brightness": 80}}
+    assert _diff_paths(raw, {"screen": {"on": True, "brightness": 80}}) == set()
+
+
+def test_diff_paths_changed_value() -> None:
+    """A changed value marks its path and every parent."""
+    old = {"screen": {"on": True, "brightness": 80}, "audio": {"volume": 5}}
+    new = {"screen": {"on": False, "brightness": 80}, "audio": {"volume": 5}}
+    assert _diff_paths(old, new) == {(), ("screen",), ("screen", "on")}
+
+
+def test_diff_paths_added_and_removed_sections() -> None:
+    """Every path below an added or removed section changes."""
+    old = {"wifi": {"ssid": "kiosk", "signalStrength": -60}}
+    new = {"battery": {"level": 50}}
+    assert _diff_paths(old, new) == {
+        (),
+        ("wifi",),
+        ("wifi", "ssid"),
+        ("wifi", "signalStrength"),
+        ("battery",),
+        ("battery", "level"),
+    }
+
+
+def test_diff_paths_type_change() -> None:
+    """A value replaced by an object changes the value and its children."""
+    assert _diff_paths({"sensors": None}, {"sensors": {"light": 3}}) == {
+        (),
+        ("sensors",),
+        ("sensors", "light"),
+    }
+
+
+def test_with_derived_paths() -> None:
+    """Derived values change with their inputs."""
+    changed = _with_derived_paths({("storage",), ("storage", "availableMB")})
+    assert ("storage", "usedMB") in changed
+    assert ("storage", "usedPercent") in changed
+    assert ("memory", "usedMB") not in changed
+
+
+def test_apply_updates_copies_touched_sections() -> None:
+    """Updated sections are copied, untouched ones are shared."""
+    raw = {"screen": {"on": True, "brightness": 80}, "audio": {"volume": 5}}
+    updated = _apply_updates(raw, {("screen", "brightness"): 20})
+    assert updated == {"screen": {"on": True, "brightness": 20}, "audio": {"volume": 5}}
+    assert raw["screen"]["brightness"] == 80
+    assert updated["audio"] is raw["audio"]
+
+
+def test_apply_updates_creates_missing_sections() -> None:
+    """Paths below missing or non-object values are created."""
+    updated = _apply_updates({"webview": None}, {("webview", "currentUrl"): "x"})
+    assert updated == {"webview": {"currentUrl": "x"}}
+
+
+def test_merge_is_recursive() -> None:
+    """A delta is merged object by object without touching the original."""
+    raw = {"screen": {"on": True, "brightness": 80}, "audio": {"volume": 5}}
+    merged = _merge(raw, {"screen": {"on": False}, "battery": {"level": 10}})
+    assert merged == {
+        "screen": {"on": False, "brightness": 80},
+        "audio": {"volume": 5},
+        "battery": {"level": 10},
+    }
+    assert raw["screen"]["on"] is True
+    assert merged["audio"] is raw["audio"]
+
+
+def test_merge_replaces_non_objects() -> None:
+    """Values that are not objects on both sides are replaced."""
+    merged = _merge({"sensors": {"light": 3}}, {"sensors": None})
+    assert merged == {"sensors": None}
+
+
+@pytest.mark.parametrize("polling_mode", [POLLING_MODE_STATUS, POLLING_MODE_TIERED])
+async def test_empty_status_fails_the_refresh(
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """An empty status body is an error, not an unchanged payload."""
+    mock_device(aioclient_mock, **{REST_ENDPOINT_STATUS: {"text": ""}})
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert "Unexpected error" not in caplog.text
+
+    mock_device(aioclient_mock)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data.screen.brightness == STATUS["screen"]["brightness"]
+
+    coordinator.async_note_command()  # forces a full resync in tiered mode
+    mock_device(aioclient_mock, **{REST_ENDPOINT_STATUS: {"text": ""}})
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+
+
+async def test_unchanged_status_keeps_the_snapshot(
+    coordinator: FreeKioskDataUpdateCoordinator,
+) -> None:
+    """A body matching the current data's digest is not parsed again."""
+    await coordinator.async_refresh()
+    data = coordinator.data
+    await coordinator.async_refresh()
+    assert coordinator.data is data
+
+
+async def test_unchanged_status_replaces_restored_data(
+    coordinator: FreeKioskDataUpdateCoordinator,
+) -> None:
+    """The first refresh after a restore replaces the stale snapshot."""
+    await coordinator.async_refresh()
+    coordinator.async_set_cached_data(STATUS)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert not coordinator.stale
+
+
+def _requested(aioclient_mock: AiohttpClientMocker) -> list[str]:
+    """Return the paths requested from the mocked device."""
+    return [url.path for _method, url, _data, _headers in aioclient_mock.mock_calls]
+
+
+@pytest.mark.parametrize("polling_mode", [POLLING_MODE_TIERED])
+async def test_tiered_keeps_sections_of_failed_groups(
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """A group that fails keeps its previous section; the others update."""
+    await coordinator.async_refresh()
+    mock_device(
+        aioclient_mock,
+        **{
+            REST_ENDPOINT_SCREEN: {"json": envelope({**STATUS["screen"], "on": False})},
+            REST_ENDPOINT_BATTERY: {"exc": TimeoutError()},
+        },
+    )
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data.screen.on is False
+    assert coordinator.data.battery.level == STATUS["battery"]["level"]
+
+    mock_device(
+        aioclient_mock,
+        **{
+            REST_ENDPOINT_SCREEN: {"exc": TimeoutError()},
+            REST_ENDPOINT_BATTERY: {"exc": TimeoutError()},
+        },
+    )
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+
+
+@pytest.mark.parametrize("polling_mode", [POLLING_MODE_TIERED])
+async def test_tiered_falls_back_to_status_without_narrow_endpoints(
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """Firmware without a narrow endpoint is polled through /api/status."""
+    await coordinator.async_refresh()
+    screen_off = {**STATUS, "screen": {**STATUS["screen"], "on": False}}
+    mock_device(
+        aioclient_mock,
+        screen_off,
+        **{
+            REST_ENDPOINT_SCREEN: {"status": 404},
+            REST_ENDPOINT_BATTERY: {"json": envelope(STATUS["battery"])},
+        },
+    )
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data.screen.on is False
+    assert REST_ENDPOINT_STATUS in _requested(aioclient_mock)
+
+    aioclient_mock.mock_calls.clear()
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert REST_ENDPOINT_SCREEN not in _requested(aioclient_mock)
+    assert REST_ENDPOINT_STATUS in _requested(aioclient_mock)
+
+
+@pytest.mark.parametrize(
+    ("polling_mode", "interval"),
+    [(POLLING_MODE_STATUS, FAST_SCAN_INTERVAL), (POLLING_MODE_TIERED, None)],
+)
+async def test_loading_webview_polls_fast_in_status_mode(
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+    interval: int | None,
+) -> None:
+    """Only the status mode, which always reads the WebView, follows loading."""
+    loading = {**STATUS, "webview": {**STATUS["webview"], "loading": True}}
+    mock_device(aioclient_mock, loading)
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == timedelta(
+        seconds=interval or DEFAULT_SCAN_INTERVAL
+    )
+
+
+async def test_circuit_backs_off_and_probes_health(
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """An unreachable device is probed with /api/health on a growing interval."""
+    mock_device(
+        aioclient_mock,
+        **{
+            REST_ENDPOINT_HEALTH: {"exc": TimeoutError()},
+            REST_ENDPOINT_STATUS: {"exc": TimeoutError()},
+        },
+    )
+    intervals = []
+    with patch(
+        "custom_components.freekiosk.coordinator.random.uniform", return_value=1
+    ):
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD + 6):
+            aioclient_mock.mock_calls.clear()
+            await coordinator.async_refresh()
+            intervals.append(coordinator.poll_interval.total_seconds())
+    assert coordinator.circuit_open
+    assert _requested(aioclient_mock) == [REST_ENDPOINT_HEALTH]
+    assert intervals[CIRCUIT_FAILURE_THRESHOLD - 1 :] == [
+        min(DEFAULT_SCAN_INTERVAL * 2**exponent, CIRCUIT_MAX_BACKOFF)
+        for exponent in range(7)
+    ]
+
+    mock_device(aioclient_mock)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert not coordinator.circuit_open
+    assert REST_ENDPOINT_STATUS in _requested(aioclient_mock)
+    assert coordinator.poll_interval == timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+
+async def test_optimistic_value_until_the_device_confirms(
+    hass: HomeAssistant,
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """A command shows its value at once; the confirming refresh has the say."""
+    await coordinator.async_refresh()
+    aioclient_mock.post(f"{DEVICE_URL}{COMMAND}", json=envelope({}))
+    await coordinator.async_send_command(
+        COMMAND, {"value": 10}, optimistic={("screen", "brightness"): 10}
+    )
+    assert coordinator.data.screen.brightness == 10
+
+    # The device ignored the command, so its own value comes back.
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=CONFIRM_REFRESH_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    assert coordinator.data.screen.brightness == STATUS["screen"]["brightness"]
+
+
+async def test_failed_command_is_reverted(
+    hass: HomeAssistant,
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """A failed command raises and is reverted by the confirming refresh."""
+    await coordinator.async_refresh()
+    aioclient_mock.post(f"{DEVICE_URL}{COMMAND}", exc=TimeoutError())
+    with pytest.raises(FreeKioskApiClientCommunicationError):
+        await coordinator.async_send_command(
+            COMMAND, {"value": 10}, optimistic={("screen", "brightness"): 10}
+        )
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=CONFIRM_REFRESH_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    assert coordinator.data.screen.brightness == STATUS["screen"]["brightness"]
+
+
+async def test_unavailable_device_ignores_optimistic_values(
+    coordinator: FreeKioskDataUpdateCoordinator,
+) -> None:
+    """An unavailable device does not pretend to take new values."""
+    coordinator.async_set_unavailable()
+    coordinator.async_apply_optimistic({("screen", "brightness"): 10})
+    assert coordinator.data.screen.brightness is None
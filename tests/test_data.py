@@ -0,0 +1,41 @@
+"""Tests for parsing the FreeKiosk status payload."""
+
+from custom_components.freekiosk.data import FreeKioskStatus
+
+RAW = {
+    "screen": {"on": True, "brightness": 80, "screensaverActive": False},
+    "battery": {"level": 50, "charging": False, "plugged": "none"},
+    "storage": {"totalMB": 1000, "availableMB": 250},
+}
+
+
+def test_from_dict_parses_sections() -> None:
+    """Sections are parsed and derived values filled in."""
+    status = FreeKioskStatus.from_dict(RAW)
+    assert status.screen.on is True
+    assert status.screen.brightness == 80
+    assert status.battery.level == 50
+    assert status.storage.used_mb == 750
+    assert status.raw is RAW
+
+
+def test_from_dict_reuses_unchanged_sections() -> None:
+    """Only the changed sections are parsed again."""
+    previous = FreeKioskStatus.from_dict(RAW)
+    raw = {**RAW, "screen": {**RAW["screen"], "on": False}}
+    status = FreeKioskStatus.from_dict(
+        raw, previous, {(), ("screen",), ("screen", "on")}
+    )
+    assert status.screen.on is False
+    assert status.screen is not previous.screen
+    assert status.battery is previous.battery
+    assert status.storage is previous.storage
+    assert status.raw is raw
+
+
+def test_from_dict_without_changed_paths_parses_everything() -> None:
+    """Without a diff, nothing is taken over from the previous snapshot."""
+    previous = FreeKioskStatus.from_dict(RAW)
+    status = FreeKioskStatus.from_dict(RAW, previous)
+    assert status == previous
+    assert status.battery is not previous.battery
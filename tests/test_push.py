@@ -0,0 +1,91 @@
+"""Tests for the FreeKiosk push webhook."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.components.webhook import async_generate_path
+from homeassistant.const import CONF_API_KEY, CONF_WEBHOOK_ID
+from homeassistant.setup import async_setup_component
+
+from custom_components.freekiosk.const import CONF_HEADER_API_KEY
+from custom_components.freekiosk.push import async_setup_push
+
+from . import STATUS, envelope
+
+if TYPE_CHECKING:
+    from aiohttp.test_utils import TestClient
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+    from custom_components.freekiosk.coordinator import (
+        FreeKioskDataUpdateCoordinator,
+    )
+
+WEBHOOK_ID = "kiosk_webhook"
+PATH = async_generate_path(WEBHOOK_ID)
+API_KEY = "secret"
+
+
+@pytest.fixture
+async def client(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    config_entry: MockConfigEntry,
+    coordinator: FreeKioskDataUpdateCoordinator,
+) -> TestClient:
+    """Return a client posting to the webhook of a refreshed coordinator."""
+    hass.config_entries.async_update_entry(
+        config_entry,
+        data={**config_entry.data, CONF_API_KEY: API_KEY},
+        options={CONF_WEBHOOK_ID: WEBHOOK_ID},
+    )
+    await coordinator.async_refresh()
+    assert await async_setup_component(hass, "webhook", {})
+    async_setup_push(hass, config_entry)
+    return await hass_client_no_auth()
+
+
+async def test_push_requires_the_api_key(
+    client: TestClient, coordinator: FreeKioskDataUpdateCoordinator
+) -> None:
+    """Pushes without the device's API key are rejected."""
+    response = await client.post(PATH, json={"screen": {"brightness": 10}})
+    assert response.status == HTTPStatus.UNAUTHORIZED
+    response = await client.post(
+        PATH, json={"screen": {"brightness": 10}}, headers={CONF_HEADER_API_KEY: "x"}
+    )
+    assert response.status == HTTPStatus.UNAUTHORIZED
+    assert coordinator.data.screen.brightness == STATUS["screen"]["brightness"]
+
+
+@pytest.mark.parametrize("body", ["not json", "[1, 2]"])
+async def test_push_requires_a_json_object(client: TestClient, body: str) -> None:
+    """Bodies that are not a JSON object are rejected."""
+    response = await client.post(
+        PATH, data=body, headers={CONF_HEADER_API_KEY: API_KEY}
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "body", [{"screen": {"brightness": 10}}, envelope({"screen": {"brightness": 10}})]
+)
+async def test_push_merges_the_delta(
+    client: TestClient,
+    coordinator: FreeKioskDataUpdateCoordinator,
+    body: dict[str, object],
+) -> None:
+    """A pushed delta is merged into the status and keeps the rest."""
+    assert not coordinator.push_active
+    response = await client.post(
+        PATH, json=body, headers={CONF_HEADER_API_KEY: API_KEY}
+    )
+    assert response.status == HTTPStatus.OK
+    assert coordinator.data.screen.brightness == 10
+    assert coordinator.data.screen.on is STATUS["screen"]["on"]
+    assert coordinator.data.raw["battery"] == STATUS["battery"]
+    assert coordinator.push_active
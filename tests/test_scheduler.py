@@ -0,0 +1,147 @@
+"""Tests for the fleet poll scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.freekiosk.const import FLEET_MAX_CONCURRENT_POLLS
+from custom_components.freekiosk.scheduler import (
+    FreeKioskPollScheduler,
+    async_get_scheduler,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+INTERVAL = 30
+
+
+class _FakeCoordinator:
+    """Coordinator stand-in whose refreshes wait until released."""
+
+    def __init__(self, entry_id: str, interval: float = INTERVAL) -> None:
+        self.config_entry = SimpleNamespace(entry_id=entry_id)
+        self.poll_interval = timedelta(seconds=interval)
+        self.poll_interval_listener: CALLBACK_TYPE | None = None
+        self.refreshes = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def async_refresh(self) -> None:
+        self.refreshes += 1
+        await self.release.wait()
+
+
+def _offsets(scheduler: FreeKioskPollScheduler) -> dict[str, float]:
+    """Return where in its interval each entry's next poll falls."""
+    return {
+        entry_id: timer.when() % INTERVAL
+        for entry_id, timer in scheduler._timers.items()
+    }
+
+
+def _add(
+    scheduler: FreeKioskPollScheduler, count: int
+) -> tuple[list[_FakeCoordinator], list[CALLBACK_TYPE]]:
+    coordinators = [_FakeCoordinator(f"entry{index}") for index in range(count)]
+    return coordinators, [scheduler.async_add(c) for c in coordinators]
+
+
+async def test_scheduler_is_shared(hass: HomeAssistant) -> None:
+    """Every entry is polled by the same scheduler."""
+    assert async_get_scheduler(hass) is async_get_scheduler(hass)
+
+
+async def test_entries_are_spread_over_the_interval(hass: HomeAssistant) -> None:
+    """Entries get evenly spaced phases, which follow the fleet size."""
+    scheduler = FreeKioskPollScheduler(hass)
+    _coordinators, removers = _add(scheduler, 4)
+    offsets = _offsets(scheduler)
+    for index in range(4):
+        assert offsets[f"entry{index}"] == pytest.approx(
+            index * INTERVAL / 4, abs=1e-6
+        ) or offsets[f"entry{index}"] == pytest.approx(INTERVAL, abs=1e-6)
+
+    removers[1]()
+    offsets = _offsets(scheduler)
+    assert set(offsets) == {"entry0", "entry2", "entry3"}
+    assert offsets["entry2"] == pytest.approx(INTERVAL / 3, abs=1e-6)
+    assert offsets["entry3"] == pytest.approx(2 * INTERVAL / 3, abs=1e-6)
+
+    for remove in (removers[0], *removers[2:]):
+        remove()
+    assert not scheduler._timers
+
+
+async def test_polls_of_an_entry_never_overlap(hass: HomeAssistant) -> None:
+    """Nothing is scheduled while a poll runs; the next one follows it."""
+    scheduler = FreeKioskPollScheduler(hass)
+    (coordinator,), (remove,) = _add(scheduler, 1)
+    coordinator.release.clear()
+    scheduler._async_fire("entry0")
+    await asyncio.sleep(0)
+    assert coordinator.refreshes == 1
+    # An interval change while polling must not start a second poll.
+    coordinator.poll_interval_listener()
+    assert "entry0" not in scheduler._timers
+
+    coordinator.release.set()
+    await scheduler._polls["entry0"]
+    assert "entry0" in scheduler._timers
+    remove()
+
+
+async def test_first_refresh_counts_as_a_poll(hass: HomeAssistant) -> None:
+    """The first scheduled poll waits for a first refresh still in flight."""
+    scheduler = FreeKioskPollScheduler(hass)
+    coordinator = _FakeCoordinator("entry0")
+    coordinator.release.clear()
+    first_refresh = hass.async_create_task(coordinator.async_refresh())
+    remove = scheduler.async_add(coordinator, first_refresh)
+    assert "entry0" not in scheduler._timers
+
+    coordinator.release.set()
+    await first_refresh
+    assert "entry0" in scheduler._timers
+    remove()
+
+
+async def test_remove_cancels_a_running_poll(hass: HomeAssistant) -> None:
+    """Removing an entry cancels its poll and stops its listener."""
+    scheduler = FreeKioskPollScheduler(hass)
+    (coordinator,), (remove,) = _add(scheduler, 1)
+    coordinator.release.clear()
+    scheduler._async_fire("entry0")
+    await asyncio.sleep(0)
+    poll = scheduler._polls["entry0"]
+
+    remove()
+    await hass.async_block_till_done()
+    assert poll.cancelled()
+    assert coordinator.poll_interval_listener is None
+    assert not scheduler._timers
+
+
+async def test_warns_when_the_fleet_outgrows_the_poll_budget(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Polls that would need more slots than allowed are reported once."""
+    scheduler = FreeKioskPollScheduler(hass)
+    _coordinators, removers = _add(scheduler, FLEET_MAX_CONCURRENT_POLLS + 1)
+    for index in range(FLEET_MAX_CONCURRENT_POLLS + 1):
+        scheduler._async_record(f"entry{index}", INTERVAL)
+    assert caplog.text.count("polls will be delayed") == 1
+
+    caplog.set_level(logging.INFO)
+    for _ in range(10):
+        for entry_id in ("entry0", "entry1", "entry2"):
+            scheduler._async_record(entry_id, 0)
+    assert "fits its budget again" in caplog.text
+    for remove in removers:
+        remove()
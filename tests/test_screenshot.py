@@ -0,0 +1,191 @@
+"""Tests for the FreeKiosk screenshot cache and MJPEG stream."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from custom_components.freekiosk.api import FreeKioskApiClientCommunicationError
+from custom_components.freekiosk.const import REST_ENDPOINT_SCREENSHOT
+from custom_components.freekiosk.screenshot import (
+    FreeKioskScreenshotCache,
+    FreeKioskScreenshotStream,
+    resize_screenshot,
+)
+
+from . import mock_device
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+    from custom_components.freekiosk.coordinator import (
+        FreeKioskDataUpdateCoordinator,
+    )
+
+JPEG_SIGNATURE = b"\xff\xd8"
+
+
+def _png(width: int = 40, height: int = 30) -> bytes:
+    """Return a PNG screenshot of the given size."""
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), "white").save(output, format="PNG")
+    return output.getvalue()
+
+
+def _mock_screenshot(aioclient_mock: AiohttpClientMocker, **response: object) -> None:
+    """Answer /api/screenshot with ``response``, a PNG by default."""
+    response.setdefault("content", _png())
+    mock_device(aioclient_mock, **{REST_ENDPOINT_SCREENSHOT: response})
+
+
+def _captures(aioclient_mock: AiohttpClientMocker) -> int:
+    """Return how many screenshots were requested from the device."""
+    return sum(
+        url.path == REST_ENDPOINT_SCREENSHOT
+        for _method, url, _data, _headers in aioclient_mock.mock_calls
+    )
+
+
+@pytest.fixture
+def cache(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    coordinator: FreeKioskDataUpdateCoordinator,
+) -> FreeKioskScreenshotCache:
+    """Return a screenshot cache for the mocked device."""
+    del coordinator
+    return FreeKioskScreenshotCache(hass, config_entry)
+
+
+@pytest.fixture
+def stream(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    coordinator: FreeKioskDataUpdateCoordinator,
+) -> FreeKioskScreenshotStream:
+    """Return an MJPEG stream for the mocked device."""
+    del coordinator
+    cache = FreeKioskScreenshotCache(hass, config_entry)
+    return FreeKioskScreenshotStream(hass, config_entry, cache, max_fps=50)
+
+
+def test_resize_keeps_screenshots_that_fit() -> None:
+    """A screenshot within the requested size is returned as it is."""
+    content = _png()
+    assert resize_screenshot(content, 100, 100) is content
+
+
+def test_resize_can_always_encode_jpeg() -> None:
+    """Screenshots for the stream are JPEG encoded even when they fit."""
+    content = resize_screenshot(_png(), None, None, always_jpeg=True)
+    assert content.startswith(JPEG_SIGNATURE)
+    assert resize_screenshot(content, None, None, always_jpeg=True) is content
+
+
+async def test_stream_sends_jpeg_frames(
+    stream: FreeKioskScreenshotStream, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Viewers get JPEG frames, not the PNG the device captured."""
+    _mock_screenshot(aioclient_mock)
+    frames = stream.async_frames()
+    frame = await asyncio.wait_for(anext(frames), 5)
+    assert frame.startswith(JPEG_SIGNATURE)
+    await frames.aclose()
+    await stream.async_stop()
+
+
+async def test_stream_ends_when_stopped(
+    stream: FreeKioskScreenshotStream, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Viewers stop waiting for frames once the producer is stopped."""
+    _mock_screenshot(aioclient_mock)
+    frames = stream.async_frames()
+    await asyncio.wait_for(anext(frames), 5)
+    waiting = asyncio.ensure_future(anext(frames))
+    await asyncio.sleep(0)
+    await stream.async_stop()
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(waiting, 5)
+
+
+async def test_stream_ends_when_producer_fails(
+    stream: FreeKioskScreenshotStream, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A producer that dies ends the stream instead of leaving viewers waiting."""
+    _mock_screenshot(aioclient_mock, exc=RuntimeError("boom"))
+    frames = stream.async_frames()
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(anext(frames), 5)
+
+
+async def test_concurrent_requests_share_one_capture(
+    cache: FreeKioskScreenshotCache, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Callers arriving while a capture is in flight wait for that capture."""
+    _mock_screenshot(aioclient_mock)
+    frames = await asyncio.gather(*(cache.async_get_frame() for _ in range(3)))
+    assert frames[0] is frames[1] is frames[2]
+    assert _captures(aioclient_mock) == 1
+
+
+async def test_frames_are_reused_within_their_age(
+    cache: FreeKioskScreenshotCache, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A fresh frame is served from the cache; an older one is captured again."""
+    _mock_screenshot(aioclient_mock)
+    frame = await cache.async_get_frame()
+    assert await cache.async_get_frame() is frame
+    assert _captures(aioclient_mock) == 1
+
+    recaptured = await cache.async_get_frame(max_age=0)
+    assert recaptured is not frame
+    assert _captures(aioclient_mock) == 2
+    # An identical screenshot keeps the original bytes, so viewers can tell
+    # by identity that nothing changed.
+    assert recaptured.content is frame.content
+
+
+async def test_failed_capture_is_not_cached(
+    cache: FreeKioskScreenshotCache, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A failed capture is raised to every caller and retried next time."""
+    _mock_screenshot(aioclient_mock, exc=FreeKioskApiClientCommunicationError())
+    with pytest.raises(FreeKioskApiClientCommunicationError):
+        await cache.async_get_frame()
+
+    _mock_screenshot(aioclient_mock)
+    assert (await cache.async_get_frame()).content == _png()
+
+
+async def test_resized_images_are_cached_per_size(
+    cache: FreeKioskScreenshotCache, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Each size of a frame is encoded once; the oldest sizes are dropped."""
+    _mock_screenshot(aioclient_mock)
+    assert await cache.async_get_image() == _png()
+
+    with (
+        patch("custom_components.freekiosk.screenshot.SCREENSHOT_RESIZE_CACHE_SIZE", 2),
+        patch(
+            "custom_components.freekiosk.screenshot.resize_screenshot",
+            wraps=resize_screenshot,
+        ) as resize,
+    ):
+        small = await cache.async_get_image(20, 15)
+        assert Image.open(io.BytesIO(small)).size == (20, 15)
+        assert await cache.async_get_image(20, 15) is small
+        assert resize.call_count == 1
+
+        await cache.async_get_image(10)
+        await cache.async_get_image(30)
+        await cache.async_get_image(20, 15)
+        assert resize.call_count == 4
@@ -0,0 +1,179 @@
+"""Tests for the FreeKiosk services."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_API_KEY
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.freekiosk.api import FreeKioskApiClientCommunicationError
+from custom_components.freekiosk.const import CONF_DEVICE_URL, DOMAIN
+from custom_components.freekiosk.services import async_setup_services
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class _FakeCoordinator:
+    """Coordinator stand-in recording the commands it was asked to send."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.commands: list[tuple[str, Any, Any]] = []
+        self.error = error
+        self.release: asyncio.Event | None = None
+
+    async def async_send_command(
+        self, endpoint: str, payload: Any = None, *, optimistic: Any = None
+    ) -> None:
+        self.commands.append((endpoint, payload, optimistic))
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+
+
+def _add_entry(
+    hass: HomeAssistant,
+    name: str,
+    *,
+    error: Exception | None = None,
+    state: ConfigEntryState = ConfigEntryState.LOADED,
+) -> MockConfigEntry:
+    """Add an entry for the device ``name`` with a fake coordinator."""
+    url = f"http://{name}.local:8080"
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=name,
+        unique_id=url,
+        data={CONF_DEVICE_URL: url, CONF_API_KEY: None},
+    )
+    entry.add_to_hass(hass)
+    entry.mock_state(hass, state)
+    entry.runtime_data = SimpleNamespace(coordinator=_FakeCoordinator(error))
+    return entry
+
+
+async def _async_call(
+    hass: HomeAssistant, service: str, **data: Any
+) -> dict[str, dict[str, Any]]:
+    """Call a service and return its per-entry results."""
+    response = await hass.services.async_call(
+        DOMAIN, service, data, blocking=True, return_response=True
+    )
+    assert response is not None
+    return response["results"]
+
+
+@pytest.fixture(autouse=True)
+async def services(hass: HomeAssistant) -> None:
+    """Register the FreeKiosk services."""
+    await async_setup_services(hass)
+
+
+async def test_command_fans_out_to_every_loaded_entry(hass: HomeAssistant) -> None:
+    """``all`` targets every loaded entry; each gets its own result."""
+    entries = [_add_entry(hass, f"kiosk{index}") for index in range(3)]
+    unloaded = _add_entry(hass, "unloaded", state=ConfigEntryState.NOT_LOADED)
+
+    results = await _async_call(hass, "set_brightness", entry_id="all", value=10)
+    assert set(results) == {entry.entry_id for entry in entries}
+    assert all(outcome["success"] for outcome in results.values())
+    for entry in entries:
+        assert entry.runtime_data.coordinator.commands == [
+            (
+                "/api/brightness",
+                {"value": 10},
+                {("screen", "brightness"): 10, ("autoBrightness", "enabled"): False},
+            )
+        ]
+    assert not unloaded.runtime_data.coordinator.commands
+
+
+async def test_targets_by_url_device_and_area(hass: HomeAssistant) -> None:
+    """Device URLs, devices and areas select entries alongside entry ids."""
+    by_id, by_url, by_device, by_area, _other = (
+        _add_entry(hass, name) for name in ("id", "url", "device", "area", "other")
+    )
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=by_device.entry_id, identifiers={(DOMAIN, "device")}
+    )
+    area = ar.async_get(hass).async_create("Hall")
+    device_registry.async_update_device(
+        device_registry.async_get_or_create(
+            config_entry_id=by_area.entry_id, identifiers={(DOMAIN, "area")}
+        ).id,
+        area_id=area.id,
+    )
+
+    results = await _async_call(
+        hass,
+        "reload",
+        entry_id=by_id.entry_id,
+        device_url=f"{by_url.data[CONF_DEVICE_URL]}/",
+        device_id=device.id,
+        area_id=area.id,
+    )
+    assert set(results) == {
+        entry.entry_id for entry in (by_id, by_url, by_device, by_area)
+    }
+
+
+async def test_failures_are_reported_per_entry(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A device failing does not fail the call for the rest of the fleet."""
+    good = _add_entry(hass, "good")
+    bad = _add_entry(hass, "bad", error=FreeKioskApiClientCommunicationError("down"))
+
+    results = await _async_call(hass, "reboot", entry_id="all")
+    assert results[good.entry_id]["success"]
+    assert results[bad.entry_id] == {
+        "success": False,
+        "latency_ms": results[bad.entry_id]["latency_ms"],
+        "error": "down",
+    }
+    assert "failed on 1 of 2 devices" in caplog.text
+
+
+async def test_single_target_failure_raises(hass: HomeAssistant) -> None:
+    """A call aimed at one device fails when that device does."""
+    entry = _add_entry(hass, "bad", error=FreeKioskApiClientCommunicationError("down"))
+    with pytest.raises(HomeAssistantError, match="down"):
+        await _async_call(hass, "reboot", entry_id=entry.entry_id)
+
+
+async def test_unknown_target_raises(hass: HomeAssistant) -> None:
+    """A call that matches no loaded entry is an error."""
+    _add_entry(hass, "unloaded", state=ConfigEntryState.NOT_LOADED)
+    with pytest.raises(HomeAssistantError, match="not available"):
+        await _async_call(hass, "reboot", entry_id="all")
+    with pytest.raises(vol.Invalid):
+        await _async_call(hass, "reboot")
+
+
+async def test_max_concurrency_bounds_commands_in_flight(hass: HomeAssistant) -> None:
+    """No more commands than ``max_concurrency`` are in flight at once."""
+    entries = [_add_entry(hass, f"kiosk{index}") for index in range(5)]
+    release = asyncio.Event()
+    for entry in entries:
+        entry.runtime_data.coordinator.release = release
+
+    call = hass.async_create_task(
+        _async_call(hass, "beep", entry_id="all", max_concurrency=2)
+    )
+    await asyncio.sleep(0)
+    started = [e for e in entries if e.runtime_data.coordinator.commands]
+    assert len(started) == 2
+
+    release.set()
+    assert len(await call) == len(entries)
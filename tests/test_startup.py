@@ -0,0 +1,122 @@
+"""Tests for the fleet-wide first refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMockResponse,
+)
+
+from custom_components.freekiosk.const import REST_ENDPOINT_STATUS
+from custom_components.freekiosk.data import FreeKioskStatus
+from custom_components.freekiosk.startup import FreeKioskStartup, async_get_startup
+
+from . import STATUS, envelope, mock_device
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+    from yarl import URL
+
+    from custom_components.freekiosk.coordinator import (
+        FreeKioskDataUpdateCoordinator,
+    )
+
+
+class _FakeCoordinator:
+    """Coordinator stand-in whose refreshes wait until released."""
+
+    def __init__(self, config_entry: MockConfigEntry) -> None:
+        self.config_entry = config_entry
+        self.refreshes = 0
+        self.release = asyncio.Event()
+
+    async def async_refresh(self) -> None:
+        self.refreshes += 1
+        await self.release.wait()
+
+
+async def test_startup_is_shared(hass: HomeAssistant) -> None:
+    """Every entry boots under the same startup budget."""
+    assert async_get_startup(hass) is async_get_startup(hass)
+
+
+async def test_answering_device_is_set_up_with_its_status(
+    hass: HomeAssistant, coordinator: FreeKioskDataUpdateCoordinator
+) -> None:
+    """A device answering within the budget comes up with its status."""
+    refresh = await FreeKioskStartup(hass).async_first_refresh(coordinator)
+    assert refresh.done()
+    assert coordinator.last_update_success
+    assert coordinator.data.raw["screen"] == STATUS["screen"]
+
+
+async def test_failing_device_is_set_up_unavailable(
+    hass: HomeAssistant,
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """A failing device does not block setup; it comes up unavailable."""
+    mock_device(aioclient_mock, **{REST_ENDPOINT_STATUS: {"exc": TimeoutError()}})
+    await FreeKioskStartup(hass).async_first_refresh(coordinator)
+    assert not coordinator.last_update_success
+    assert coordinator.data == FreeKioskStatus()
+
+
+async def test_slow_device_finishes_in_the_background(
+    hass: HomeAssistant,
+    coordinator: FreeKioskDataUpdateCoordinator,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    """A device answering after the budget ran out recovers on its own."""
+    answer = asyncio.Event()
+
+    async def _slow_status(
+        method: str, url: URL, data: object
+    ) -> AiohttpClientMockResponse:
+        del data
+        await answer.wait()
+        return AiohttpClientMockResponse(method, url, json=envelope(STATUS))
+
+    mock_device(
+        aioclient_mock,
+        **{REST_ENDPOINT_STATUS: {"side_effect": _slow_status}},
+    )
+    with patch("custom_components.freekiosk.startup.STARTUP_BUDGET", 0.01):
+        refresh = await FreeKioskStartup(hass).async_first_refresh(coordinator)
+    assert not refresh.done()
+    assert not coordinator.last_update_success
+
+    answer.set()
+    await refresh
+    assert coordinator.last_update_success
+    assert coordinator.data.raw["screen"] == STATUS["screen"]
+
+
+async def test_refreshes_share_a_concurrency_cap(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> None:
+    """No more refreshes than the cap contact their devices at once."""
+    with patch(
+        "custom_components.freekiosk.startup.STARTUP_MAX_CONCURRENT_REFRESHES", 2
+    ):
+        startup = FreeKioskStartup(hass)
+    coordinators = [_FakeCoordinator(config_entry) for _ in range(3)]
+    refreshes = [startup.async_start_refresh(c) for c in coordinators]
+    await asyncio.sleep(0)
+    assert [c.refreshes for c in coordinators] == [1, 1, 0]
+
+    coordinators[0].release.set()
+    await refreshes[0]
+    await asyncio.sleep(0)
+    assert coordinators[2].refreshes == 1
+
+    for coordinator in coordinators[1:]:
+        coordinator.release.set()
+    await asyncio.gather(*refreshes)
@@ -0,0 +1,87 @@
+"""Tests for the FreeKiosk request and poll statistics."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.freekiosk.api import (
+    FreeKioskApiClient,
+    FreeKioskApiClientAuthenticationError,
+    FreeKioskApiClientCommunicationError,
+)
+from custom_components.freekiosk.const import (
+    REST_ENDPOINT_HEALTH,
+    REST_ENDPOINT_STATUS,
+)
+from custom_components.freekiosk.stats import FreeKioskStats
+
+from . import DEVICE_URL, mock_device
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from pytest_homeassistant_custom_component.test_util.aiohttp import (
+        AiohttpClientMocker,
+    )
+
+STATUS_KEY = f"GET {REST_ENDPOINT_STATUS}"
+
+
+def test_latencies_are_summarised_per_endpoint() -> None:
+    """Percentiles cover the recent requests of each endpoint and overall."""
+    stats = FreeKioskStats()
+    for duration in range(1, 101):
+        stats.record_request(STATUS_KEY, duration / 1000, size=10)
+    stats.record_request("GET /api/health", 1, error="timeout")
+
+    assert stats.requests == 101
+    assert stats.bytes == 1000
+    assert stats.errors == stats.timeouts == 1
+    assert stats.endpoint_p95_ms[STATUS_KEY] == 96.0
+    assert stats.latency_summary["max_ms"] == 1000.0
+    assert stats.as_dict()["endpoints"]["GET /api/health"]["error_types"] == {
+        "timeout": 1
+    }
+
+
+def test_latency_window_is_bounded() -> None:
+    """Only the last ``STATS_WINDOW`` samples are kept; counters keep going."""
+    with patch("custom_components.freekiosk.stats.STATS_WINDOW", 3):
+        stats = FreeKioskStats()
+        for duration in (10, 1, 2, 3):
+            stats.record_request(STATUS_KEY, duration)
+            stats.record_cycle(duration)
+    assert stats.requests == 4
+    assert stats.latency_summary["max_ms"] == 3000.0
+    assert stats.cycle_summary["max_ms"] == 3000.0
+    assert stats.last_cycle_ms == 3000.0
+
+
+async def test_client_records_failures_by_kind(
+    session: ClientSession, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Timeouts, rejected keys and malformed bodies are told apart."""
+    client = FreeKioskApiClient(base_url=DEVICE_URL, session=session)
+    mock_device(
+        aioclient_mock,
+        status={"screen": {"on": True}},
+        **{REST_ENDPOINT_HEALTH: {"exc": TimeoutError()}},
+    )
+    await client.async_get_status()
+    with pytest.raises(FreeKioskApiClientCommunicationError):
+        await client.async_get_health()
+
+    mock_device(aioclient_mock, **{REST_ENDPOINT_STATUS: {"status": 401}})
+    with pytest.raises(FreeKioskApiClientAuthenticationError):
+        await client.async_get_status()
+    mock_device(aioclient_mock, **{REST_ENDPOINT_STATUS: {"text": "{"}})
+    with pytest.raises(FreeKioskApiClientCommunicationError):
+        await client.async_get_status()
+
+    endpoints = client.stats.as_dict()["endpoints"]
+    assert endpoints[STATUS_KEY]["requests"] == 3
+    assert endpoints[STATUS_KEY]["bytes"] > 0
+    assert endpoints[STATUS_KEY]["error_types"] == {"unauthorized": 1, "malformed": 1}
+    assert endpoints[f"GET {REST_ENDPOINT_HEALTH}"]["timeouts"] == 1
@@ -0,0 +1,122 @@
+"""Tests for the persisted FreeKiosk status."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.freekiosk.const import (
+    DOMAIN,
+    STATUS_SAVE_DELAY,
+    STATUS_STORAGE_VERSION,
+)
+from custom_components.freekiosk.store import FreeKioskStatusStore
+
+from . import STATUS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.freekiosk.coordinator import (
+        FreeKioskDataUpdateCoordinator,
+    )
+
+KEY = f"{DOMAIN}.entry"
+SAVED_AT = "2026-01-01T00:00:00+00:00"
+
+
+def _stored(data: Any) -> dict[str, Any]:
+    """Return a storage file holding ``data``."""
+    return {"version": STATUS_STORAGE_VERSION, "key": KEY, "data": data}
+
+
+async def _async_pass_save_delay(hass: HomeAssistant) -> None:
+    """Let a delayed save run."""
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=STATUS_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+
+async def test_load_returns_the_persisted_status(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """A persisted status is restored along with when it was saved."""
+    hass_storage[KEY] = _stored({"saved_at": SAVED_AT, "status": STATUS})
+    store = FreeKioskStatusStore(hass, "entry")
+    assert await store.async_load() == STATUS
+    assert store.saved_at == SAVED_AT
+
+
+@pytest.mark.parametrize("data", [None, [], {"saved_at": SAVED_AT}, {"status": 1}])
+async def test_load_ignores_missing_or_malformed_files(
+    hass: HomeAssistant, hass_storage: dict[str, Any], data: Any
+) -> None:
+    """Without a usable status there is nothing to restore."""
+    if data is not None:
+        hass_storage[KEY] = _stored(data)
+    store = FreeKioskStatusStore(hass, "entry")
+    assert await store.async_load() is None
+    assert store.saved_at is None
+
+
+async def test_saves_are_delayed_and_coalesced(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Only the latest status is written, once the save delay passed."""
+    store = FreeKioskStatusStore(hass, "entry")
+    store.async_save({"screen": {"on": True}})
+    store.async_save(STATUS)
+    await hass.async_block_till_done()
+    assert KEY not in hass_storage
+
+    await _async_pass_save_delay(hass)
+    assert hass_storage[KEY]["data"] == {"saved_at": store.saved_at, "status": STATUS}
+    assert store.saved_at is not None
+
+
+async def test_restored_status_is_not_written_back(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Saving the status that was just loaded does not touch the disk."""
+    hass_storage[KEY] = _stored({"saved_at": SAVED_AT, "status": STATUS})
+    store = FreeKioskStatusStore(hass, "entry")
+    store.async_save(await store.async_load())
+    await _async_pass_save_delay(hass)
+    assert store.saved_at == SAVED_AT
+    assert hass_storage[KEY]["data"]["saved_at"] == SAVED_AT
+
+
+async def test_remove_deletes_the_status(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """A removed entry leaves no status behind."""
+    hass_storage[KEY] = _stored({"saved_at": SAVED_AT, "status": STATUS})
+    store = FreeKioskStatusStore(hass, "entry")
+    await store.async_remove()
+    assert KEY not in hass_storage
+    assert await FreeKioskStatusStore(hass, "entry").async_load() is None
+
+
+async def test_coordinator_persists_polled_status_only(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    coordinator: FreeKioskDataUpdateCoordinator,
+) -> None:
+    """Restored snapshots are never saved; the next polled status is."""
+    store = coordinator.status_store = FreeKioskStatusStore(
+        hass, coordinator.config_entry.entry_id
+    )
+    coordinator.async_set_cached_data({"screen": {"on": False}})
+    coordinator.async_update_listeners()
+    await _async_pass_save_delay(hass)
+    assert store.saved_at is None
+
+    await coordinator.async_refresh()
+    await _async_pass_save_delay(hass)
+    key = f"{DOMAIN}.{coordinator.config_entry.entry_id}"
+    assert hass_storage[key]["data"]["status"] == coordinator.data.raw
@@ -0,0 +1,177 @@
+"""Tests for the FreeKiosk event stream."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.freekiosk.api import (
+    FreeKioskApiClientAuthenticationError,
+    FreeKioskApiClientError,
+    FreeKioskApiClientUnsupportedError,
+)
+from custom_components.freekiosk.const import (
+    STREAM_RECONNECT_MAX,
+    STREAM_RECONNECT_MIN,
+    TRANSPORT_AUTO,
+    TRANSPORT_SSE,
+    TRANSPORT_WEBSOCKET,
+)
+from custom_components.freekiosk.stream import FreeKioskEventStream
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Generator
+
+    from homeassistant.core import HomeAssistant
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+_sleep = asyncio.sleep
+
+
+class _FakeCoordinator:
+    """Coordinator stand-in recording what the stream feeds it."""
+
+    def __init__(self) -> None:
+        self.pushes: list[dict[str, Any]] = []
+        self.connected: list[bool] = []
+        self.refreshes = 0
+
+    def async_apply_push(self, delta: dict[str, Any]) -> None:
+        self.pushes.append(delta)
+
+    def async_set_stream_connected(self, *, connected: bool) -> None:
+        self.connected.append(connected)
+
+    async def async_request_refresh(self) -> None:
+        self.refreshes += 1
+
+
+class _FakeClient:
+    """
+    Client stand-in playing one scripted connection per attempt.
+
+    Each script entry is an exception raised before connecting or a list of
+    events yielded after connecting, after which the connection drops. Once
+    the script runs out, connections fail authentication and end the stream.
+    """
+
+    def __init__(self, *script: BaseException | list[tuple[str | None, Any]]) -> None:
+        self.script = list(script)
+        self.attempts: list[tuple[str, str | None]] = []
+
+    async def async_stream_events(
+        self,
+        transport: str,
+        last_event_id: str | None = None,
+        on_connect: Callable[[], None] | None = None,
+    ) -> AsyncIterator[tuple[str | None, dict[str, Any]]]:
+        self.attempts.append((transport, last_event_id))
+        if not self.script:
+            raise FreeKioskApiClientAuthenticationError
+        if isinstance(attempt := self.script.pop(0), BaseException):
+            raise attempt
+        assert on_connect is not None
+        on_connect()
+        for event in attempt:
+            yield event
+        raise FreeKioskApiClientError
+
+
+@pytest.fixture
+def delays() -> Generator[list[float]]:
+    """Record reconnect delays without waiting for them."""
+    recorded: list[float] = []
+
+    async def _sleep_briefly(delay: float) -> None:
+        # Home Assistant yields with sleep(0) too; only the stream waits longer.
+        if delay:
+            recorded.append(delay)
+        await _sleep(0)
+
+    with (
+        patch("custom_components.freekiosk.stream.random.uniform", return_value=1),
+        patch("custom_components.freekiosk.stream.asyncio.sleep", _sleep_briefly),
+    ):
+        yield recorded
+
+
+async def _async_run(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    transport: str,
+    client: _FakeClient,
+) -> _FakeCoordinator:
+    """Run a stream until its client script is used up."""
+    coordinator = _FakeCoordinator()
+    entry.runtime_data = SimpleNamespace(coordinator=coordinator, client=client)
+    stream = FreeKioskEventStream(hass, entry, transport)
+    stream.async_start()
+    await asyncio.wait_for(stream._task, 5)
+    await stream.async_stop()
+    await hass.async_block_till_done()
+    return coordinator
+
+
+async def test_auto_falls_back_to_sse(
+    hass: HomeAssistant, config_entry: MockConfigEntry, delays: list[float]
+) -> None:
+    """Without a WebSocket the stream uses SSE and never retries the WebSocket."""
+    client = _FakeClient(
+        FreeKioskApiClientUnsupportedError(), [("1", {"audio": {"volume": 5}})]
+    )
+    coordinator = await _async_run(hass, config_entry, TRANSPORT_AUTO, client)
+    assert [transport for transport, _ in client.attempts] == [
+        TRANSPORT_WEBSOCKET,
+        TRANSPORT_SSE,
+        TRANSPORT_SSE,
+    ]
+    assert coordinator.pushes == [{"audio": {"volume": 5}}]
+    assert delays == [STREAM_RECONNECT_MIN]
+
+
+async def test_reconnect_resumes_after_the_last_event(
+    hass: HomeAssistant, config_entry: MockConfigEntry, delays: list[float]
+) -> None:
+    """A reconnect resumes after the last event id and resyncs once connected."""
+    del delays
+    client = _FakeClient(
+        [("1", {"screen": {"on": True}}), (None, {}), ("2", {"screen": {"on": False}})],
+        [("3", {"screen": {"on": True}})],
+    )
+    coordinator = await _async_run(hass, config_entry, TRANSPORT_SSE, client)
+    assert [last_event_id for _, last_event_id in client.attempts] == [None, "2", "3"]
+    assert len(coordinator.pushes) == 4
+    assert coordinator.connected == [True, False, True, False]
+    assert coordinator.refreshes == 2
+
+
+async def test_reconnect_backs_off_until_connected(
+    hass: HomeAssistant, config_entry: MockConfigEntry, delays: list[float]
+) -> None:
+    """Failed attempts double the delay up to a cap; a connection resets it."""
+    failures = [FreeKioskApiClientError()] * 8
+    client = _FakeClient(*failures, [], FreeKioskApiClientError())
+    coordinator = await _async_run(hass, config_entry, TRANSPORT_WEBSOCKET, client)
+    expected = [
+        min(STREAM_RECONNECT_MIN * 2**attempt, STREAM_RECONNECT_MAX)
+        for attempt in range(len(failures))
+    ]
+    assert delays == [*expected, STREAM_RECONNECT_MIN, STREAM_RECONNECT_MIN * 2]
+    assert coordinator.connected == [True, False]
+
+
+async def test_device_without_streams_stays_on_polling(
+    hass: HomeAssistant, config_entry: MockConfigEntry, delays: list[float]
+) -> None:
+    """A device offering no stream ends the task without reconnecting."""
+    client = _FakeClient(
+        FreeKioskApiClientUnsupportedError(), FreeKioskApiClientUnsupportedError()
+    )
+    coordinator = await _async_run(hass, config_entry, TRANSPORT_AUTO, client)
+    assert len(client.attempts) == 2
+    assert not coordinator.connected
+    assert not delays